@@ -23,6 +23,13 @@ import (
 	"github.com/jonahgcarpenter/oswald-ai/internal/tools/builtin/usermemory"
 )
 
+// modelInfoResolveTimeout bounds the startup model-metadata lookup; on timeout
+// the resolver falls back to env overrides and package defaults.
+const modelInfoResolveTimeout = 15 * time.Second
+
+// mcpWarmTimeout bounds background connection of global MCP servers at startup.
+const mcpWarmTimeout = 30 * time.Second
+
 func main() {
 	// Load config
 	cfg := config.Load()
@@ -51,21 +58,20 @@ func main() {
 
 	llmClient := llm.NewGatewayClient(cfg.LLMGatewayURL, cfg.LLMGatewayAPIKey, cfg.LLMGatewayVirtualKey, llmHTTPTimeout, rootLog)
 
-	details, budgetErr := modelinfo.Resolve(context.Background(), cfg, rootLog)
-	budget := promptbudget.FromModelDetails(details)
-	if budgetErr != nil {
-		log.Warn("app.context_budget.resolve_failed", "failed to discover context budget",
-			config.F("model", cfg.LLMGatewayModel),
-			config.ErrorField(budgetErr),
-		)
+	// Model metadata comes from a remote catalog; resolve it while the local
+	// stores initialize so a slow lookup overlaps startup instead of preceding
+	// it, and bound it so a stalled catalog cannot hold the process hostage.
+	type modelDetailsResult struct {
+		details modelinfo.Details
+		err     error
 	}
-	log.Info("app.context_budget.resolved", "resolved context budget",
-		config.F("model", cfg.LLMGatewayModel),
-		config.F("provider", details.Provider),
-		config.F("context_window", budget.ContextWindow),
-		config.F("prompt_budget", budget.PromptBudget()),
-		config.F("source", budget.Source),
-	)
+	modelDetailsCh := make(chan modelDetailsResult, 1)
+	go func() {
+		ctx, cancel := context.WithTimeout(context.Background(), modelInfoResolveTimeout)
+		defer cancel()
+		details, err := modelinfo.Resolve(ctx, cfg, rootLog)
+		modelDetailsCh <- modelDetailsResult{details: details, err: err}
+	}()
 
 	// The soul store is shared between the tool registry (so the agent can edit
 	// its soul via the soul.* tools) and the agent itself (so it can read
@@ -92,7 +98,16 @@ func main() {
 		log.Fatal("app.mcp.init_failed", "failed to initialize MCP config store", config.ErrorField(err))
 	}
 	defer mcpStore.Close() // nolint:errcheck
+	accountLinkService.SetMCPServerDeleter(mcpStore.DeleteForOwner)
 	mcpManager := mcp.NewManagerFromStore(mcpStore, rootLog)
+	// Connect global MCP servers in the background, bounded by mcpWarmTimeout,
+	// so the first request usually finds their sessions ready. Startup never
+	// waits on this; a server still connecting is finished on first use.
+	go func() {
+		ctx, cancel := context.WithTimeout(context.Background(), mcpWarmTimeout)
+		defer cancel()
+		mcpManager.Warm(ctx)
+	}()
 	mcpProvider := mcp.NewProvider(mcpManager)
 	commandService, err := commandbuiltin.NewService(accountLinkService, commandbuiltin.MCPDeps{Store: mcpStore, Manager: mcpManager})
 	if err != nil {
@@ -123,6 +138,23 @@ func main() {
 		log.Fatal("app.gateways.init_failed", "failed to initialize gateways", config.ErrorField(err))
 	}
 
+	resolved := <-modelDetailsCh
+	details, budgetErr := resolved.details, resolved.err
+	budget := promptbudget.FromModelDetails(details)
+	if budgetErr != nil {
+		log.Warn("app.context_budget.resolve_failed", "failed to discover context budget",
+			config.F("model", cfg.LLMGatewayModel),
+			config.ErrorField(budgetErr),
+		)
+	}
+	log.Info("app.context_budget.resolved", "resolved context budget",
+		config.F("model", cfg.LLMGatewayModel),
+		config.F("provider", details.Provider),
+		config.F("context_window", budget.ContextWindow),
+		config.F("prompt_budget", budget.PromptBudget()),
+		config.F("source", budget.Source),
+	)
+
 	agentEngine := agent.NewAgent(
 		llmClient,
 		toolRegistry,
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"math"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
@@ -30,6 +31,10 @@ const (
 	maxImageModelAttempts    = 5
 	imageRetryScale          = 0.75
 	imageInitialScaleMaxEdge = 1920
+
+	// recentToolResultsKept is how many of the latest tool results are never
+	// compacted when a long tool loop outgrows the prompt budget.
+	recentToolResultsKept = 4
 )
 
 // StreamChunkType identifies the kind of content in a StreamChunk.
@@ -244,6 +249,7 @@ type MCPProvider interface {
 	ResolveTools(ctx context.Context, userID string, names []string) []string
 	LLMTools(ctx context.Context, userID string, exposed map[string]bool) []llm.Tool
 	Execute(ctx context.Context, userID, name string, args map[string]interface{}, exposed map[string]bool) (string, bool, error)
+	ReadOnlyTool(ctx context.Context, userID, name string, exposed map[string]bool) bool
 }
 
 // NewAgent initializes the Agent with an LLM chat client, tool registry, model name,
@@ -365,15 +371,132 @@ func (a *Agent) toolsForRequest(ctx context.Context, senderID string, exposure *
 	return tools
 }
 
-func (a *Agent) executeTool(ctx context.Context, senderID string, name string, args map[string]interface{}, exposure *toolruntime.Exposure) (string, error) {
+// executeTool runs a builtin or exposed MCP tool. exposed is a snapshot of
+// the request's exposed MCP tools, so prefetched calls never read exposure
+// state while the sequential loop is updating it.
+func (a *Agent) executeTool(ctx context.Context, senderID string, name string, args map[string]interface{}, exposed map[string]bool) (string, error) {
 	if a.mcpProvider != nil {
-		if result, handled, err := a.mcpProvider.Execute(ctx, senderID, name, args, exposure.ExposedMCPTools()); handled {
+		if result, handled, err := a.mcpProvider.Execute(ctx, senderID, name, args, exposed); handled {
 			return result, err
 		}
 	}
 	return a.registry.Execute(ctx, name, args)
 }
 
+// dropSeenSearchResults removes web.search results whose URL was already
+// returned earlier in the request and records the remaining URLs as seen.
+// Overlapping searches commonly share sources, and repeating them only adds
+// prompt tokens for the next model call.
+func dropSeenSearchResults(result string, seen map[string]struct{}) string {
+	results := websearch.ParseFormattedResults(result)
+	if len(results) == 0 {
+		return result
+	}
+
+	fresh := results[:0]
+	for _, r := range results {
+		if _, ok := seen[r.URL]; ok {
+			continue
+		}
+		seen[r.URL] = struct{}{}
+		fresh = append(fresh, r)
+	}
+	if len(fresh) == len(results) {
+		return result
+	}
+	if len(fresh) == 0 {
+		return "No new results; every result was already returned by an earlier search."
+	}
+	return websearch.FormatResults(fresh)
+}
+
+// prefetchedToolResult holds the outcome of a tool call started before the
+// sequential result loop reaches it.
+type prefetchedToolResult struct {
+	done     chan struct{}
+	result   string
+	err      error
+	duration time.Duration
+}
+
+// wait blocks until the prefetched call finishes and returns its outcome.
+func (p *prefetchedToolResult) wait() (string, time.Duration, error) {
+	<-p.done
+	return p.result, p.duration, p.err
+}
+
+// independentTools read no local state, so they can run alongside any other
+// call in the same turn.
+var independentTools = map[string]bool{
+	"web.search":   true,
+	"time.current": true,
+}
+
+// readOnlyTools read local state without writing to it. They may overlap
+// each other but must not run ahead of a write issued earlier in the same
+// turn. Exposed MCP tools their server annotates as read-only are treated the
+// same way. memory.search and memory.list are absent on purpose: they expire
+// old memories and record retrievals, so they run in the sequential loop.
+var readOnlyTools = map[string]bool{
+	"soul.read": true,
+}
+
+// prefetchToolCalls concurrently starts the calls of a turn that do not write
+// local state when the model issues more than one. Running them together
+// costs the slowest call rather than the sum of all of them; the results are still
+// consumed in call order. Writes and MCP tools without a read-only
+// annotation are left to the sequential loop, and a read-only call is not
+// started early once a write precedes it. Returns nil when there is nothing
+// to overlap.
+func (a *Agent) prefetchToolCalls(ctx context.Context, senderID string, calls []llm.ToolCall, exposure *toolruntime.Exposure) map[int]*prefetchedToolResult {
+	if len(calls) < 2 {
+		return nil
+	}
+	exposed := exposure.ExposedMCPTools()
+	var indexes []int
+	writeSeen := false
+	for i, tc := range calls {
+		name := tc.Function.Name
+		if independentTools[name] {
+			indexes = append(indexes, i)
+			continue
+		}
+		if !a.readOnlyTool(ctx, senderID, name, exposed) {
+			writeSeen = true
+		} else if !writeSeen {
+			indexes = append(indexes, i)
+		}
+	}
+	if len(indexes) < 2 {
+		return nil
+	}
+
+	prefetched := make(map[int]*prefetchedToolResult, len(indexes))
+	for _, i := range indexes {
+		p := &prefetchedToolResult{done: make(chan struct{})}
+		prefetched[i] = p
+		go func(name string, args map[string]interface{}) {
+			defer close(p.done)
+			startedAt := time.Now()
+			p.result, p.err = a.executeTool(ctx, senderID, name, args, exposed)
+			p.duration = time.Since(startedAt)
+		}(calls[i].Function.Name, calls[i].Function.Arguments)
+	}
+	return prefetched
+}
+
+// readOnlyTool reports whether a call only reads state: a builtin listed in
+// readOnlyTools, or an exposed MCP tool annotated read-only by its server.
+func (a *Agent) readOnlyTool(ctx context.Context, senderID, name string, exposed map[string]bool) bool {
+	if readOnlyTools[name] {
+		return true
+	}
+	if a.mcpProvider == nil || a.registry.HasHandler(name) {
+		return false
+	}
+	return a.mcpProvider.ReadOnlyTool(ctx, senderID, name, exposed)
+}
+
 func (a *Agent) chatWithImageRetries(ctx context.Context, req llm.ChatRequest, callback func(llm.ChatMessage), log *config.Logger) (*llm.ChatResponse, error, bool) {
 	originalMessages := req.Messages
 	imageCount := 0
@@ -472,9 +595,47 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 	toolExposure := toolruntime.NewExposure()
 	ctx = requestctx.WithToolExposer(ctx, toolExposure)
 
-	// Read the soul file fresh on every request so that any edits the agent
-	// made via the soul.* tools take effect immediately.
-	soulContent, soulErr := a.soul.Read()
+	semanticQueryText, _ := stripReplyContext(userPrompt)
+	if semanticQueryText == "" {
+		semanticQueryText = userPrompt
+	}
+
+	// The soul file, speaker intro, system rules, and session context are
+	// independent reads. Load them concurrently so their file and database
+	// I/O overlaps instead of adding up ahead of the first model call.
+	var (
+		soulContent    string
+		soulErr        error
+		speakerLine    string
+		memorySections []string
+		memoryContext  usermemory.RetrievedContext
+		memoryErr      error
+		wg             sync.WaitGroup
+	)
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		// Read the soul file fresh on every request so that any edits the agent
+		// made via the soul.* tools take effect immediately.
+		soulContent, soulErr = a.soul.Read()
+	}()
+	go func() {
+		defer wg.Done()
+		speakerLine = a.currentSpeakerLine(reqLog, senderID)
+		memorySections = a.userMemoryPromptSections(reqLog, senderID)
+	}()
+	if a.userMemory != nil {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			memoryContext, memoryErr = a.userMemory.BuildContext(ctx, senderID, sessionKey, semanticQueryText, usermemory.ContextOptions{
+				RecentTurns:        memoryRecentTurns,
+				ContextBudgetChars: int(float64(a.budget.PromptBudget()*4) * memoryContextBudgetRatio),
+			})
+		}()
+	}
+	wg.Wait()
+
 	if soulErr != nil {
 		reqLog.Warn("agent.soul.read_failed", "failed to read soul file", config.ErrorField(soulErr))
 	}
@@ -482,33 +643,27 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 	// Build the dynamic system prompt from soul and speaker identity.
 	// Only system_rules memory is injected automatically here; relevant user and
 	// session memories are added below as a structured retrieved-memory block.
+	// Sections are ordered from most to least shared (soul, gateway, speaker,
+	// per-user memory) so the inference server's prefix cache can reuse the
+	// longest possible common prefix across users and turns.
 	var promptParts []string
 	promptParts = append(promptParts, soulContent)
 
-	speakerLine := a.currentSpeakerLine(reqLog, senderID)
-	if speakerLine != "" {
-		promptParts = append(promptParts, "# Current Speaker\n"+speakerLine)
-	}
 	if gatewayPrompt := gatewaySystemPrompt(gateway); gatewayPrompt != "" {
 		promptParts = append(promptParts, gatewayPrompt)
 	}
+	if speakerLine != "" {
+		promptParts = append(promptParts, "# Current Speaker\n"+speakerLine)
+	}
 	requestUser := providerUserValue(firstNonEmpty(speakerLine, displayName, senderID))
-	promptParts = append(promptParts, a.userMemoryPromptSections(reqLog, senderID)...)
+	promptParts = append(promptParts, memorySections...)
 
 	dynamicSystemPrompt := strings.Join(promptParts, "\n\n")
 
-	semanticQueryText, _ := stripReplyContext(userPrompt)
-	if semanticQueryText == "" {
-		semanticQueryText = userPrompt
-	}
 	var recentToolNames []string
 	if a.userMemory != nil {
-		memoryContext, err := a.userMemory.BuildContext(ctx, senderID, sessionKey, semanticQueryText, usermemory.ContextOptions{
-			RecentTurns:        memoryRecentTurns,
-			ContextBudgetChars: int(float64(a.budget.PromptBudget()*4) * memoryContextBudgetRatio),
-		})
-		if err != nil {
-			reqLog.Warn("agent.memory.context.failed", "failed to build retrieved memory context", config.F("status", "degraded"), config.ErrorField(err))
+		if memoryErr != nil {
+			reqLog.Warn("agent.memory.context.failed", "failed to build retrieved memory context", config.F("status", "degraded"), config.ErrorField(memoryErr))
 		} else if strings.TrimSpace(memoryContext.Block) != "" {
 			dynamicSystemPrompt += "\n\n" + memoryContext.Block
 			recentToolNames = memoryContext.RecentToolNames
@@ -528,9 +683,12 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 	}
 
 	initialTools := a.toolsForRequest(ctx, senderID, toolExposure)
+	// Nothing is compacted between the two estimates, so estimate once rather
+	// than re-encoding every tool schema a second time.
+	estimatedTokens := promptbudget.EstimateTokens(dynamicSystemPrompt, nil, userPrompt, len(userImages), initialTools)
 	prune := promptbudget.Result{
-		EstimatedBefore: promptbudget.EstimateTokens(dynamicSystemPrompt, nil, userPrompt, len(userImages), initialTools),
-		EstimatedAfter:  promptbudget.EstimateTokens(dynamicSystemPrompt, nil, userPrompt, len(userImages), initialTools),
+		EstimatedBefore: estimatedTokens,
+		EstimatedAfter:  estimatedTokens,
 	}
 
 	messages := make([]llm.ChatMessage, 0, 2)
@@ -566,6 +724,10 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 	// show what tools were called without ballooning history size.
 	var toolAnnotations []string
 
+	// seenSearchURLs records every web.search result URL already returned in
+	// this request so later searches only add new sources to the context.
+	seenSearchURLs := make(map[string]struct{})
+
 	// Build the streaming callback that routes thinking vs content chunks.
 	// Tool-call iterations are streamed too — the model may reason aloud before
 	// deciding to call a tool. The stream pauses naturally while tools execute.
@@ -598,6 +760,16 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 
 		req.Messages = messages
 		req.Tools = a.toolsForRequest(ctx, senderID, toolExposure)
+		if iteration > 1 {
+			if compacted := promptbudget.CompactToolResults(messages, req.Tools, a.budget.PromptBudget(), recentToolResultsKept); compacted.EstimatedAfter < compacted.EstimatedBefore {
+				reqLog.Debug("agent.context.compacted", "compacted earlier tool results to fit prompt budget",
+					config.F("iteration", iteration),
+					config.F("estimated_before", compacted.EstimatedBefore),
+					config.F("estimated_after", compacted.EstimatedAfter),
+					config.F("prompt_budget", a.budget.PromptBudget()),
+				)
+			}
+		}
 		reqLog.Debug("agent.model.call", "calling model",
 			config.F("iteration", iteration),
 			config.F("is_streaming", req.Stream),
@@ -681,8 +853,10 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 
 		// Execute each tool call and inject the results as tool response messages.
 		// NOTE: Most models only emit one tool call at a time, but we handle
-		// multiple to be safe.
-		for _, tc := range resp.Message.ToolCalls {
+		// multiple to be safe. Side-effect-free calls in the same turn are
+		// started together up front and collected here in order.
+		prefetched := a.prefetchToolCalls(ctx, senderID, resp.Message.ToolCalls, toolExposure)
+		for callIndex, tc := range resp.Message.ToolCalls {
 			toolName := tc.Function.Name
 			toolCallID := tc.ID
 			if toolCallID == "" {
@@ -701,7 +875,15 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 
 			var toolContent string
 
-			result, execErr := a.executeTool(ctx, senderID, toolName, tc.Function.Arguments, toolExposure)
+			var result string
+			var execErr error
+			if p, ok := prefetched[callIndex]; ok {
+				var duration time.Duration
+				result, duration, execErr = p.wait()
+				toolStartedAt = time.Now().Add(-duration)
+			} else {
+				result, execErr = a.executeTool(ctx, senderID, toolName, tc.Function.Arguments, toolExposure.ExposedMCPTools())
+			}
 			if execErr != nil {
 				// Fail gracefully: inject the error so the model can recover.
 				consecutiveToolFailures++
@@ -718,6 +900,9 @@ func (a *Agent) Process(requestID string, gateway string, sessionKey string, sen
 			} else {
 				consecutiveToolFailures = 0
 				toolContent = result
+				if toolName == "web.search" {
+					toolContent = dropSeenSearchResults(result, seenSearchURLs)
+				}
 				reqLog.Debug("agent.tool.success", "tool execution succeeded",
 					config.F("iteration", iteration),
 					config.F("tool_name", toolName),
@@ -20,7 +20,9 @@ import (
 	"github.com/jonahgcarpenter/oswald-ai/internal/requestctx"
 	"github.com/jonahgcarpenter/oswald-ai/internal/tools/builtin/soul"
 	"github.com/jonahgcarpenter/oswald-ai/internal/tools/builtin/usermemory"
+	"github.com/jonahgcarpenter/oswald-ai/internal/tools/builtin/websearch"
 	"github.com/jonahgcarpenter/oswald-ai/internal/tools/registry"
+	toolruntime "github.com/jonahgcarpenter/oswald-ai/internal/tools/runtime"
 )
 
 func TestProcessFinalAnswerPersistsCleanedSessionMemory(t *testing.T) {
@@ -113,6 +115,113 @@ func TestProcessExecutesToolThenFinalAnswerAndStreamsEvents(t *testing.T) {
 	}
 }
 
+func TestPrefetchToolCallsRunsSearchCallsConcurrently(t *testing.T) {
+	reg := registry.New(config.NewLogger(config.LevelError))
+	started := make(chan string, 2)
+	release := make(chan struct{})
+	if err := reg.RegisterTool(registry.Spec{Name: "web.search", Description: "Search", Parameters: []registry.ParamSpec{{Name: "query", Type: "string", Required: true}}}, func(_ context.Context, args map[string]interface{}) (string, error) {
+		query, _ := args["query"].(string)
+		started <- query
+		<-release
+		return "results for " + query, nil
+	}); err != nil {
+		t.Fatalf("register tool: %v", err)
+	}
+	agent := &Agent{registry: reg}
+
+	calls := []llm.ToolCall{
+		{Function: llm.ToolFunction{Name: "web.search", Arguments: map[string]interface{}{"query": "first"}}},
+		{Function: llm.ToolFunction{Name: "test.lookup", Arguments: map[string]interface{}{}}},
+		{Function: llm.ToolFunction{Name: "web.search", Arguments: map[string]interface{}{"query": "second"}}},
+	}
+	prefetched := agent.prefetchToolCalls(context.Background(), "user-1", calls, nil)
+	if len(prefetched) != 2 || prefetched[1] != nil {
+		t.Fatalf("prefetched = %+v, want search calls 0 and 2 only", prefetched)
+	}
+	for i := 0; i < 2; i++ {
+		select {
+		case <-started:
+		case <-time.After(time.Second):
+			t.Fatal("searches did not start concurrently")
+		}
+	}
+	close(release)
+
+	for index, want := range map[int]string{0: "results for first", 2: "results for second"} {
+		result, _, err := prefetched[index].wait()
+		if err != nil || result != want {
+			t.Fatalf("prefetched[%d] = %q, %v; want %q", index, result, err, want)
+		}
+	}
+
+	if single := agent.prefetchToolCalls(context.Background(), "user-1", calls[:2], nil); single != nil {
+		t.Fatalf("single search was prefetched: %+v", single)
+	}
+}
+
+func TestPrefetchToolCallsKeepsReadsBehindEarlierWrites(t *testing.T) {
+	agent := &Agent{registry: registry.New(config.NewLogger(config.LevelError))}
+	calls := []llm.ToolCall{
+		{Function: llm.ToolFunction{Name: "soul.read", Arguments: map[string]interface{}{}}},
+		{Function: llm.ToolFunction{Name: "memory.save", Arguments: map[string]interface{}{}}},
+		{Function: llm.ToolFunction{Name: "soul.read", Arguments: map[string]interface{}{}}},
+		{Function: llm.ToolFunction{Name: "memory.search", Arguments: map[string]interface{}{}}},
+		{Function: llm.ToolFunction{Name: "time.current", Arguments: map[string]interface{}{}}},
+	}
+	prefetched := agent.prefetchToolCalls(context.Background(), "user-1", calls, nil)
+	if len(prefetched) != 2 || prefetched[0] == nil || prefetched[4] == nil {
+		t.Fatalf("prefetched = %+v, want calls 0 and 4 only", prefetched)
+	}
+	for _, p := range prefetched {
+		p.wait()
+	}
+}
+
+func TestPrefetchToolCallsIncludesExposedReadOnlyMCPTools(t *testing.T) {
+	agent := &Agent{registry: registry.New(config.NewLogger(config.LevelError)), mcpProvider: &fakeMCPProvider{}}
+	exposure := toolruntime.NewExposure()
+	exposure.ExposeTools([]string{"home.status", "home.turn_on"})
+	calls := []llm.ToolCall{
+		{Function: llm.ToolFunction{Name: "home.status", Arguments: map[string]interface{}{"room": "office"}}},
+		{Function: llm.ToolFunction{Name: "home.status", Arguments: map[string]interface{}{"room": "kitchen"}}},
+		{Function: llm.ToolFunction{Name: "home.turn_on", Arguments: map[string]interface{}{}}},
+	}
+	prefetched := agent.prefetchToolCalls(context.Background(), "user-1", calls, exposure)
+	if len(prefetched) != 2 || prefetched[0] == nil || prefetched[1] == nil {
+		t.Fatalf("prefetched = %+v, want read-only MCP calls 0 and 1 only", prefetched)
+	}
+	for _, p := range prefetched {
+		p.wait()
+	}
+}
+
+func TestDropSeenSearchResultsKeepsOnlyNewURLs(t *testing.T) {
+	seen := make(map[string]struct{})
+	first := websearch.FormatResults([]websearch.SearchResult{
+		{Title: "A", URL: "https://example.com/a", Content: "a"},
+		{Title: "B", URL: "https://example.com/b", Content: "b"},
+	})
+	if got := dropSeenSearchResults(first, seen); got != first {
+		t.Fatalf("first search was rewritten: %q", got)
+	}
+
+	second := websearch.FormatResults([]websearch.SearchResult{
+		{Title: "B again", URL: "https://example.com/b", Content: "b"},
+		{Title: "C", URL: "https://example.com/c", Content: "c"},
+	})
+	got := websearch.ParseFormattedResults(dropSeenSearchResults(second, seen))
+	if len(got) != 1 || got[0].URL != "https://example.com/c" {
+		t.Fatalf("second search results = %+v, want only the new URL", got)
+	}
+
+	if got := dropSeenSearchResults(second, seen); !strings.Contains(got, "No new results") {
+		t.Fatalf("repeated search = %q, want no-new-results notice", got)
+	}
+	if got := dropSeenSearchResults("No results found.", seen); got != "No results found." {
+		t.Fatalf("empty search was rewritten: %q", got)
+	}
+}
+
 func TestProcessDisablesToolsAfterFailureBudget(t *testing.T) {
 	chat := &fakeChatter{responses: []*llm.ChatResponse{
 		{Model: "test-model", Message: llm.ChatMessage{Role: "assistant", ToolCalls: []llm.ToolCall{{ID: "call-1", Function: llm.ToolFunction{Name: "test.fail"}}}}},
@@ -490,6 +599,26 @@ func TestProcessSendsStrippedSpeakerIntroAsProviderUser(t *testing.T) {
 	}
 }
 
+func TestProcessOrdersSharedSystemPromptSectionsFirst(t *testing.T) {
+	chat := &fakeChatter{responses: []*llm.ChatResponse{{Model: "test-model", Message: llm.ChatMessage{Role: "assistant", Content: "ok"}}}}
+	agent, store := newTestAgent(t, chat, nil, nil)
+	if err := store.SyncSpeakerIntro("user-1", "You are speaking with Example User."); err != nil {
+		t.Fatalf("sync speaker intro: %v", err)
+	}
+
+	if _, err := agent.Process("req-1", "imessage", "session-1", "user-1", "Display", "question", nil, nil); err != nil {
+		t.Fatalf("process: %v", err)
+	}
+
+	system := primaryRequests(chat.requests)[0].Messages[0].Content
+	soulIndex := strings.Index(system, "You are Oswald.")
+	gatewayIndex := strings.Index(system, "# Gateway Instructions")
+	speakerIndex := strings.Index(system, "# Current Speaker")
+	if soulIndex != 0 || gatewayIndex < soulIndex || speakerIndex < gatewayIndex {
+		t.Fatalf("system prompt sections out of order (soul %d, gateway %d, speaker %d):\n%s", soulIndex, gatewayIndex, speakerIndex, system)
+	}
+}
+
 func TestSessionMemoryUserContentReplyOnly(t *testing.T) {
 	got := sessionMemoryUserContent("[Replying to Alice: \"old\"]", 0)
 	if got != "[User replied to a prior message]" {
@@ -697,6 +826,10 @@ func (p *fakeMCPProvider) Execute(ctx context.Context, userID, name string, args
 	return "", false, nil
 }
 
+func (p *fakeMCPProvider) ReadOnlyTool(ctx context.Context, userID, name string, exposed map[string]bool) bool {
+	return name == "home.status" && exposed[name]
+}
+
 func (f *fakeEmbedder) Embed(_ context.Context, req llm.EmbedRequest) (*llm.EmbedResponse, error) {
 	f.inputs = append(f.inputs, req.Input)
 	if len(f.vectors) == 0 {
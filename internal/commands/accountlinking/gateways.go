@@ -37,7 +37,16 @@ var SupportedGateways = []GatewayOption{
 	},
 }
 
-var discordMentionRE = regexp.MustCompile(`<@!?(\d+)>`)
+var (
+	discordMentionRE = regexp.MustCompile(`<@!?(\d+)>`)
+	discordIDRE      = regexp.MustCompile(`^\d+$`)
+	e164PhoneRE      = regexp.MustCompile(`^\+[0-9]{7,15}$`)
+	localPhoneRE     = regexp.MustCompile(`^[0-9]{7,15}$`)
+
+	// phoneSeparatorStripper removes common phone punctuation in one pass and
+	// returns the input unchanged, without allocating, when none is present.
+	phoneSeparatorStripper = strings.NewReplacer(" ", "", "-", "", "(", "", ")", "")
+)
 
 // GatewayOptionByIndex returns the 1-based indexed gateway option.
 func GatewayOptionByIndex(index int) (GatewayOption, bool) {
@@ -72,7 +81,7 @@ func NormalizeIdentifier(gateway, identifier string) (string, error) {
 			identifier = match[1]
 		}
 		identifier = strings.TrimSpace(identifier)
-		if identifier == "" || !regexp.MustCompile(`^\d+$`).MatchString(identifier) {
+		if identifier == "" || !discordIDRE.MatchString(identifier) {
 			return "", fmt.Errorf("Discord identifiers must be numeric user IDs")
 		}
 		return identifier, nil
@@ -91,20 +100,17 @@ func NormalizeIdentifier(gateway, identifier string) (string, error) {
 			}
 			return email, nil
 		}
-		identifier = strings.ReplaceAll(identifier, " ", "")
-		identifier = strings.ReplaceAll(identifier, "-", "")
-		identifier = strings.ReplaceAll(identifier, "(", "")
-		identifier = strings.ReplaceAll(identifier, ")", "")
+		identifier = phoneSeparatorStripper.Replace(identifier)
 		if strings.HasPrefix(identifier, "00") {
 			identifier = "+" + strings.TrimPrefix(identifier, "00")
 		}
 		if strings.HasPrefix(identifier, "+") {
-			if !regexp.MustCompile(`^\+[0-9]{7,15}$`).MatchString(identifier) {
+			if !e164PhoneRE.MatchString(identifier) {
 				return "", fmt.Errorf("iMessage phone numbers must look like +15551234567")
 			}
 			return identifier, nil
 		}
-		if !regexp.MustCompile(`^[0-9]{7,15}$`).MatchString(identifier) {
+		if !localPhoneRE.MatchString(identifier) {
 			return "", fmt.Errorf("iMessage phone numbers must contain only digits, optionally with a leading +")
 		}
 		return "+" + identifier, nil
@@ -1,6 +1,7 @@
 package accountlinking
 
 import (
+	"context"
 	"crypto/rand"
 	"encoding/hex"
 	"fmt"
@@ -25,8 +26,19 @@ type Service struct {
 	mu         sync.Mutex
 	initOnce   sync.Once
 	initErr    error
+	users      map[string]cachedUser
+
+	// deleteMCPServers removes a deleted user's MCP server configs through
+	// the MCP store so its cached server lists are invalidated too.
+	deleteMCPServers func(ctx context.Context, ownerUserID string) error
 }
 
+// userCacheTTL bounds how long a canonical user read is reused. Every inbound
+// message checks the sender's ban status and command middleware checks admin
+// status, so a short-lived cache absorbs those repeated reads. Writes through
+// this service clear the cache immediately.
+const userCacheTTL = 5 * time.Second
+
 // NewService creates a new account-link service backed by a SQLite database on disk.
 func NewService(path string, memories *usermemory.Store, log *config.Logger) *Service {
 	legacyPath := filepath.Join(filepath.Dir(path), "links.json")
@@ -36,6 +48,12 @@ func NewService(path string, memories *usermemory.Store, log *config.Logger) *Se
 	return &Service{path: path, legacyPath: legacyPath, memories: memories, log: log}
 }
 
+// SetMCPServerDeleter configures how DeleteUser removes the user's MCP
+// server configs. Without one it deletes the rows directly.
+func (s *Service) SetMCPServerDeleter(deleter func(ctx context.Context, ownerUserID string) error) {
+	s.deleteMCPServers = deleter
+}
+
 // Initialize prepares the account-link database and migrates the legacy JSON store when present.
 func (s *Service) Initialize() error {
 	s.initOnce.Do(func() {
@@ -54,39 +72,51 @@ func (s *Service) EnsureAccount(gateway, identifier, displayName string) (string
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
-	if err != nil {
+	if err := s.Initialize(); err != nil {
 		return "", err
 	}
 
+	// Every inbound message resolves its sender here, so look up just this
+	// identity's user rather than loading the whole account-link dataset. The
+	// full load is only needed when the records must be rewritten.
 	key := accountKey(gateway, identifier)
-	if canonicalID, ok := data.AccountIndex[key]; ok {
-		user := data.Users[canonicalID]
-		updated := false
-		for i := range user.Accounts {
-			if user.Accounts[i].Gateway == gateway && user.Accounts[i].Identifier == identifier {
-				if displayName != "" && user.Accounts[i].DisplayName != displayName {
+	canonicalID, user, ok, err := s.db.LoadAccountUserByLink(gateway, identifier)
+	if err != nil {
+		return "", err
+	}
+	if ok {
+		if displayNameChanged(user.Accounts, gateway, identifier, displayName) {
+			data, err := s.loadLocked()
+			if err != nil {
+				return "", err
+			}
+			user = data.Users[canonicalID]
+			for i := range user.Accounts {
+				if user.Accounts[i].Gateway == gateway && user.Accounts[i].Identifier == identifier {
 					user.Accounts[i].DisplayName = displayName
-					updated = true
+					break
 				}
-				break
 			}
-		}
-		if updated {
 			user.UpdatedAt = time.Now().UTC()
 			data.Users[canonicalID] = user
 			if err := s.saveLocked(data); err != nil {
 				return "", err
 			}
 		}
+		s.cacheUserLocked(canonicalID, user, true)
 		if err := s.memories.SyncSpeakerIntro(canonicalID, FormatSpeakerLine(user.Accounts)); err != nil {
 			return "", err
 		}
 		return canonicalID, nil
 	}
 
+	data, err := s.loadLocked()
+	if err != nil {
+		return "", err
+	}
+
 	now := time.Now().UTC()
-	canonicalID, err := newCanonicalUserID()
+	canonicalID, err = newCanonicalUserID()
 	if err != nil {
 		return "", err
 	}
@@ -114,17 +144,36 @@ func (s *Service) EnsureAccount(gateway, identifier, displayName string) (string
 	return canonicalID, nil
 }
 
+// LookupAccount resolves an external account to its canonical user ID
+// without creating a user or updating its display name.
+func (s *Service) LookupAccount(gateway, identifier string) (string, bool, error) {
+	identifier, err := NormalizeIdentifier(gateway, identifier)
+	if err != nil {
+		return "", false, err
+	}
+
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	if err := s.Initialize(); err != nil {
+		return "", false, err
+	}
+	canonicalID, _, ok, err := s.db.LoadAccountUserByLink(gateway, identifier)
+	if err != nil {
+		return "", false, err
+	}
+	return canonicalID, ok, nil
+}
+
 // AccountsForUser returns the linked accounts for a canonical user.
 func (s *Service) AccountsForUser(canonicalUserID string) ([]LinkedAccount, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
+	user, ok, err := s.loadUserLocked(canonicalUserID)
 	if err != nil {
 		return nil, err
 	}
-
-	user, ok := data.Users[canonicalUserID]
 	if !ok {
 		return nil, nil
 	}
@@ -167,11 +216,10 @@ func (s *Service) User(canonicalUserID string) (UserSummary, bool, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
+	user, ok, err := s.loadUserLocked(canonicalUserID)
 	if err != nil {
 		return UserSummary{}, false, err
 	}
-	user, ok := data.Users[canonicalUserID]
 	if !ok {
 		return UserSummary{}, false, nil
 	}
@@ -183,11 +231,10 @@ func (s *Service) IsAdmin(canonicalUserID string) (bool, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
+	user, ok, err := s.loadUserLocked(canonicalUserID)
 	if err != nil {
 		return false, err
 	}
-	user, ok := data.Users[canonicalUserID]
 	return ok && user.IsAdmin, nil
 }
 
@@ -196,11 +243,10 @@ func (s *Service) IsBanned(canonicalUserID string) (bool, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
+	user, ok, err := s.loadUserLocked(canonicalUserID)
 	if err != nil {
 		return false, err
 	}
-	user, ok := data.Users[canonicalUserID]
 	return ok && user.IsBanned, nil
 }
 
@@ -209,11 +255,10 @@ func (s *Service) BanStatus(canonicalUserID string) (bool, string, error) {
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
-	data, err := s.loadLocked()
+	user, ok, err := s.loadUserLocked(canonicalUserID)
 	if err != nil {
 		return false, "", err
 	}
-	user, ok := data.Users[canonicalUserID]
 	if !ok || !user.IsBanned {
 		return false, "", nil
 	}
@@ -345,7 +390,11 @@ func (s *Service) DeleteUser(actorID, targetID string) error {
 	if err := s.saveLocked(data); err != nil {
 		return err
 	}
-	if s.db != nil && s.db.SQL() != nil {
+	if s.deleteMCPServers != nil {
+		if err := s.deleteMCPServers(context.Background(), targetID); err != nil {
+			return fmt.Errorf("failed to delete user MCP servers: %w", err)
+		}
+	} else if s.db != nil && s.db.SQL() != nil {
 		if _, err := s.db.SQL().Exec(`DELETE FROM mcp_servers WHERE owner_user_id = ?`, targetID); err != nil {
 			return fmt.Errorf("failed to delete user MCP servers: %w", err)
 		}
@@ -561,10 +610,41 @@ func (s *Service) loadLocked() (fileData, error) {
 	return s.db.LoadAccountLinks()
 }
 
+// loadUserLocked reads a single canonical user without loading every account
+// link, serving recent reads from the short-lived user cache.
+func (s *Service) loadUserLocked(canonicalUserID string) (UserRecord, bool, error) {
+	if entry, ok := s.users[canonicalUserID]; ok && entry.ExpiresAt.After(time.Now()) {
+		return entry.User, entry.Found, nil
+	}
+	if err := s.Initialize(); err != nil {
+		return UserRecord{}, false, err
+	}
+	user, found, err := s.db.LoadAccountUser(canonicalUserID)
+	if err != nil {
+		return UserRecord{}, false, err
+	}
+	s.cacheUserLocked(canonicalUserID, user, found)
+	return user, found, nil
+}
+
+func (s *Service) cacheUserLocked(canonicalUserID string, user UserRecord, found bool) {
+	now := time.Now()
+	if s.users == nil {
+		s.users = make(map[string]cachedUser)
+	}
+	for id, entry := range s.users {
+		if !entry.ExpiresAt.After(now) {
+			delete(s.users, id)
+		}
+	}
+	s.users[canonicalUserID] = cachedUser{User: user, Found: found, ExpiresAt: now.Add(userCacheTTL)}
+}
+
 func (s *Service) saveLocked(data fileData) error {
 	if err := s.Initialize(); err != nil {
 		return err
 	}
+	s.users = nil
 	return s.db.ReplaceAccountLinks(data)
 }
 
@@ -589,6 +669,20 @@ func newCanonicalUserID() (string, error) {
 	return "usr_" + hex.EncodeToString(b), nil
 }
 
+// displayNameChanged reports whether the stored display name for an account
+// differs from a non-empty incoming one.
+func displayNameChanged(accounts []LinkedAccount, gateway, identifier, displayName string) bool {
+	if displayName == "" {
+		return false
+	}
+	for _, account := range accounts {
+		if account.Gateway == gateway && account.Identifier == identifier {
+			return account.DisplayName != displayName
+		}
+	}
+	return false
+}
+
 func findAccount(accounts []LinkedAccount, gateway, identifier string) (LinkedAccount, bool) {
 	for _, account := range accounts {
 		if account.Gateway == gateway && account.Identifier == identifier {
@@ -395,6 +395,38 @@ func assertRowCount(t *testing.T, db interface {
 	}
 }
 
+func TestServiceCachesUserReadsUntilWrite(t *testing.T) {
+	links := newTestService(t)
+	adminID, err := links.EnsureAccount("discord", "100", "Admin")
+	if err != nil {
+		t.Fatalf("ensure admin: %v", err)
+	}
+	targetID, err := links.EnsureAccount("discord", "200", "Target")
+	if err != nil {
+		t.Fatalf("ensure target: %v", err)
+	}
+	if err := links.SetAdmin(adminID, adminID, true); err != nil {
+		t.Fatalf("set admin: %v", err)
+	}
+
+	if banned, _, err := links.BanStatus(targetID); err != nil || banned {
+		t.Fatalf("initial ban status = %v, %v", banned, err)
+	}
+	if _, err := links.db.SQL().Exec(`UPDATE account_users SET is_banned = 1 WHERE canonical_user_id = ?`, targetID); err != nil {
+		t.Fatalf("update ban flag: %v", err)
+	}
+	if banned, _, err := links.BanStatus(targetID); err != nil || banned {
+		t.Fatalf("cached ban status = %v, %v; want cached false", banned, err)
+	}
+
+	if err := links.BanUser(adminID, targetID, "spam"); err != nil {
+		t.Fatalf("ban target: %v", err)
+	}
+	if banned, reason, err := links.BanStatus(targetID); err != nil || !banned || reason != "spam" {
+		t.Fatalf("ban status after write = %v, %q, %v", banned, reason, err)
+	}
+}
+
 func newTestService(t *testing.T) *Service {
 	t.Helper()
 	dir := t.TempDir()
@@ -14,6 +14,13 @@ type UserRecord = database.AccountUser
 
 type fileData = database.AccountLinkData
 
+// cachedUser is a recently read canonical user, or a recorded miss.
+type cachedUser struct {
+	User      UserRecord
+	Found     bool
+	ExpiresAt time.Time
+}
+
 // LinkResult describes the outcome of linking an external account.
 type LinkResult struct {
 	CanonicalUserID string
@@ -102,15 +102,16 @@ func (h handler) list(ctx context.Context, userID, scope string) (commands.Resul
 
 func (h handler) add(ctx context.Context, scope, owner string, args []string) (commands.Result, error) {
 	if len(args) < 2 {
-		return commands.Result{Text: "Use: /mcp add <name> <https-url> [auth-bearer=<token>] [header:<name>=<value>]"}, nil
+		return commands.Result{Text: "Use: /mcp add <name> <https-url> [auth-bearer=<token>] [header:<name>=<value>] [cache=<tool>,...]"}, nil
 	}
 	name := args[0]
 	url := args[1]
-	headers, err := parseHeaders(args[2:])
+	options, cacheable := splitCacheableTools(args[2:])
+	headers, err := parseHeaders(options)
 	if err != nil {
 		return commands.Result{Text: err.Error()}, nil
 	}
-	_, err = h.store.Save(ctx, mcpmanager.ServerConfig{Scope: scope, OwnerUserID: owner, Name: name, Type: "generic", Transport: mcpmanager.TransportStreamableHTTP, URL: url, Headers: headers, Enabled: true})
+	_, err = h.store.Save(ctx, mcpmanager.ServerConfig{Scope: scope, OwnerUserID: owner, Name: name, Type: "generic", Transport: mcpmanager.TransportStreamableHTTP, URL: url, Headers: headers, Enabled: true, CacheableTools: cacheable})
 	if err != nil {
 		return commands.Result{}, err
 	}
@@ -166,6 +167,21 @@ func (h handler) test(ctx context.Context, userID, scope, owner string, args []s
 	return commands.Result{Text: fmt.Sprintf("MCP server %q connected. Tools: %d.", info.Name, len(tools))}, nil
 }
 
+// splitCacheableTools separates cache=<tool>,... options, which opt tools
+// into result caching, from the header options that follow a server URL.
+func splitCacheableTools(args []string) ([]string, []string) {
+	var rest, tools []string
+	for _, arg := range args {
+		list, ok := strings.CutPrefix(arg, "cache=")
+		if !ok {
+			rest = append(rest, arg)
+			continue
+		}
+		tools = append(tools, strings.Split(list, ",")...)
+	}
+	return rest, tools
+}
+
 func parseHeaders(args []string) (map[string]string, error) {
 	headers := map[string]string{}
 	for _, arg := range args {
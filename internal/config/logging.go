@@ -4,9 +4,10 @@ import (
 	"crypto/rand"
 	"encoding/hex"
 	"encoding/json"
-	"log"
+	"io"
 	"os"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -75,15 +76,32 @@ func ErrorField(err error) Field {
 // Logger emits structured JSON logs to stderr.
 type Logger struct {
 	level  Level
-	logger *log.Logger
+	out    *logOutput
 	fields []Field
 }
 
+// logOutput serializes complete log lines onto a shared writer so derived
+// loggers never interleave partial writes.
+type logOutput struct {
+	mu sync.Mutex
+	w  io.Writer
+}
+
+func (o *logOutput) writeLine(line []byte) {
+	o.mu.Lock()
+	defer o.mu.Unlock()
+	_, _ = o.w.Write(line)
+}
+
 // NewLogger creates a Logger that writes JSON to stderr at the given minimum level.
 func NewLogger(level Level) *Logger {
+	return newLogger(level, os.Stderr)
+}
+
+func newLogger(level Level, w io.Writer) *Logger {
 	return &Logger{
 		level:  level,
-		logger: log.New(os.Stderr, "", 0),
+		out:    &logOutput{w: w},
 		fields: []Field{F("service", serviceName)},
 	}
 }
@@ -98,7 +116,7 @@ func (l *Logger) With(fields ...Field) *Logger {
 		}
 		merged = append(merged, field)
 	}
-	return &Logger{level: l.level, logger: l.logger, fields: merged}
+	return &Logger{level: l.level, out: l.out, fields: merged}
 }
 
 // Server returns a server-scoped logger for the given component.
@@ -123,8 +141,14 @@ func (l *Logger) Agent(component, requestID, sessionID, userID, gateway, model s
 	return l.With(base...)
 }
 
+// Enabled reports whether events at level would be written. Callers use it
+// to skip deriving request loggers or building fields for suppressed events.
+func (l *Logger) Enabled(level Level) bool {
+	return level >= l.level
+}
+
 func (l *Logger) log(level Level, event, msg string, fields ...Field) {
-	if level < l.level {
+	if !l.Enabled(level) {
 		return
 	}
 
@@ -161,7 +185,9 @@ func (l *Logger) log(level Level, event, msg string, fields ...Field) {
 		line, _ = json.Marshal(fallback)
 	}
 
-	l.logger.Print(string(line))
+	// Append the newline in place and hand the encoded bytes straight to the
+	// writer, avoiding the string conversion and formatting of log.Print.
+	l.out.writeLine(append(line, '\n'))
 }
 
 // Debug logs a message at DEBUG level.
@@ -0,0 +1,39 @@
+package config
+
+import (
+	"bytes"
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestLoggerWritesOneJSONLinePerEvent(t *testing.T) {
+	var buf bytes.Buffer
+	log := newLogger(LevelInfo, &buf).Server("test")
+
+	log.Debug("test.debug", "suppressed")
+	log.Info("test.info", "first", F("count", 1))
+	log.Warn("test.warn", "second")
+
+	lines := strings.Split(strings.TrimSuffix(buf.String(), "\n"), "\n")
+	if len(lines) != 2 {
+		t.Fatalf("expected 2 log lines, got %d: %q", len(lines), buf.String())
+	}
+	var payload map[string]any
+	if err := json.Unmarshal([]byte(lines[0]), &payload); err != nil {
+		t.Fatalf("decode log line: %v", err)
+	}
+	if payload["event"] != "test.info" || payload["component"] != "test" || payload["service"] != serviceName || payload["count"] != float64(1) {
+		t.Fatalf("unexpected payload: %+v", payload)
+	}
+}
+
+func TestLoggerEnabledMatchesMinimumLevel(t *testing.T) {
+	log := newLogger(LevelInfo, &bytes.Buffer{}).Server("test")
+	if log.Enabled(LevelDebug) {
+		t.Fatal("expected debug to be disabled at info level")
+	}
+	if !log.Enabled(LevelInfo) || !log.Enabled(LevelError) {
+		t.Fatal("expected info and above to be enabled")
+	}
+}
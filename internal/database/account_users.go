@@ -33,6 +33,10 @@ CREATE TABLE IF NOT EXISTS account_users (
 	if err != nil {
 		return fmt.Errorf("failed to initialize account_users table: %w", err)
 	}
+	columns, err := d.tableColumns("account_users")
+	if err != nil {
+		return err
+	}
 	for _, column := range []struct {
 		name       string
 		definition string
@@ -43,20 +47,26 @@ CREATE TABLE IF NOT EXISTS account_users (
 		{name: "banned_by", definition: "TEXT NOT NULL DEFAULT ''"},
 		{name: "ban_reason", definition: "TEXT NOT NULL DEFAULT ''"},
 	} {
-		if err := d.ensureAccountUserColumn(column.name, column.definition); err != nil {
-			return err
+		if _, ok := columns[column.name]; ok {
+			continue
+		}
+		if _, err := d.db.Exec(fmt.Sprintf(`ALTER TABLE account_users ADD COLUMN %s %s`, column.name, column.definition)); err != nil {
+			return fmt.Errorf("failed to add account_users.%s column: %w", column.name, err)
 		}
 	}
 	return nil
 }
 
-func (d *DB) ensureAccountUserColumn(name, definition string) error {
-	rows, err := d.db.Query(`PRAGMA table_info(account_users)`)
+// tableColumns reads a table's schema once so every migration column can be
+// checked without re-running PRAGMA table_info per column.
+func (d *DB) tableColumns(table string) (map[string]struct{}, error) {
+	rows, err := d.db.Query(fmt.Sprintf(`PRAGMA table_info(%s)`, table))
 	if err != nil {
-		return fmt.Errorf("failed to inspect account_users table: %w", err)
+		return nil, fmt.Errorf("failed to inspect %s table: %w", table, err)
 	}
 	defer rows.Close()
 
+	columns := make(map[string]struct{})
 	for rows.Next() {
 		var cid int
 		var columnName, columnType string
@@ -64,18 +74,12 @@ func (d *DB) ensureAccountUserColumn(name, definition string) error {
 		var defaultValue interface{}
 		var pk int
 		if err := rows.Scan(&cid, &columnName, &columnType, &notNull, &defaultValue, &pk); err != nil {
-			return fmt.Errorf("failed to scan account_users schema: %w", err)
-		}
-		if columnName == name {
-			return nil
+			return nil, fmt.Errorf("failed to scan %s schema: %w", table, err)
 		}
+		columns[columnName] = struct{}{}
 	}
 	if err := rows.Err(); err != nil {
-		return fmt.Errorf("failed to inspect account_users schema: %w", err)
+		return nil, fmt.Errorf("failed to inspect %s schema: %w", table, err)
 	}
-
-	if _, err := d.db.Exec(fmt.Sprintf(`ALTER TABLE account_users ADD COLUMN %s %s`, name, definition)); err != nil {
-		return fmt.Errorf("failed to add account_users.%s column: %w", name, err)
-	}
-	return nil
+	return columns, nil
 }
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"sync"
 
 	sqlite_vec "github.com/asg017/sqlite-vec-go-bindings/cgo"
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
@@ -12,39 +13,91 @@ import (
 	_ "github.com/mattn/go-sqlite3"
 )
 
+// maxOpenConns caps the SQLite connection pool. Every pooled connection is
+// kept idle rather than closed, because opening one reloads the schema and the
+// sqlite-vec extension; database/sql otherwise retains only two idle handles.
+const maxOpenConns = 8
+
+// connectionParams are applied by the driver to every pooled connection. WAL
+// lets the pool's readers proceed while a writer commits, and synchronous=NORMAL
+// is durable under WAL while skipping an fsync on every commit.
+const connectionParams = "?_foreign_keys=on&_busy_timeout=5000&_journal_mode=WAL&_synchronous=NORMAL"
+
+// registerVec registers sqlite-vec as an auto-extension exactly once per
+// process. Every later connection picks it up on open, so stores opened after
+// the first do not register it again.
+var registerVec sync.Once
+
+// sharedPools holds one connection pool per database file. The account-link,
+// user-memory, and MCP stores all open the same file, and SQLite serializes
+// writers anyway, so separate pools only multiply idle connections. Only the
+// handle that creates a pool runs the schema DDL; a file reopened after its
+// last handle closed is initialized again, since it may have been replaced.
+var (
+	sharedPoolsMu sync.Mutex
+	sharedPools   = make(map[string]*sharedPool)
+)
+
+type sharedPool struct {
+	db   *sql.DB
+	refs int
+}
+
 // DB owns the application's SQLite connection and schema initialization.
 type DB struct {
-	path string
-	log  *config.Logger
-	db   *sql.DB
+	path      string
+	key       string
+	log       *config.Logger
+	db        *sql.DB
+	closeOnce sync.Once
 }
 
-// Open initializes the application database at path.
+// Open initializes the application database at path. Handles opened for the
+// same file share one connection pool, which is closed with the last handle.
 func Open(path string, log *config.Logger) (*DB, error) {
+	key := pathKey(path)
+
+	sharedPoolsMu.Lock()
+	defer sharedPoolsMu.Unlock()
+	if pool, ok := sharedPools[key]; ok {
+		pool.refs++
+		return &DB{path: path, key: key, log: log, db: pool.db}, nil
+	}
+
 	if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
 		return nil, fmt.Errorf("failed to create database directory: %w", err)
 	}
 
-	sqlite_vec.Auto()
+	registerVec.Do(sqlite_vec.Auto)
 
-	db, err := sql.Open("sqlite3", path+"?_foreign_keys=on&_busy_timeout=5000")
+	db, err := sql.Open("sqlite3", path+connectionParams)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
+	db.SetMaxOpenConns(maxOpenConns)
+	db.SetMaxIdleConns(maxOpenConns)
 	var vecVersion string
 	if err := db.QueryRow(`SELECT vec_version()`).Scan(&vecVersion); err != nil {
 		db.Close() // nolint:errcheck
 		return nil, fmt.Errorf("failed to initialize sqlite-vec: %w", err)
 	}
 
-	store := &DB{path: path, log: log, db: db}
+	store := &DB{path: path, key: key, log: log, db: db}
 	if err := store.initialize(); err != nil {
 		db.Close() // nolint:errcheck
 		return nil, err
 	}
+	sharedPools[key] = &sharedPool{db: db, refs: 1}
 	return store, nil
 }
 
+func pathKey(path string) string {
+	if abs, err := filepath.Abs(path); err == nil {
+		return abs
+	}
+	return filepath.Clean(path)
+}
+
 // SQL returns the underlying database handle for package-specific stores.
 func (d *DB) SQL() *sql.DB {
 	if d == nil {
@@ -53,12 +106,27 @@ func (d *DB) SQL() *sql.DB {
 	return d.db
 }
 
-// Close closes the database connection.
+// Close releases this handle and closes the shared connection pool once no
+// other handle for the same file remains open.
 func (d *DB) Close() error {
 	if d == nil || d.db == nil {
 		return nil
 	}
-	return d.db.Close()
+	var err error
+	d.closeOnce.Do(func() {
+		sharedPoolsMu.Lock()
+		defer sharedPoolsMu.Unlock()
+		pool, ok := sharedPools[d.key]
+		if ok && pool.db == d.db {
+			pool.refs--
+			if pool.refs > 0 {
+				return
+			}
+			delete(sharedPools, d.key)
+		}
+		err = d.db.Close()
+	})
+	return err
 }
 
 func (d *DB) initialize() error {
@@ -0,0 +1,133 @@
+package database
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/jonahgcarpenter/oswald-ai/internal/config"
+)
+
+func TestOpenKeepsPooledConnectionsIdle(t *testing.T) {
+	db, err := Open(filepath.Join(t.TempDir(), "oswald.db"), config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	defer db.Close() // nolint:errcheck
+
+	if got := db.SQL().Stats().MaxOpenConnections; got != maxOpenConns {
+		t.Fatalf("MaxOpenConnections = %d, want %d", got, maxOpenConns)
+	}
+}
+
+func TestRecentSessionTurnsQueryUsesCompositeIndex(t *testing.T) {
+	db, err := Open(filepath.Join(t.TempDir(), "oswald.db"), config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	defer db.Close() // nolint:errcheck
+
+	rows, err := db.SQL().Query(`EXPLAIN QUERY PLAN SELECT id FROM session_turns WHERE canonical_user_id = ? AND session_id = ? ORDER BY created_at DESC, id DESC LIMIT 4`, "usr_test", "session")
+	if err != nil {
+		t.Fatalf("explain: %v", err)
+	}
+	defer rows.Close()
+
+	var plan []string
+	for rows.Next() {
+		var id, parent, notUsed int
+		var detail string
+		if err := rows.Scan(&id, &parent, &notUsed, &detail); err != nil {
+			t.Fatalf("scan plan: %v", err)
+		}
+		plan = append(plan, detail)
+	}
+	joined := strings.Join(plan, "\n")
+	if !strings.Contains(joined, "idx_session_turns_user_session_created") || strings.Contains(joined, "TEMP B-TREE") {
+		t.Fatalf("recent turns query does not use the composite index without sorting:\n%s", joined)
+	}
+}
+
+func TestOpenReinitializesSchemaAfterLastClose(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "oswald.db")
+	first, err := Open(path, config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	second, err := Open(path, config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open shared db: %v", err)
+	}
+	if err := first.Close(); err != nil {
+		t.Fatalf("close first: %v", err)
+	}
+	if err := second.Close(); err != nil {
+		t.Fatalf("close second: %v", err)
+	}
+
+	// Replace the file while no handle is open; the next Open must build the
+	// schema again rather than trusting what an earlier pool created.
+	for _, suffix := range []string{"", "-wal", "-shm"} {
+		if err := os.Remove(path + suffix); err != nil && !os.IsNotExist(err) {
+			t.Fatalf("remove %s: %v", path+suffix, err)
+		}
+	}
+
+	reopened, err := Open(path, config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("reopen db: %v", err)
+	}
+	defer reopened.Close() // nolint:errcheck
+	var count int
+	if err := reopened.SQL().QueryRow(`SELECT COUNT(*) FROM account_users`).Scan(&count); err != nil {
+		t.Fatalf("reopened db is missing its schema: %v", err)
+	}
+}
+
+func TestOpenUsesWriteAheadLog(t *testing.T) {
+	db, err := Open(filepath.Join(t.TempDir(), "oswald.db"), config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	defer db.Close() // nolint:errcheck
+
+	var mode string
+	if err := db.SQL().QueryRow(`PRAGMA journal_mode`).Scan(&mode); err != nil {
+		t.Fatalf("journal_mode: %v", err)
+	}
+	if !strings.EqualFold(mode, "wal") {
+		t.Fatalf("journal_mode = %q, want wal", mode)
+	}
+}
+
+func TestOpenSharesPoolPerPathUntilLastClose(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "oswald.db")
+	first, err := Open(path, config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	second, err := Open(path, config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("reopen db: %v", err)
+	}
+	if first.SQL() != second.SQL() {
+		t.Fatal("handles for the same file use separate pools")
+	}
+
+	if err := first.Close(); err != nil {
+		t.Fatalf("close first: %v", err)
+	}
+	if err := first.Close(); err != nil {
+		t.Fatalf("close first twice: %v", err)
+	}
+	if err := second.SQL().Ping(); err != nil {
+		t.Fatalf("shared pool closed while still in use: %v", err)
+	}
+	if err := second.Close(); err != nil {
+		t.Fatalf("close second: %v", err)
+	}
+	if err := second.SQL().Ping(); err == nil {
+		t.Fatal("shared pool still open after last close")
+	}
+}
@@ -65,25 +65,9 @@ func (d *DB) LoadAccountLinks() (AccountLinkData, error) {
 		if err := userRows.Scan(&canonicalID, &createdRaw, &updatedRaw, &isAdmin, &isBanned, &bannedRaw, &user.BannedBy, &user.BanReason); err != nil {
 			return AccountLinkData{}, fmt.Errorf("failed to scan account user: %w", err)
 		}
-		createdAt, err := parseDBTime(createdRaw)
-		if err != nil {
+		if err := setAccountUserFields(&user, createdRaw, updatedRaw, bannedRaw, isAdmin, isBanned); err != nil {
 			return AccountLinkData{}, err
 		}
-		updatedAt, err := parseDBTime(updatedRaw)
-		if err != nil {
-			return AccountLinkData{}, err
-		}
-		user.CreatedAt = createdAt
-		user.UpdatedAt = updatedAt
-		user.IsAdmin = isAdmin != 0
-		user.IsBanned = isBanned != 0
-		if bannedRaw != "" {
-			bannedAt, err := parseDBTime(bannedRaw)
-			if err != nil {
-				return AccountLinkData{}, err
-			}
-			user.BannedAt = bannedAt
-		}
 		data.Users[canonicalID] = user
 	}
 	if err := userRows.Err(); err != nil {
@@ -122,6 +106,102 @@ func (d *DB) LoadAccountLinks() (AccountLinkData, error) {
 	return data, nil
 }
 
+// accountUserQuery selects one canonical user joined with its linked accounts,
+// one row per account. The WHERE clause is appended by the caller.
+const accountUserQuery = `
+SELECT u.canonical_user_id, u.created_at, u.updated_at, u.is_admin, u.is_banned, u.banned_at, u.banned_by, u.ban_reason,
+	a.gateway, a.identifier, a.display_name, a.linked_at, a.verified
+FROM account_users u
+LEFT JOIN linked_accounts a ON a.canonical_user_id = u.canonical_user_id
+`
+
+// LoadAccountUser reads one canonical user and its linked accounts in a single
+// query. It reports false when the user does not exist.
+func (d *DB) LoadAccountUser(canonicalID string) (AccountUser, bool, error) {
+	_, user, ok, err := d.loadAccountUser(accountUserQuery+`WHERE u.canonical_user_id = ? ORDER BY a.gateway, a.identifier`, canonicalID)
+	return user, ok, err
+}
+
+// LoadAccountUserByLink resolves a gateway identity to its canonical user and
+// reads that user with all of its linked accounts in a single query. It
+// reports false when the identity is not linked to any user.
+func (d *DB) LoadAccountUserByLink(gateway, identifier string) (string, AccountUser, bool, error) {
+	return d.loadAccountUser(accountUserQuery+`WHERE u.canonical_user_id = (SELECT canonical_user_id FROM linked_accounts WHERE gateway = ? AND identifier = ?) ORDER BY a.gateway, a.identifier`,
+		strings.ToLower(strings.TrimSpace(gateway)), strings.TrimSpace(identifier))
+}
+
+func (d *DB) loadAccountUser(query string, args ...any) (string, AccountUser, bool, error) {
+	rows, err := d.db.Query(query, args...)
+	if err != nil {
+		return "", AccountUser{}, false, fmt.Errorf("failed to read account user: %w", err)
+	}
+	defer rows.Close()
+
+	var canonicalID string
+	var user AccountUser
+	found := false
+	for rows.Next() {
+		var createdRaw, updatedRaw, bannedRaw string
+		var isAdmin, isBanned int
+		var gateway, identifier, displayName, linkedRaw sql.NullString
+		var verified sql.NullInt64
+		if err := rows.Scan(&canonicalID, &createdRaw, &updatedRaw, &isAdmin, &isBanned, &bannedRaw, &user.BannedBy, &user.BanReason,
+			&gateway, &identifier, &displayName, &linkedRaw, &verified); err != nil {
+			return "", AccountUser{}, false, fmt.Errorf("failed to scan account user: %w", err)
+		}
+		if !found {
+			if err := setAccountUserFields(&user, createdRaw, updatedRaw, bannedRaw, isAdmin, isBanned); err != nil {
+				return "", AccountUser{}, false, err
+			}
+			found = true
+		}
+		if !gateway.Valid {
+			continue
+		}
+		linkedAt, err := parseDBTime(linkedRaw.String)
+		if err != nil {
+			return "", AccountUser{}, false, err
+		}
+		user.Accounts = append(user.Accounts, LinkedAccount{
+			Gateway:     gateway.String,
+			Identifier:  identifier.String,
+			DisplayName: displayName.String,
+			LinkedAt:    linkedAt,
+			Verified:    verified.Int64 != 0,
+		})
+	}
+	if err := rows.Err(); err != nil {
+		return "", AccountUser{}, false, fmt.Errorf("failed to read account user: %w", err)
+	}
+	if !found {
+		return "", AccountUser{}, false, nil
+	}
+	return canonicalID, user, true, nil
+}
+
+func setAccountUserFields(user *AccountUser, createdRaw, updatedRaw, bannedRaw string, isAdmin, isBanned int) error {
+	createdAt, err := parseDBTime(createdRaw)
+	if err != nil {
+		return err
+	}
+	updatedAt, err := parseDBTime(updatedRaw)
+	if err != nil {
+		return err
+	}
+	user.CreatedAt = createdAt
+	user.UpdatedAt = updatedAt
+	user.IsAdmin = isAdmin != 0
+	user.IsBanned = isBanned != 0
+	if bannedRaw != "" {
+		bannedAt, err := parseDBTime(bannedRaw)
+		if err != nil {
+			return err
+		}
+		user.BannedAt = bannedAt
+	}
+	return nil
+}
+
 // ReplaceAccountLinks atomically replaces all account-link rows without
 // deleting unchanged account_users. User memory rows reference account_users, so
 // wholesale deletes would cascade and erase persistent memories.
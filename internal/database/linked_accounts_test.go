@@ -56,3 +56,52 @@ func TestReplaceAccountLinksPreservesUserMemoryRows(t *testing.T) {
 		t.Fatalf("expected memory preserved, got profiles=%d entries=%d", profileCount, entryCount)
 	}
 }
+
+func TestLoadAccountUserReadsSingleUserWithAccounts(t *testing.T) {
+	db, err := Open(filepath.Join(t.TempDir(), "oswald.db"), config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatalf("open db: %v", err)
+	}
+	defer db.Close() // nolint:errcheck
+
+	now := time.Now().UTC()
+	if err := db.ReplaceAccountLinks(AccountLinkData{Users: map[string]AccountUser{
+		"usr_a": {
+			CreatedAt: now,
+			UpdatedAt: now,
+			IsBanned:  true,
+			BanReason: "spam",
+			Accounts: []LinkedAccount{
+				{Gateway: "websocket", Identifier: "alice", LinkedAt: now},
+				{Gateway: "discord", Identifier: "123", DisplayName: "Alice", LinkedAt: now, Verified: true},
+			},
+		},
+		"usr_b": {CreatedAt: now, UpdatedAt: now},
+	}}); err != nil {
+		t.Fatalf("replace: %v", err)
+	}
+
+	user, ok, err := db.LoadAccountUser("usr_a")
+	if err != nil || !ok {
+		t.Fatalf("LoadAccountUser(usr_a) = %v, %v", ok, err)
+	}
+	if !user.IsBanned || user.BanReason != "spam" || len(user.Accounts) != 2 || user.Accounts[0].Gateway != "discord" || !user.Accounts[0].Verified {
+		t.Fatalf("unexpected user: %+v", user)
+	}
+
+	user, ok, err = db.LoadAccountUser("usr_b")
+	if err != nil || !ok || len(user.Accounts) != 0 {
+		t.Fatalf("LoadAccountUser(usr_b) = %+v, %v, %v", user, ok, err)
+	}
+	if _, ok, err := db.LoadAccountUser("usr_missing"); err != nil || ok {
+		t.Fatalf("LoadAccountUser(missing) = %v, %v", ok, err)
+	}
+
+	canonicalID, user, ok, err := db.LoadAccountUserByLink("WebSocket", "alice")
+	if err != nil || !ok || canonicalID != "usr_a" || len(user.Accounts) != 2 {
+		t.Fatalf("LoadAccountUserByLink = %q, %+v, %v, %v", canonicalID, user, ok, err)
+	}
+	if _, _, ok, err := db.LoadAccountUserByLink("websocket", "nobody"); err != nil || ok {
+		t.Fatalf("LoadAccountUserByLink(unlinked) = %v, %v", ok, err)
+	}
+}
@@ -15,6 +15,7 @@ CREATE TABLE IF NOT EXISTS mcp_servers (
 	url_host_hash TEXT NOT NULL DEFAULT '',
 	headers_ciphertext TEXT NOT NULL DEFAULT '',
 	enabled INTEGER NOT NULL DEFAULT 1,
+	cacheable_tools TEXT NOT NULL DEFAULT '',
 	created_at TEXT NOT NULL,
 	updated_at TEXT NOT NULL,
 	CHECK (
@@ -34,5 +35,14 @@ WHERE scope = 'user';
 	if err != nil {
 		return fmt.Errorf("failed to initialize mcp_servers table: %w", err)
 	}
+	columns, err := d.tableColumns("mcp_servers")
+	if err != nil {
+		return err
+	}
+	if _, ok := columns["cacheable_tools"]; !ok {
+		if _, err := d.db.Exec(`ALTER TABLE mcp_servers ADD COLUMN cacheable_tools TEXT NOT NULL DEFAULT ''`); err != nil {
+			return fmt.Errorf("failed to add mcp_servers.cacheable_tools column: %w", err)
+		}
+	}
 	return nil
 }
@@ -65,6 +65,9 @@ ON session_turns (session_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_session_turns_user_created
 ON session_turns (canonical_user_id, created_at);
 
+CREATE INDEX IF NOT EXISTS idx_session_turns_user_session_created
+ON session_turns (canonical_user_id, session_id, created_at DESC, id DESC);
+
 CREATE TABLE IF NOT EXISTS memory_events (
 	id INTEGER PRIMARY KEY AUTOINCREMENT,
 	memory_id INTEGER,
@@ -44,6 +44,9 @@ func (dg *Gateway) Start(b *broker.Broker) error {
 	if dg.replyIndex == nil {
 		dg.replyIndex = make(map[string]replyContext)
 	}
+	if dg.handlers == nil {
+		dg.handlers = gatewayruntime.NewHandlerPool(gatewayruntime.MaxConcurrentHandlers)
+	}
 	dg.setHeartbeatAcked(true)
 
 	for {
@@ -278,7 +281,7 @@ func (dg *Gateway) listenLoop(conn *gorilla.Conn) error {
 				case "MESSAGE_CREATE":
 					var msg MessageCreate
 					if err := json.Unmarshal(p.D, &msg); err == nil {
-						go dg.handleMessage(msg)
+						dg.dispatchMessage(msg)
 					}
 				}
 			}
@@ -425,14 +428,16 @@ func resolveMentions(text string, mentions []struct {
 	ID       string `json:"id"`
 	Username string `json:"username"`
 }) string {
+	if len(mentions) == 0 || !strings.Contains(text, "<@") {
+		return text
+	}
 	lookup := make(map[string]string, len(mentions))
 	for _, m := range mentions {
 		lookup[m.ID] = m.Username
 	}
 
-	re := regexp.MustCompile(`<@!?(\d+)>`)
-	return re.ReplaceAllStringFunc(text, func(match string) string {
-		sub := re.FindStringSubmatch(match)
+	return userMentionRE.ReplaceAllStringFunc(text, func(match string) string {
+		sub := userMentionRE.FindStringSubmatch(match)
 		if len(sub) < 2 {
 			return match
 		}
@@ -443,6 +448,38 @@ func resolveMentions(text string, mentions []struct {
 	})
 }
 
+// messageInvocation describes how an inbound message addresses the bot and
+// whether preflight lets it through.
+type messageInvocation struct {
+	MentionsBot  bool
+	IsReplyToBot bool
+	ReplyToID    string
+	RawText      string
+	Preflight    routing.Decision
+}
+
+// invocation runs preflight on msg's raw content so unaddressed channel
+// traffic exits before any rewriting. Mention and emoji rewriting never
+// changes whether an unaddressed message is a command attempt, so the
+// decision matches.
+func (dg *Gateway) invocation(msg MessageCreate) messageInvocation {
+	// Discord lists every mentioned user in msg.Mentions, so only messages
+	// that include the bot there need their content scanned for the token.
+	inv := messageInvocation{RawText: strings.TrimSpace(msg.Content)}
+	inv.MentionsBot = msg.mentionsUser(dg.BotID) && (strings.Contains(msg.Content, "<@"+dg.BotID+">") || strings.Contains(msg.Content, "<@!"+dg.BotID+">"))
+	inv.IsReplyToBot = msg.ReferencedMessage != nil && msg.ReferencedMessage.Author.ID == dg.BotID
+	if msg.GuildID != "" {
+		inv.ReplyToID = msg.ID
+	}
+	inv.Preflight = routing.Preflight(routing.PreflightInput{
+		IsGroup:      msg.GuildID != "",
+		IsMention:    inv.MentionsBot,
+		IsReplyToBot: inv.IsReplyToBot,
+		Text:         inv.RawText,
+	})
+	return inv
+}
+
 // handleMessage processes an incoming Discord message.
 func (dg *Gateway) handleMessage(msg MessageCreate) {
 	log := dg.log()
@@ -451,29 +488,10 @@ func (dg *Gateway) handleMessage(msg MessageCreate) {
 	}
 	requestID := config.NewRequestID()
 
-	mention1 := fmt.Sprintf("<@%s>", dg.BotID)
-	mention2 := fmt.Sprintf("<@!%s>", dg.BotID)
-	mentionsBot := strings.Contains(msg.Content, mention1) || strings.Contains(msg.Content, mention2)
-	isReplyToBot := msg.ReferencedMessage != nil && msg.ReferencedMessage.Author.ID == dg.BotID
-	replyToID := ""
-	if msg.GuildID != "" {
-		replyToID = msg.ID
-	}
-
-	re := regexp.MustCompile(`<a?:([^:]+):\d+>`)
-	text := strings.ReplaceAll(msg.Content, mention1, "")
-	text = strings.ReplaceAll(text, mention2, "")
-	text = strings.TrimSpace(text)
-	text = re.ReplaceAllString(text, ":$1:")
-	text = resolveMentions(text, msg.Mentions)
-	preflight := routing.Preflight(routing.PreflightInput{
-		IsGroup:      msg.GuildID != "",
-		IsMention:    mentionsBot,
-		IsReplyToBot: isReplyToBot,
-		Text:         text,
-	})
-	isCommandAttempt := routing.IsCommandAttempt(text)
-	if preflight.Action == routing.ActionIgnore {
+	inv := dg.invocation(msg)
+	mentionsBot, isReplyToBot, replyToID := inv.MentionsBot, inv.IsReplyToBot, inv.ReplyToID
+	if inv.Preflight.Action == routing.ActionIgnore {
+		isCommandAttempt := routing.IsCommandAttempt(inv.RawText)
 		log.Debug("gateway.message.ignored", "ignored discord message",
 			config.F("request_id", requestID),
 			config.F("chat_id", msg.ChannelID),
@@ -482,12 +500,21 @@ func (dg *Gateway) handleMessage(msg MessageCreate) {
 			config.F("is_mention", mentionsBot),
 			config.F("is_reply", msg.ReferencedMessage != nil),
 			config.F("is_command", isCommandAttempt),
-			config.F("reason", preflight.Reason),
+			config.F("reason", inv.Preflight.Reason),
 			config.F("message_preview", routing.MessagePreview(msg.Content, 100)),
 		)
 		return
 	}
 
+	text := inv.RawText
+	if mentionsBot {
+		text = strings.ReplaceAll(text, "<@"+dg.BotID+">", "")
+		text = strings.ReplaceAll(text, "<@!"+dg.BotID+">", "")
+		text = strings.TrimSpace(text)
+	}
+	text = customEmojiRE.ReplaceAllString(text, ":$1:")
+	text = resolveMentions(text, msg.Mentions)
+
 	images, unsupported := dg.loadImages(msg.Attachments)
 	embedImageCount := 0
 	if len(msg.Attachments) > 0 {
@@ -529,7 +556,7 @@ func (dg *Gateway) handleMessage(msg MessageCreate) {
 
 	var reply *routing.ReplyContext
 	if msg.ReferencedMessage != nil {
-		reply = dg.resolveReplyContext(msg, re, images, requestID)
+		reply = dg.resolveReplyContext(msg, customEmojiRE, images, requestID)
 	}
 	dg.rememberReply(msg.ID, replyContext{
 		SessionKey:  sessionKey,
@@ -568,6 +595,57 @@ func (dg *Gateway) handleMessage(msg MessageCreate) {
 	})
 }
 
+// dispatchMessage starts a handler for msg once it claims a handler slot,
+// without waiting for one. When every slot is busy an addressed message is
+// answered with an overload notice through the handler pool's notice queue,
+// so the listen loop never piles up blocked handlers or unbounded sends.
+func (dg *Gateway) dispatchMessage(msg MessageCreate) {
+	if dg.handlers.TryAcquire() {
+		go func() {
+			defer dg.handlers.Release()
+			dg.handleMessage(msg)
+		}()
+		return
+	}
+	if msg.Author.Bot {
+		return
+	}
+	inv := dg.invocation(msg)
+	if inv.Preflight.Action == routing.ActionIgnore {
+		return
+	}
+	queued := dg.handlers.Notify(func() { dg.sendOverloadNotice(msg, inv.ReplyToID) })
+	dg.log().Warn("gateway.message.overloaded", "rejected discord message while all handlers are busy",
+		config.F("chat_id", msg.ChannelID),
+		config.F("user_id", msg.Author.ID),
+		config.F("status", "rejected"),
+		config.F("limit", gatewayruntime.MaxConcurrentHandlers),
+		config.F("notice_queued", queued),
+	)
+}
+
+// sendOverloadNotice tells the author of msg that it was dropped, unless the
+// author is banned. Unknown senders cannot be banned, so they are answered
+// without creating an account.
+func (dg *Gateway) sendOverloadNotice(msg MessageCreate, replyToID string) {
+	senderID := ""
+	if dg.Links != nil {
+		canonicalUserID, _, err := dg.Links.LookupAccount("discord", msg.Author.ID)
+		if err != nil {
+			dg.log().Warn("gateway.message.overloaded_reply_failed", "failed to resolve discord account for overload reply", config.F("chat_id", msg.ChannelID), config.ErrorField(err))
+			return
+		}
+		senderID = canonicalUserID
+	}
+	err := gatewayruntime.SendOverloadNotice(dg.runtimeDependencies(), senderID, func(text string) error {
+		_, err := dg.sendMessage(msg.ChannelID, text, replyToID)
+		return err
+	})
+	if err != nil {
+		dg.log().Warn("gateway.message.overloaded_reply_failed", "failed to send discord overload reply", config.F("chat_id", msg.ChannelID), config.ErrorField(err))
+	}
+}
+
 func (dg *Gateway) runtimeDependencies() gatewayruntime.Dependencies {
 	deps := dg.Runtime
 	deps.Broker = dg.Broker
@@ -660,6 +738,18 @@ func (dg *Gateway) resolveReplyContext(msg MessageCreate, emojiRE *regexp.Regexp
 			}
 			reply.Text = strings.TrimSpace(emojiRE.ReplaceAllString(fetched.Content, ":$1:"))
 			reply.IsFromBot = fetched.Author.ID == dg.BotID
+			// Remember the fetched target so later replies to the same
+			// message are served from the reply index instead of REST.
+			dg.rememberReply(referenced.ID, replyContext{
+				ChannelID:   msg.ChannelID,
+				SenderID:    fetched.Author.ID,
+				DisplayName: reply.SenderName,
+				Text:        reply.Text,
+				Attachments: fetched.Attachments,
+				Embeds:      fetched.Embeds,
+				IsFromBot:   reply.IsFromBot,
+				CreatedAt:   time.Now(),
+			})
 			if len(fetched.Attachments) > 0 {
 				remainingImageSlots := media.MaxImagesPerRequest - len(currentImages)
 				if remainingImageSlots > 0 {
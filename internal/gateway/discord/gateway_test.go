@@ -80,7 +80,7 @@ func TestDiscordMentionedGuildMessageStripsMentionAndResolvesMentions(t *testing
 	msg.Mentions = []struct {
 		ID       string `json:"id"`
 		Username string `json:"username"`
-	}{{ID: "456", Username: "Bob"}}
+	}{{ID: "bot-1", Username: "Oswald"}, {ID: "456", Username: "Bob"}}
 	dg.handleMessage(msg)
 
 	primary := primaryDiscordRequests(chat.requests)
@@ -125,6 +125,64 @@ func TestDiscordReplyToBotIncludesReplyContext(t *testing.T) {
 	}
 }
 
+func TestDiscordFetchedReplyTargetIsRemembered(t *testing.T) {
+	var fetches int
+	var mu sync.Mutex
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		mu.Lock()
+		fetches++
+		mu.Unlock()
+		_, _ = w.Write([]byte(`{"id":"target","content":"fetched reply","author":{"id":"456","username":"Bob"}}`))
+	}))
+	defer server.Close()
+	dg := &Gateway{BotID: "bot-1", APIBaseURL: server.URL, Log: config.NewLogger(config.LevelError), replyIndex: make(map[string]replyContext)}
+
+	msg := discordMessage("msg-2", "channel-1", "guild-1", "123", "Alice", "follow up")
+	msg.ReferencedMessage = &struct {
+		ID          string       `json:"id"`
+		Content     string       `json:"content"`
+		Attachments []Attachment `json:"attachments,omitempty"`
+		Embeds      []Embed      `json:"embeds,omitempty"`
+		Author      struct {
+			ID       string `json:"id"`
+			Username string `json:"username"`
+		} `json:"author"`
+	}{ID: "target"}
+	for i := 0; i < 2; i++ {
+		reply := dg.resolveReplyContext(msg, customEmojiRE, nil, "req")
+		if reply == nil || reply.SenderName != "Bob" || reply.Text != "fetched reply" {
+			t.Fatalf("unexpected reply context %+v", reply)
+		}
+	}
+	if fetches != 1 {
+		t.Fatalf("expected one REST fetch, got %d", fetches)
+	}
+}
+
+func TestDiscordDispatchRejectsWhenHandlersBusy(t *testing.T) {
+	rest := newFakeDiscordREST(t)
+	defer rest.server.Close()
+	dg := &Gateway{BotID: "bot-1", APIBaseURL: rest.server.URL, Log: config.NewLogger(config.LevelError), replyIndex: make(map[string]replyContext), handlers: gatewayruntime.NewHandlerPool(1)}
+	if !dg.handlers.TryAcquire() {
+		t.Fatal("expected a free handler slot")
+	}
+
+	dg.dispatchMessage(discordMessage("msg-1", "channel-1", "guild-1", "123", "Alice", "unaddressed chatter"))
+	dg.dispatchMessage(discordMessage("msg-2", "channel-1", "", "123", "Alice", "hello discord"))
+	deadline := time.Now().Add(2 * time.Second)
+	for len(rest.sentMessages()) == 0 && time.Now().Before(deadline) {
+		time.Sleep(5 * time.Millisecond)
+	}
+	if sent := rest.sentMessages(); len(sent) != 1 || sent[0]["content"] != gatewayruntime.OverloadedReply {
+		t.Fatalf("expected one overload reply for the addressed message, got %+v", sent)
+	}
+
+	dg.handlers.Release()
+	if !dg.handlers.TryAcquire() {
+		t.Fatal("expected released slot to be reusable")
+	}
+}
+
 func TestDiscordHelpers(t *testing.T) {
 	chunks := splitMessage("one. two three\nfour", 10)
 	if len(chunks) != 3 || chunks[0] != "one." || chunks[1] != "two three" || chunks[2] != "four" {
@@ -137,6 +195,10 @@ func TestDiscordHelpers(t *testing.T) {
 	if got := resolveMentions("hi <@123> and <@!999>", mentions); got != "hi @Alice and <@!999>" {
 		t.Fatalf("unexpected resolved mentions %q", got)
 	}
+	msg := MessageCreate{Mentions: mentions}
+	if !msg.mentionsUser("123") || msg.mentionsUser("999") || msg.mentionsUser("") {
+		t.Fatal("unexpected mentionsUser result")
+	}
 	if resolveGatewayURL("gateway.discord.gg") != "wss://gateway.discord.gg/?v=10&encoding=json" {
 		t.Fatal("unexpected resolved gateway URL")
 	}
@@ -3,6 +3,7 @@ package discord
 import (
 	"encoding/json"
 	"net/http"
+	"regexp"
 	"sync"
 	"time"
 
@@ -19,6 +20,11 @@ const (
 	intents    = 37377 // GUILDS | GUILD_MESSAGES | MESSAGE_CONTENT | DIRECT_MESSAGES
 )
 
+var (
+	userMentionRE = regexp.MustCompile(`<@!?(\d+)>`)
+	customEmojiRE = regexp.MustCompile(`<a?:([^:]+):\d+>`)
+)
+
 // Payload is a raw Discord gateway event envelope.
 type Payload struct {
 	Op int             `json:"op"`
@@ -71,6 +77,19 @@ type MessageCreate struct {
 	} `json:"referenced_message,omitempty"`
 }
 
+// mentionsUser reports whether userID appears in the message's mention list.
+func (m MessageCreate) mentionsUser(userID string) bool {
+	if userID == "" {
+		return false
+	}
+	for _, mention := range m.Mentions {
+		if mention.ID == userID {
+			return true
+		}
+	}
+	return false
+}
+
 // messageResponse is the minimal Discord API response for a fetched message.
 type messageResponse struct {
 	ID          string       `json:"id"`
@@ -142,6 +161,8 @@ type Gateway struct {
 	VideoFrames media.VideoFrameExtractor
 	replyMu     sync.RWMutex
 	replyIndex  map[string]replyContext
+	handlers    *gatewayruntime.HandlerPool
+	scopedLog   gatewayruntime.ScopedLog
 	sessionMu   sync.RWMutex
 	sessionID   string
 	resumeURL   string
@@ -150,7 +171,7 @@ type Gateway struct {
 }
 
 func (dg *Gateway) log() *config.Logger {
-	return dg.Log.Server("gateway.discord", config.F("gateway", "discord"))
+	return dg.scopedLog.Get(dg.Log, "discord")
 }
 
 func (dg *Gateway) apiBaseURL() string {
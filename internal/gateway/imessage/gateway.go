@@ -35,6 +35,12 @@ func (g *Gateway) Start(b *broker.Broker) error {
 	if g.contactNames == nil {
 		g.contactNames = make(map[string]contactNameCacheEntry)
 	}
+	if g.handlers == nil {
+		g.handlers = gatewayruntime.NewHandlerPool(gatewayruntime.MaxConcurrentHandlers)
+	}
+	if g.HTTPClient == nil {
+		g.HTTPClient = newHTTPClient()
+	}
 	g.refreshBlueBubblesCapabilitiesWithRetry(capabilityAttempts, capabilityRetryDelay)
 
 	path := strings.TrimSpace(g.WebhookPath)
@@ -49,7 +55,7 @@ func (g *Gateway) Start(b *broker.Broker) error {
 	mux.HandleFunc(path, g.handleWebhook)
 
 	log.Info("gateway.listen", "imessage gateway listening", config.F("port", g.Port), config.F("path", path))
-	return http.ListenAndServe(":"+g.Port, mux)
+	return gatewayruntime.NewHTTPServer(g.Port, mux).ListenAndServe()
 }
 
 // handleWebhook validates and dispatches incoming BlueBubbles webhook events.
@@ -102,7 +108,7 @@ func (g *Gateway) handleWebhook(w http.ResponseWriter, r *http.Request) {
 			w.WriteHeader(http.StatusNoContent)
 			return
 		}
-		go g.processIncomingMessage(event.Data)
+		g.dispatchMessage(event.Data)
 		w.WriteHeader(http.StatusAccepted)
 	case "typing-indicator":
 		g.logIgnoredMessage("typing_indicator", eventType, event.Data)
@@ -193,6 +199,98 @@ func associatedMessageTypeString(raw json.RawMessage) string {
 	return string(raw)
 }
 
+// messageInvocation describes how an inbound message addresses the bot and
+// whether preflight lets it through.
+type messageInvocation struct {
+	ReplyGUID           string
+	IsGroup             bool
+	SelectedMessageGUID string
+	MentionsBot         bool
+	IsReplyToBot        bool
+	TextWithoutMention  string
+	Preflight           routing.Decision
+}
+
+// invocation runs preflight on msg using only its text and the in-memory
+// message index, so it is cheap enough to run before a handler slot is held.
+func (g *Gateway) invocation(msg webhookMessage) messageInvocation {
+	chat := msg.primaryChat()
+	text := strings.TrimSpace(msg.Text)
+	inv := messageInvocation{
+		ReplyGUID:          msg.replyTargetGUID(),
+		IsGroup:            chat.Style == chatStyleGroup || strings.Contains(chat.GUID, ";+;"),
+		MentionsBot:        mentionRE.MatchString(text),
+		TextWithoutMention: text,
+	}
+	if inv.IsGroup {
+		inv.SelectedMessageGUID = msg.GUID
+	}
+	if inv.MentionsBot {
+		inv.TextWithoutMention = strings.TrimSpace(mentionRE.ReplaceAllString(text, ""))
+	}
+	if replyCtx, ok := g.lookupMessage(inv.ReplyGUID); ok {
+		inv.IsReplyToBot = replyCtx.IsFromBot
+	}
+	inv.Preflight = routing.Preflight(routing.PreflightInput{
+		IsGroup:      inv.IsGroup,
+		IsMention:    inv.MentionsBot,
+		IsReplyToBot: inv.IsReplyToBot,
+		Text:         inv.TextWithoutMention,
+	})
+	return inv
+}
+
+// dispatchMessage starts a handler for msg once it claims a handler slot,
+// without waiting for one. When every slot is busy an addressed message is
+// answered with an overload notice through the handler pool's notice queue,
+// so webhook bursts never pile up blocked handlers or unbounded sends.
+func (g *Gateway) dispatchMessage(msg webhookMessage) {
+	if g.handlers.TryAcquire() {
+		go func() {
+			defer g.handlers.Release()
+			g.processIncomingMessage(msg)
+		}()
+		return
+	}
+	chat := msg.primaryChat()
+	if chat.GUID == "" || strings.TrimSpace(msg.Handle.Address) == "" {
+		return
+	}
+	inv := g.invocation(msg)
+	if inv.Preflight.Action == routing.ActionIgnore {
+		return
+	}
+	queued := g.handlers.Notify(func() { g.sendOverloadNotice(msg, chat.GUID, inv.SelectedMessageGUID) })
+	g.log().Warn("gateway.message.overloaded", "rejected imessage message while all handlers are busy",
+		config.F("chat_id", chat.GUID),
+		config.F("status", "rejected"),
+		config.F("limit", gatewayruntime.MaxConcurrentHandlers),
+		config.F("notice_queued", queued),
+	)
+}
+
+// sendOverloadNotice tells the sender of msg that it was dropped, unless the
+// sender is banned. Unknown senders cannot be banned, so they are answered
+// without creating an account.
+func (g *Gateway) sendOverloadNotice(msg webhookMessage, chatGUID, selectedMessageGUID string) {
+	senderID := ""
+	if g.Links != nil {
+		canonicalUserID, _, err := g.Links.LookupAccount("imessage", msg.Handle.Address)
+		if err != nil {
+			g.log().Warn("gateway.message.overloaded_reply_failed", "failed to resolve imessage account for overload reply", config.F("chat_id", chatGUID), config.ErrorField(err))
+			return
+		}
+		senderID = canonicalUserID
+	}
+	err := gatewayruntime.SendOverloadNotice(g.runtimeDependencies(), senderID, func(text string) error {
+		_, err := g.sendTextReply(chatGUID, text, selectedMessageGUID, 0)
+		return err
+	})
+	if err != nil {
+		g.log().Warn("gateway.message.overloaded_reply_failed", "failed to send imessage overload reply", config.F("chat_id", chatGUID), config.ErrorField(err))
+	}
+}
+
 // processIncomingMessage normalizes an inbound iMessage and routes it to the broker.
 func (g *Gateway) processIncomingMessage(msg webhookMessage) {
 	log := g.log()
@@ -211,26 +309,13 @@ func (g *Gateway) processIncomingMessage(msg webhookMessage) {
 		return
 	}
 
-	text := strings.TrimSpace(msg.Text)
-	replyGUID := msg.replyTargetGUID()
-	isGroup := chat.Style == chatStyleGroup || strings.Contains(chat.GUID, ";+;")
-	selectedMessageGUID := ""
-	if isGroup {
-		selectedMessageGUID = msg.GUID
-	}
-	mentionsBot := mentionRE.MatchString(text)
-	textWithoutMention := strings.TrimSpace(mentionRE.ReplaceAllString(text, ""))
+	inv := g.invocation(msg)
+	replyGUID := inv.ReplyGUID
+	isGroup, selectedMessageGUID := inv.IsGroup, inv.SelectedMessageGUID
+	mentionsBot, textWithoutMention := inv.MentionsBot, inv.TextWithoutMention
 	currentIsCommandAttempt := routing.IsCommandAttempt(textWithoutMention)
-	currentIsReplyToBot := false
-	if replyCtx, ok := g.lookupMessage(replyGUID); ok {
-		currentIsReplyToBot = replyCtx.IsFromBot
-	}
-	preflight := routing.Preflight(routing.PreflightInput{
-		IsGroup:      isGroup,
-		IsMention:    mentionsBot,
-		IsReplyToBot: currentIsReplyToBot,
-		Text:         textWithoutMention,
-	})
+	currentIsReplyToBot := inv.IsReplyToBot
+	preflight := inv.Preflight
 	if preflight.Action == routing.ActionIgnore {
 		g.logIgnoredMessage(preflight.Reason, "new-message", msg,
 			config.F("request_id", requestID),
@@ -210,6 +210,33 @@ func TestIMessageWebhookGroupWithoutMentionSkips(t *testing.T) {
 	}
 }
 
+func TestIMessageWebhookRepliesOverloadedWhenHandlersBusy(t *testing.T) {
+	bb := newFakeBlueBubbles(t)
+	g, b, chat := newIMessageTestGateway(t, bb.server.URL)
+	defer b.Shutdown()
+	defer bb.server.Close()
+	g.handlers = gatewayruntime.NewHandlerPool(1)
+	if !g.handlers.TryAcquire() {
+		t.Fatal("expected a free handler slot")
+	}
+
+	postIMessageWebhook(t, g, `{"type":"new-message","data":{"guid":"msg-1","text":"casual group chatter","isFromMe":false,"handle":{"address":"+15551234567"},"chats":[{"guid":"chat;+;group","style":43}]}}`)
+	rec := postIMessageWebhook(t, g, `{"type":"new-message","data":{"guid":"msg-2","text":"hello from webhook","isFromMe":false,"handle":{"address":"+15551234567"},"chats":[{"guid":"chat-direct","style":45}]}}`)
+
+	if rec.Code != http.StatusAccepted {
+		t.Fatalf("expected accepted, got %d", rec.Code)
+	}
+	if !bb.waitForSentCount(1) {
+		t.Fatalf("expected overload reply, got %+v", bb.sentMessages())
+	}
+	if sent := bb.sentMessages(); len(sent) != 1 || sent[0].Message != gatewayruntime.OverloadedReply {
+		t.Fatalf("expected one overload reply for the addressed message, got %+v", sent)
+	}
+	if len(chat.primaryRequests()) != 0 {
+		t.Fatalf("expected no LLM request while overloaded, got %d", len(chat.primaryRequests()))
+	}
+}
+
 func TestIMessageWebhookIgnoresSelfAuthoredMessage(t *testing.T) {
 	bb := newFakeBlueBubbles(t)
 	g, b, chat := newIMessageTestGateway(t, bb.server.URL)
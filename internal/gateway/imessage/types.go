@@ -23,6 +23,9 @@ const (
 	typingAfterReadDelay = 150 * time.Millisecond
 	messageIndexTTL      = time.Hour
 	contactCacheTTL      = 6 * time.Hour
+
+	// blueBubblesHTTPTimeout is the per-request timeout for BlueBubbles REST calls.
+	blueBubblesHTTPTimeout = 15 * time.Second
 )
 
 var mentionRE = regexp.MustCompile(`@?Oswald\b`)
@@ -46,10 +49,12 @@ type Gateway struct {
 	messageIndex        map[string]messageContext
 	contactMu           sync.RWMutex
 	contactNames        map[string]contactNameCacheEntry
+	handlers            *gatewayruntime.HandlerPool
+	scopedLog           gatewayruntime.ScopedLog
 }
 
 func (g *Gateway) log() *config.Logger {
-	return g.Log.Server("gateway.imessage", config.F("gateway", "imessage"))
+	return g.scopedLog.Get(g.Log, "imessage")
 }
 
 type webhookEvent struct {
@@ -180,5 +185,16 @@ func (g *Gateway) httpClient() *http.Client {
 	if g.HTTPClient != nil {
 		return g.HTTPClient
 	}
-	return &http.Client{Timeout: 15 * time.Second}
+	return &http.Client{Timeout: blueBubblesHTTPTimeout}
+}
+
+// newHTTPClient returns the client Start installs for BlueBubbles calls. Its
+// dedicated transport keeps one idle connection per concurrent handler so
+// replies, typing indicators and contact lookups reuse connections instead
+// of redialing past the default transport's two idle slots per host.
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = gatewayruntime.MaxConcurrentHandlers
+	transport.MaxIdleConnsPerHost = gatewayruntime.MaxConcurrentHandlers
+	return &http.Client{Timeout: blueBubblesHTTPTimeout, Transport: transport}
 }
@@ -0,0 +1,94 @@
+package runtime
+
+import "sync"
+
+const (
+	// MaxConcurrentHandlers bounds in-flight message handlers per gateway so a
+	// burst of events cannot fan out unbounded REST, attachment, and database
+	// work. A handler holds its slot for the whole request, including the
+	// agent run or local command it triggers.
+	MaxConcurrentHandlers = 16
+
+	// OverloadedReply answers an addressed message that arrives while every
+	// handler slot is busy.
+	OverloadedReply = "I'm overloaded right now. Please try again in a moment."
+
+	// overloadNoticeQueueSize bounds overload replies waiting to be sent.
+	// Notices beyond it are dropped rather than queued.
+	overloadNoticeQueueSize = 8
+)
+
+// HandlerPool bounds a gateway's in-flight message handlers. Messages that
+// find every slot busy are answered by a single notice worker fed from a
+// short queue, so a burst of rejections never fans out REST calls of its own.
+type HandlerPool struct {
+	slots       chan struct{}
+	notices     chan func()
+	startWorker sync.Once
+}
+
+// NewHandlerPool returns a pool with size handler slots.
+func NewHandlerPool(size int) *HandlerPool {
+	return &HandlerPool{
+		slots:   make(chan struct{}, size),
+		notices: make(chan func(), overloadNoticeQueueSize),
+	}
+}
+
+// TryAcquire claims a handler slot without waiting and reports whether one
+// was free. A nil pool, as on gateways built without Start in tests, never
+// runs out of slots.
+func (p *HandlerPool) TryAcquire() bool {
+	if p == nil {
+		return true
+	}
+	select {
+	case p.slots <- struct{}{}:
+		return true
+	default:
+		return false
+	}
+}
+
+// Release frees a slot claimed by TryAcquire.
+func (p *HandlerPool) Release() {
+	if p != nil {
+		<-p.slots
+	}
+}
+
+// Notify queues send for the pool's notice worker without blocking and
+// reports whether it was queued. Notices are dropped while the queue is full.
+func (p *HandlerPool) Notify(send func()) bool {
+	if p == nil {
+		return false
+	}
+	p.startWorker.Do(func() {
+		go func() {
+			for send := range p.notices {
+				send()
+			}
+		}()
+	})
+	select {
+	case p.notices <- send:
+		return true
+	default:
+		return false
+	}
+}
+
+// SendOverloadNotice sends OverloadedReply to senderID unless the access
+// check Execute applies finds the user banned. Banned users get no reply.
+func SendOverloadNotice(deps Dependencies, senderID string, send func(text string) error) error {
+	if deps.Access != nil && senderID != "" {
+		isBanned, _, err := deps.Access.BanStatus(senderID)
+		if err != nil {
+			return err
+		}
+		if isBanned {
+			return nil
+		}
+	}
+	return send(OverloadedReply)
+}
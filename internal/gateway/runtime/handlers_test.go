@@ -0,0 +1,52 @@
+package runtime
+
+import "testing"
+
+func TestHandlerPoolBoundsSlotsAndNotices(t *testing.T) {
+	pool := NewHandlerPool(1)
+	if !pool.TryAcquire() {
+		t.Fatal("expected a free handler slot")
+	}
+	if pool.TryAcquire() {
+		t.Fatal("expected the pool to be full")
+	}
+
+	release := make(chan struct{})
+	started := make(chan struct{})
+	if !pool.Notify(func() { close(started); <-release }) {
+		t.Fatal("expected first notice to be queued")
+	}
+	<-started
+	queued := 0
+	for i := 0; i < overloadNoticeQueueSize+4; i++ {
+		if pool.Notify(func() {}) {
+			queued++
+		}
+	}
+	close(release)
+	if queued != overloadNoticeQueueSize {
+		t.Fatalf("queued %d notices behind a busy worker, want %d", queued, overloadNoticeQueueSize)
+	}
+
+	pool.Release()
+	if !pool.TryAcquire() {
+		t.Fatal("expected released slot to be reusable")
+	}
+}
+
+func TestSendOverloadNoticeSkipsBannedUsers(t *testing.T) {
+	var sent []string
+	send := func(text string) error {
+		sent = append(sent, text)
+		return nil
+	}
+	if err := SendOverloadNotice(Dependencies{Access: fakeAccess{banned: true}}, "usr_banned", send); err != nil {
+		t.Fatalf("banned notice: %v", err)
+	}
+	if err := SendOverloadNotice(Dependencies{Access: fakeAccess{}}, "usr_ok", send); err != nil {
+		t.Fatalf("notice: %v", err)
+	}
+	if len(sent) != 1 || sent[0] != OverloadedReply {
+		t.Fatalf("sent = %q, want one overload reply for the unbanned user", sent)
+	}
+}
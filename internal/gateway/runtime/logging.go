@@ -0,0 +1,22 @@
+package runtime
+
+import (
+	"sync"
+
+	"github.com/jonahgcarpenter/oswald-ai/internal/config"
+)
+
+// ScopedLog lazily derives and caches a gateway's component logger so the
+// gateway fields are merged once instead of on every log call.
+type ScopedLog struct {
+	once sync.Once
+	log  *config.Logger
+}
+
+// Get returns base scoped to the named gateway, deriving it on first use.
+func (s *ScopedLog) Get(base *config.Logger, gateway string) *config.Logger {
+	s.once.Do(func() {
+		s.log = base.Server("gateway."+gateway, config.F("gateway", gateway))
+	})
+	return s.log
+}
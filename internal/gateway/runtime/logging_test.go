@@ -0,0 +1,19 @@
+package runtime
+
+import (
+	"testing"
+
+	"github.com/jonahgcarpenter/oswald-ai/internal/config"
+)
+
+func TestScopedLogDerivesOnce(t *testing.T) {
+	var scoped ScopedLog
+	base := config.NewLogger(config.LevelError)
+	first := scoped.Get(base, "discord")
+	if first == nil || first == base {
+		t.Fatalf("expected derived gateway logger, got %p", first)
+	}
+	if second := scoped.Get(base, "discord"); second != first {
+		t.Fatal("expected cached gateway logger on subsequent calls")
+	}
+}
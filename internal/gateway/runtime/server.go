@@ -0,0 +1,26 @@
+package runtime
+
+import (
+	"net/http"
+	"time"
+)
+
+const (
+	// listenerReadHeaderTimeout bounds how long a client may take to send
+	// request headers before the connection is dropped.
+	listenerReadHeaderTimeout = 10 * time.Second
+	// listenerIdleTimeout keeps idle keep-alive connections open long enough
+	// for webhook bursts to reuse them without holding sockets indefinitely.
+	listenerIdleTimeout = 30 * time.Second
+)
+
+// NewHTTPServer returns an HTTP server for a gateway listener on port with
+// header and keep-alive idle timeouts applied.
+func NewHTTPServer(port string, handler http.Handler) *http.Server {
+	return &http.Server{
+		Addr:              ":" + port,
+		Handler:           handler,
+		ReadHeaderTimeout: listenerReadHeaderTimeout,
+		IdleTimeout:       listenerIdleTimeout,
+	}
+}
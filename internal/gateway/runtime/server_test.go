@@ -0,0 +1,20 @@
+package runtime
+
+import (
+	"net/http"
+	"testing"
+)
+
+func TestNewHTTPServerAppliesListenerTimeouts(t *testing.T) {
+	handler := http.NewServeMux()
+	srv := NewHTTPServer("8080", handler)
+	if srv.Addr != ":8080" {
+		t.Fatalf("expected :8080, got %q", srv.Addr)
+	}
+	if srv.Handler != handler {
+		t.Fatal("expected handler to be preserved")
+	}
+	if srv.ReadHeaderTimeout != listenerReadHeaderTimeout || srv.IdleTimeout != listenerIdleTimeout {
+		t.Fatalf("unexpected timeouts: header=%s idle=%s", srv.ReadHeaderTimeout, srv.IdleTimeout)
+	}
+}
@@ -3,6 +3,7 @@ package websocket
 import (
 	"encoding/base64"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"net/http"
 	"strings"
@@ -29,7 +30,7 @@ func (wg *Gateway) Start(b *broker.Broker) error {
 	})
 
 	log.Info("gateway.listen", "websocket gateway listening", config.F("port", wg.Port))
-	return http.ListenAndServe(":"+wg.Port, nil)
+	return gatewayruntime.NewHTTPServer(wg.Port, nil).ListenAndServe()
 }
 
 // handleConnections accepts WebSocket connections and routes prompts to the broker.
@@ -90,9 +91,7 @@ func (wg *Gateway) handleConnections(w http.ResponseWriter, r *http.Request, b *
 		}
 		normalizedUserID, normErr := accountlinking.NormalizeIdentifier("websocket", userID)
 		if normErr != nil {
-			errorPayload := agent.AgentResponse{Error: normErr.Error()}
-			errBytes, _ := json.Marshal(errorPayload)
-			conn.WriteMessage(messageType, errBytes) // nolint: errcheck
+			writeJSON(conn, messageType, agent.AgentResponse{Error: normErr.Error()}) // nolint: errcheck
 			continue
 		}
 		sessionKey := "websocket:" + sessionIdentity
@@ -105,9 +104,7 @@ func (wg *Gateway) handleConnections(w http.ResponseWriter, r *http.Request, b *
 				config.F("user_id", normalizedUserID),
 				config.ErrorField(err),
 			)
-			errorPayload := agent.AgentResponse{Error: "Failed to resolve account identity"}
-			errBytes, _ := json.Marshal(errorPayload)
-			conn.WriteMessage(messageType, errBytes) // nolint: errcheck
+			writeJSON(conn, messageType, agent.AgentResponse{Error: "Failed to resolve account identity"}) // nolint: errcheck
 			continue
 		}
 
@@ -117,12 +114,9 @@ func (wg *Gateway) handleConnections(w http.ResponseWriter, r *http.Request, b *
 				log.Debug("gateway.stream.started", "started websocket stream", config.F("request_id", requestID), config.F("stream_type", string(chunk.Type)))
 				firstChunk = false
 			}
-			chunkBytes, err := json.Marshal(chunk)
-			if err != nil {
+			if err := writeJSON(conn, messageType, chunk); errors.Is(err, errEncodePayload) {
 				log.Warn("gateway.stream.marshal_failed", "failed to marshal websocket stream chunk", config.F("request_id", requestID), config.F("status", "degraded"), config.ErrorField(err))
-				return
 			}
-			conn.WriteMessage(messageType, chunkBytes) // nolint: errcheck
 		}
 
 		gatewayruntime.Execute(gatewayruntime.Request{
@@ -142,6 +142,39 @@ func newWebSocketTestGateway(t *testing.T) (*Gateway, *broker.Broker, *wsFakeCha
 	return wg, b, chat
 }
 
+func TestWriteJSONSkipsUnencodablePayloadAndTrailingNewline(t *testing.T) {
+	upgrader := gorilla.Upgrader{}
+	writeErr := make(chan error, 1)
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		conn, err := upgrader.Upgrade(w, r, nil)
+		if err != nil {
+			writeErr <- err
+			return
+		}
+		defer conn.Close()
+		writeErr <- writeJSON(conn, gorilla.TextMessage, map[string]interface{}{"bad": make(chan int)})
+		_ = writeJSON(conn, gorilla.TextMessage, agent.AgentResponse{Response: "ok"})
+		_, _, _ = conn.ReadMessage()
+	}))
+	defer server.Close()
+
+	conn := dialWebSocket(t, server.URL)
+	defer conn.Close()
+	if err := conn.SetReadDeadline(time.Now().Add(2 * time.Second)); err != nil {
+		t.Fatalf("set read deadline: %v", err)
+	}
+	_, payload, err := conn.ReadMessage()
+	if err != nil {
+		t.Fatalf("read frame: %v", err)
+	}
+	if err := <-writeErr; err == nil {
+		t.Fatal("expected unencodable payload to fail")
+	}
+	if string(payload) != `{"model":"","response":"ok"}` {
+		t.Fatalf("first frame = %q, want only the encodable payload without a trailing newline", payload)
+	}
+}
+
 func dialWebSocket(t *testing.T, serverURL string) *gorilla.Conn {
 	t.Helper()
 	wsURL := "ws" + strings.TrimPrefix(serverURL, "http")
@@ -1,7 +1,11 @@
 package websocket
 
 import (
+	"bytes"
 	"encoding/json"
+	"errors"
+	"fmt"
+	"sync"
 
 	gorilla "github.com/gorilla/websocket"
 
@@ -37,9 +41,34 @@ func (r *runtimeResponder) SendAgentResponse(response *agent.AgentResponse) erro
 }
 
 func (r *runtimeResponder) write(response agent.AgentResponse) error {
-	jsonBytes, err := json.Marshal(response)
-	if err != nil {
-		return err
+	return writeJSON(r.conn, r.messageType, response)
+}
+
+// maxPooledJSONBuffer caps the size of buffers returned to jsonBuffers so one
+// large response does not pin its memory for the life of the process.
+const maxPooledJSONBuffer = 64 << 10
+
+// jsonBuffers holds reusable encode buffers for outgoing frames.
+var jsonBuffers = sync.Pool{New: func() any { return new(bytes.Buffer) }}
+
+// errEncodePayload marks a payload that could not be encoded; nothing was
+// sent for it.
+var errEncodePayload = errors.New("encode websocket payload")
+
+// writeJSON encodes v into a pooled buffer and sends it as one frame only
+// after encoding succeeds, so a payload that fails partway is never sent
+// truncated. The encoder's trailing newline is dropped so frames match
+// json.Marshal output.
+func writeJSON(conn *gorilla.Conn, messageType int, v any) error {
+	buf := jsonBuffers.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledJSONBuffer {
+			jsonBuffers.Put(buf)
+		}
+	}()
+	if err := json.NewEncoder(buf).Encode(v); err != nil {
+		return fmt.Errorf("%w: %w", errEncodePayload, err)
 	}
-	return r.conn.WriteMessage(r.messageType, jsonBytes)
+	return conn.WriteMessage(messageType, bytes.TrimSuffix(buf.Bytes(), []byte("\n")))
 }
@@ -12,14 +12,15 @@ import (
 
 // Gateway handles local WebSocket connections for testing and client access.
 type Gateway struct {
-	Port    string
-	Links   *accountlinking.Service
-	Runtime gatewayruntime.Dependencies
-	Log     *config.Logger
+	Port      string
+	Links     *accountlinking.Service
+	Runtime   gatewayruntime.Dependencies
+	Log       *config.Logger
+	scopedLog gatewayruntime.ScopedLog
 }
 
 func (wg *Gateway) log() *config.Logger {
-	return wg.Log.Server("gateway.websocket", config.F("gateway", "websocket"))
+	return wg.scopedLog.Get(wg.Log, "websocket")
 }
 
 // IncomingMessage is the JSON payload clients send over the WebSocket connection.
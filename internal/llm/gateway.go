@@ -9,6 +9,7 @@ import (
 	"fmt"
 	"io"
 	"net/http"
+	"sort"
 	"strings"
 	"time"
 
@@ -53,6 +54,15 @@ func IsOllamaModelRunnerStoppedError(err error) bool {
 	return strings.Contains(strings.ToLower(httpErr.Body), "model runner has unexpectedly stopped")
 }
 
+// maxIdleConnsPerHost keeps enough warm keep-alive connections to the gateway
+// for every broker worker and concurrent embedding call; net/http defaults to 2.
+const maxIdleConnsPerHost = 16
+
+var (
+	sseDataPrefix = []byte("data:")
+	sseDoneMarker = []byte("[DONE]")
+)
+
 // GatewayClient interacts with the LLM gateway's OpenAI-compatible REST API.
 type GatewayClient struct {
 	BaseURL    string
@@ -69,12 +79,22 @@ func NewGatewayClient(baseURL, apiKey, virtualKey string, timeout time.Duration,
 		APIKey:     strings.TrimSpace(apiKey),
 		VirtualKey: strings.TrimSpace(virtualKey),
 		HTTPClient: &http.Client{
-			Timeout: timeout,
+			Timeout:   timeout,
+			Transport: newTransport(),
 		},
 		log: log,
 	}
 }
 
+// newTransport returns a dedicated pooled transport so concurrent requests to
+// the single gateway host reuse connections instead of redialing.
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = maxIdleConnsPerHost * 2
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	return transport
+}
+
 func (c *GatewayClient) applyHeaders(req *http.Request) {
 	req.Header.Set("Content-Type", "application/json")
 	if c.APIKey != "" {
@@ -101,11 +121,70 @@ func decodeToolArguments(raw string) map[string]interface{} {
 	if raw == "" {
 		return map[string]interface{}{}
 	}
-	var args map[string]interface{}
-	if err := json.Unmarshal([]byte(raw), &args); err != nil {
-		return map[string]interface{}{"_raw": raw}
+	if raw[0] == '{' {
+		var args map[string]interface{}
+		if err := json.Unmarshal([]byte(raw), &args); err == nil {
+			return args
+		}
+	}
+	// Payloads that are valid JSON of another type, such as an array, are
+	// passed through as _raw; only objects wrapped in prose or code fences
+	// are recovered.
+	if !json.Valid([]byte(raw)) {
+		if args, ok := extractJSONObject(raw); ok {
+			return args
+		}
 	}
-	return args
+	return map[string]interface{}{"_raw": raw}
+}
+
+// extractJSONObject decodes the first complete JSON object embedded in text,
+// such as arguments wrapped in a code fence or followed by prose. Candidate
+// objects are delimited with a byte-level brace scan first, so only balanced
+// spans are handed to the JSON decoder and stray braces in trailing text are
+// never consulted.
+func extractJSONObject(text string) (map[string]interface{}, bool) {
+	for _, span := range balancedObjectSpans(text) {
+		var obj map[string]interface{}
+		if err := json.Unmarshal([]byte(text[span[0]:span[1]]), &obj); err == nil {
+			return obj, true
+		}
+	}
+	return nil, false
+}
+
+// balancedObjectSpans returns the [start, end) offsets of every balanced
+// brace pair in text, ordered by start. It makes a single pass, keeping a
+// stack of open-brace offsets; braces inside string literals, including
+// escaped quotes, do not count, and quotes outside any brace are ignored so
+// prose cannot open a string. Unclosed braces produce no span.
+func balancedObjectSpans(text string) [][2]int {
+	var spans [][2]int
+	var open []int
+	inString, escaped := false, false
+	for i := 0; i < len(text); i++ {
+		c := text[i]
+		switch {
+		case escaped:
+			escaped = false
+		case inString:
+			if c == '\\' {
+				escaped = true
+			} else if c == '"' {
+				inString = false
+			}
+		case c == '"' && len(open) > 0:
+			inString = true
+		case c == '{':
+			open = append(open, i)
+		case c == '}' && len(open) > 0:
+			start := open[len(open)-1]
+			open = open[:len(open)-1]
+			spans = append(spans, [2]int{start, i + 1})
+		}
+	}
+	sort.Slice(spans, func(a, b int) bool { return spans[a][0] < spans[b][0] })
+	return spans
 }
 
 func mapToGatewayMessages(msgs []ChatMessage) []gatewayMessage {
@@ -391,19 +470,18 @@ func (c *GatewayClient) readChatStream(ctx context.Context, resp *http.Response,
 	scanner := bufio.NewScanner(resp.Body)
 	scanner.Buffer(make([]byte, 1024*1024), 1024*1024)
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
-		if !strings.HasPrefix(line, "data:") {
+		// Work on the scanner's buffer directly so each chunk is decoded
+		// without first being copied into a string and back into bytes.
+		line := bytes.TrimSpace(scanner.Bytes())
+		if !bytes.HasPrefix(line, sseDataPrefix) {
 			continue
 		}
-		payload := strings.TrimSpace(strings.TrimPrefix(line, "data:"))
-		if payload == "[DONE]" {
+		payload := bytes.TrimSpace(line[len(sseDataPrefix):])
+		if bytes.Equal(payload, sseDoneMarker) {
 			break
 		}
 		var chunk gatewayChatResponse
-		if err := json.Unmarshal([]byte(payload), &chunk); err != nil {
+		if err := json.Unmarshal(payload, &chunk); err != nil {
 			requestLog.Warn("provider.gateway.chat.stream.parse_failed", "failed to parse LLM gateway chat stream chunk", config.F("operation", "chat_stream"), config.F("status", "degraded"), config.ErrorField(err))
 			continue
 		}
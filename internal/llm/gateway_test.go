@@ -2,7 +2,9 @@ package llm
 
 import (
 	"encoding/json"
+	"net/http"
 	"testing"
+	"time"
 )
 
 func TestMapToGatewayMessagesSerializesImagesAsDataURLs(t *testing.T) {
@@ -97,3 +99,58 @@ func TestDecodeToolArgumentsFallsBackToRaw(t *testing.T) {
 		t.Fatal("expected json alias to json_object")
 	}
 }
+
+func TestDecodeToolArgumentsExtractsEmbeddedObject(t *testing.T) {
+	got := decodeToolArguments("```json\n{\"query\": \"weather {today}\"}\n```\nLet me know if you need more }")
+	if got["query"] != "weather {today}" {
+		t.Fatalf("unexpected decoded args: %+v", got)
+	}
+
+	got = decodeToolArguments("call {broken then {\"n\": 1} done")
+	if got["n"] != float64(1) {
+		t.Fatalf("expected first valid object, got %+v", got)
+	}
+}
+
+func TestDecodeToolArgumentsKeepsNonObjectJSONRaw(t *testing.T) {
+	raw := `[{"a":1},{"b":2}]`
+	got := decodeToolArguments(raw)
+	if len(got) != 1 || got["_raw"] != raw {
+		t.Fatalf("expected array payload passed through as _raw, got %+v", got)
+	}
+}
+
+func TestBalancedObjectSpansIgnoresBracesInStrings(t *testing.T) {
+	text := `x {"a": "}{\"}", "b": {"c": 1}} tail }`
+	spans := balancedObjectSpans(text)
+	if len(spans) != 2 {
+		t.Fatalf("expected outer and nested spans, got %v", spans)
+	}
+	if got := text[spans[0][0]:spans[0][1]]; got != `{"a": "}{\"}", "b": {"c": 1}}` {
+		t.Fatalf("unexpected outer object span %q", got)
+	}
+	if got := text[spans[1][0]:spans[1][1]]; got != `{"c": 1}` {
+		t.Fatalf("unexpected nested object span %q", got)
+	}
+	spans = balancedObjectSpans(`{"open": {"x": 1}`)
+	if len(spans) != 1 || spans[0] != [2]int{9, 17} {
+		t.Fatalf("expected only the closed inner span, got %v", spans)
+	}
+}
+
+func TestNewGatewayClientUsesPooledTransport(t *testing.T) {
+	client := NewGatewayClient("http://gateway/", "", "", time.Minute, nil)
+	transport, ok := client.HTTPClient.Transport.(*http.Transport)
+	if !ok {
+		t.Fatalf("expected dedicated *http.Transport, got %T", client.HTTPClient.Transport)
+	}
+	if transport == http.DefaultTransport {
+		t.Fatal("expected transport separate from http.DefaultTransport")
+	}
+	if transport.MaxIdleConnsPerHost != maxIdleConnsPerHost {
+		t.Fatalf("MaxIdleConnsPerHost = %d, want %d", transport.MaxIdleConnsPerHost, maxIdleConnsPerHost)
+	}
+	if client.HTTPClient.Timeout != time.Minute {
+		t.Fatalf("Timeout = %s, want 1m", client.HTTPClient.Timeout)
+	}
+}
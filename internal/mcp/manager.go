@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"net/http"
+	"slices"
 	"sort"
 	"strings"
 	"sync"
@@ -17,15 +18,57 @@ import (
 
 // Manager owns scoped MCP client sessions and resolves tools for active users.
 type Manager struct {
-	store    *Store
-	sessions map[string]*server
-	mu       sync.Mutex
-	log      *config.Logger
+	store      *Store
+	sessions   map[string]*server
+	connecting map[string]*pendingConnect
+	mu         sync.Mutex
+	results    toolResultCache
+	log        *config.Logger
+}
+
+// mcpConnectTimeout bounds a shared connection attempt, including URL
+// validation and tool listing, independent of the callers waiting on it.
+const mcpConnectTimeout = time.Minute
+
+// pendingConnect is an in-flight connection attempt that concurrent callers
+// for the same server wait on instead of dialing a second session.
+type pendingConnect struct {
+	done chan struct{}
+	srv  *server
+	err  error
 }
 
 // NewManagerFromStore creates a DB-backed MCP manager.
 func NewManagerFromStore(store *Store, log *config.Logger) *Manager {
-	return &Manager{store: store, sessions: make(map[string]*server), log: log.Server("mcp.manager")}
+	return &Manager{store: store, sessions: make(map[string]*server), connecting: make(map[string]*pendingConnect), log: log.Server("mcp.manager")}
+}
+
+// Warm connects every enabled global MCP server so the first request that
+// needs their tools does not pay the connect latency. Failures are recorded
+// as server errors exactly as they would be on first use.
+func (m *Manager) Warm(ctx context.Context) {
+	if m == nil || m.store == nil {
+		return
+	}
+	configs, err := m.store.ListGlobal(ctx)
+	if err != nil {
+		m.log.Warn("mcp.warm.list_failed", "failed to list global MCP servers", config.F("status", "degraded"), config.ErrorField(err))
+		return
+	}
+	var wg sync.WaitGroup
+	for _, cfg := range configs {
+		if !cfg.Enabled {
+			continue
+		}
+		wg.Add(1)
+		go func(cfg ServerConfig) {
+			defer wg.Done()
+			if _, err := m.ensureConnected(ctx, cfg); err != nil {
+				m.log.Warn("mcp.server.connect_failed", "failed to connect MCP server", config.F("server", cfg.Name), config.F("scope", cfg.Scope), config.F("status", "degraded"), config.ErrorField(err))
+			}
+		}(cfg)
+	}
+	wg.Wait()
 }
 
 // ServerInfos returns global and user-scoped MCP server metadata visible to userID.
@@ -77,27 +120,6 @@ func (m *Manager) ServerInfo(ctx context.Context, userID string, name string) (S
 	return ServerInfo{}, false
 }
 
-// ToolSpecs returns currently connected tools visible to userID.
-func (m *Manager) ToolSpecs(ctx context.Context, userID string) []ToolSpec {
-	configs, err := m.store.ListForUser(ctx, userID)
-	if err != nil {
-		return nil
-	}
-	var specs []ToolSpec
-	for _, cfg := range configs {
-		if !cfg.Enabled {
-			continue
-		}
-		srv, err := m.ensureConnected(ctx, cfg)
-		if err != nil {
-			m.log.Warn("mcp.server.connect_failed", "failed to connect MCP server", config.F("server", cfg.Name), config.F("scope", cfg.Scope), config.F("status", "degraded"), config.ErrorField(err))
-			continue
-		}
-		specs = append(specs, srv.tools...)
-	}
-	return specs
-}
-
 // ServerToolSpecs returns tools for a single visible server, connecting lazily.
 func (m *Manager) ServerToolSpecs(ctx context.Context, userID, name string) ([]ToolSpec, ServerInfo, error) {
 	cfg, ok, err := m.resolveConfig(ctx, userID, name)
@@ -135,7 +157,7 @@ func (m *Manager) Execute(ctx context.Context, userID string, toolName string, a
 	}
 	for _, tool := range tols {
 		if tool.RemoteName == remoteName || tool.Name == toolName {
-			return tool.Handler(ctx, args)
+			return m.callTool(ctx, tool, args)
 		}
 	}
 	return "", fmt.Errorf("MCP tool %q is not available", toolName)
@@ -175,6 +197,7 @@ func (m *Manager) Invalidate(scope, ownerUserID, name string) {
 		srv.close() // nolint:errcheck
 	}
 	delete(m.sessions, key)
+	m.results.invalidate(key)
 }
 
 func (m *Manager) cached(key string) *server {
@@ -183,22 +206,69 @@ func (m *Manager) cached(key string) *server {
 	return m.sessions[key]
 }
 
+// resolveConfig finds the server named name visible to userID, preferring a
+// global server over a user-scoped one. It reads the store's cached visible
+// list so per-tool-call lookups do not query and decrypt rows again.
 func (m *Manager) resolveConfig(ctx context.Context, userID, name string) (ServerConfig, bool, error) {
 	name = strings.TrimSpace(strings.ToLower(name))
-	if cfg, ok, err := m.store.Get(ctx, ScopeGlobal, "", name); err != nil || ok {
-		return cfg, ok, err
+	configs, err := m.store.ListForUser(ctx, userID)
+	if err != nil {
+		return ServerConfig{}, false, err
 	}
-	if strings.TrimSpace(userID) == "" {
-		return ServerConfig{}, false, nil
+	var userCfg ServerConfig
+	found := false
+	for _, cfg := range configs {
+		if cfg.Name != name {
+			continue
+		}
+		if cfg.Scope == ScopeGlobal {
+			return cfg, true, nil
+		}
+		userCfg, found = cfg, true
 	}
-	return m.store.Get(ctx, ScopeUser, userID, name)
+	return userCfg, found, nil
 }
 
+// ensureConnected returns the live session for cfg, connecting it if needed.
+// Concurrent callers for the same server share one connection attempt. The
+// attempt runs detached from any caller's cancellation, bounded only by
+// mcpConnectTimeout, and each caller stops waiting when its own ctx ends.
 func (m *Manager) ensureConnected(ctx context.Context, cfg ServerConfig) (*server, error) {
 	key := scopeKey(cfg)
-	if srv := m.cached(key); srv != nil && srv.reason == "" {
+	m.mu.Lock()
+	if srv := m.sessions[key]; srv != nil && srv.reason == "" {
+		m.mu.Unlock()
 		return srv, nil
 	}
+	pending := m.connecting[key]
+	if pending == nil {
+		pending = &pendingConnect{done: make(chan struct{})}
+		m.connecting[key] = pending
+		go m.runConnect(context.WithoutCancel(ctx), key, cfg, pending)
+	}
+	m.mu.Unlock()
+	select {
+	case <-pending.done:
+		return pending.srv, pending.err
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+// runConnect performs the shared connection attempt behind pending and
+// releases its waiters once it finishes.
+func (m *Manager) runConnect(ctx context.Context, key string, cfg ServerConfig, pending *pendingConnect) {
+	ctx, cancel := context.WithTimeout(ctx, mcpConnectTimeout)
+	defer cancel()
+	pending.srv, pending.err = m.connect(ctx, key, cfg)
+	m.mu.Lock()
+	delete(m.connecting, key)
+	m.mu.Unlock()
+	close(pending.done)
+}
+
+// connect dials cfg and caches the resulting session under key.
+func (m *Manager) connect(ctx context.Context, key string, cfg ServerConfig) (*server, error) {
 	if _, err := parseAndValidateURL(ctx, cfg.URL, m.store.resolver); err != nil {
 		m.rememberError(key, cfg, err)
 		return nil, err
@@ -297,10 +367,14 @@ func toolSpec(cfg ServerConfig, tool *gomcp.Tool, session *gomcp.ClientSession,
 	if description == "" {
 		description = strings.TrimSpace(tool.Title)
 	}
-	return ToolSpec{Name: localName, Description: description, Server: cfg.Name, Scope: cfg.Scope, OwnerUserID: cfg.OwnerUserID, RemoteName: remoteName, Parameters: params, Handler: func(ctx context.Context, arguments map[string]interface{}) (string, error) {
-		meta := requestctx.MetadataFromContext(ctx)
-		reqLog := log.Agent("agent.tool.mcp", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model)
-		reqLog.Debug("agent.tool.mcp.start", "starting MCP tool execution", config.F("tool_name", localName), config.F("remote_tool_name", remoteName), config.F("server", cfg.Name), config.F("scope", cfg.Scope))
+	readOnly := tool.Annotations != nil && tool.Annotations.ReadOnlyHint
+	cacheable := slices.Contains(cfg.CacheableTools, remoteName)
+	return ToolSpec{Name: localName, Description: description, Server: cfg.Name, Scope: cfg.Scope, OwnerUserID: cfg.OwnerUserID, RemoteName: remoteName, Parameters: params, ReadOnly: readOnly, Cacheable: cacheable, Handler: func(ctx context.Context, arguments map[string]interface{}) (string, error) {
+		if log.Enabled(config.LevelDebug) {
+			meta := requestctx.MetadataFromContext(ctx)
+			reqLog := log.Agent("agent.tool.mcp", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model)
+			reqLog.Debug("agent.tool.mcp.start", "starting MCP tool execution", config.F("tool_name", localName), config.F("remote_tool_name", remoteName), config.F("server", cfg.Name), config.F("scope", cfg.Scope))
+		}
 		result, err := session.CallTool(ctx, &gomcp.CallToolParams{Name: remoteName, Arguments: arguments})
 		if err != nil {
 			return "", fmt.Errorf("MCP tool %q failed: %w", remoteName, err)
@@ -87,13 +87,30 @@ func (p *Provider) LLMTools(ctx context.Context, userID string, exposed map[stri
 	if p == nil || p.manager == nil || len(exposed) == 0 {
 		return nil
 	}
-	specs := p.manager.ToolSpecs(ctx, userID)
-	tools := make([]llm.Tool, 0, len(specs))
-	for _, spec := range specs {
-		if !exposed[spec.Name] {
+	// Only servers with an exposed tool are consulted, so a request that has
+	// discovered one server's tools never connects to or lists the others.
+	servers := make([]string, 0, len(exposed))
+	seen := map[string]bool{}
+	for name, ok := range exposed {
+		server, _, valid := splitToolName(name)
+		if !ok || !valid || seen[server] {
 			continue
 		}
-		tools = append(tools, llmTool(spec))
+		seen[server] = true
+		servers = append(servers, server)
+	}
+	sort.Strings(servers)
+	tools := make([]llm.Tool, 0, len(exposed))
+	for _, server := range servers {
+		specs, info, err := p.manager.ServerToolSpecs(ctx, userID, server)
+		if err != nil || info.Status != serverStatusConnected {
+			continue
+		}
+		for _, spec := range specs {
+			if exposed[spec.Name] {
+				tools = append(tools, llmTool(spec))
+			}
+		}
 	}
 	return tools
 }
@@ -113,13 +130,37 @@ func (p *Provider) Execute(ctx context.Context, userID, name string, args map[st
 	if !exposed[name] {
 		return "", false, nil
 	}
-	if _, visible := p.manager.ServerInfo(ctx, userID, server); !visible {
+	// A direct lookup in the cached visible list; building every server's
+	// info just to test visibility is wasted work on each tool call.
+	if _, visible, err := p.manager.resolveConfig(ctx, userID, server); err != nil || !visible {
 		return "", false, nil
 	}
 	result, err := p.manager.Execute(ctx, userID, name, args)
 	return result, true, err
 }
 
+// ReadOnlyTool reports whether name is an exposed MCP tool its server
+// annotates as read-only, so the agent may run it alongside other reads.
+func (p *Provider) ReadOnlyTool(ctx context.Context, userID, name string, exposed map[string]bool) bool {
+	if p == nil || p.manager == nil || !exposed[name] {
+		return false
+	}
+	server, _, ok := splitToolName(name)
+	if !ok {
+		return false
+	}
+	specs, info, err := p.manager.ServerToolSpecs(ctx, userID, server)
+	if err != nil || info.Status != serverStatusConnected {
+		return false
+	}
+	for _, spec := range specs {
+		if spec.Name == name {
+			return spec.ReadOnly
+		}
+	}
+	return false
+}
+
 func discoveryTool(server string) llm.Tool {
 	return llm.Tool{Type: "function", Function: llm.ToolDefinition{
 		Name:        server + ".tools",
@@ -255,6 +296,13 @@ func toolSearchScore(tool registry.CatalogEntry, query string) int {
 	if strings.Contains(description, query) {
 		score += 25
 	}
+	// Lowercase parameter text once rather than once per query term.
+	paramNames := make([]string, len(tool.Parameters))
+	paramDescriptions := make([]string, len(tool.Parameters))
+	for i, param := range tool.Parameters {
+		paramNames[i] = strings.ToLower(param.Name)
+		paramDescriptions[i] = strings.ToLower(param.Description)
+	}
 	for _, term := range strings.Fields(query) {
 		if strings.Contains(name, term) {
 			score += 20
@@ -262,11 +310,11 @@ func toolSearchScore(tool registry.CatalogEntry, query string) int {
 		if strings.Contains(description, term) {
 			score += 10
 		}
-		for _, param := range tool.Parameters {
-			if strings.Contains(strings.ToLower(param.Name), term) {
+		for i := range paramNames {
+			if strings.Contains(paramNames[i], term) {
 				score += 8
 			}
-			if strings.Contains(strings.ToLower(param.Description), term) {
+			if strings.Contains(paramDescriptions[i], term) {
 				score += 4
 			}
 		}
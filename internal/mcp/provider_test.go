@@ -2,6 +2,7 @@ package mcp
 
 import (
 	"context"
+	"errors"
 	"path/filepath"
 	"testing"
 
@@ -80,6 +81,32 @@ func TestProviderResolveToolsUsesCurrentVisibleCatalog(t *testing.T) {
 	}
 }
 
+func TestProviderLLMToolsOnlyConsultsServersWithExposedTools(t *testing.T) {
+	store := testStore(t)
+	ctx := context.Background()
+	if _, err := store.Save(ctx, ServerConfig{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/github", Enabled: true}); err != nil {
+		t.Fatalf("save github: %v", err)
+	}
+	cfg, err := store.Save(ctx, ServerConfig{Scope: ScopeUser, OwnerUserID: "user_1", Name: "home", Transport: TransportStreamableHTTP, URL: "https://example.com/home", Enabled: true})
+	if err != nil {
+		t.Fatalf("save home: %v", err)
+	}
+	manager := NewManagerFromStore(store, config.NewLogger(config.LevelError))
+	manager.sessions[scopeKey(cfg)] = &server{config: cfg, tools: []ToolSpec{
+		{Name: "home.turn_on", Server: "home", RemoteName: "turn_on"},
+		{Name: "home.weather", Server: "home", RemoteName: "weather"},
+	}}
+	provider := NewProvider(manager)
+
+	tools := provider.LLMTools(ctx, "user_1", map[string]bool{"home.weather": true})
+	if len(tools) != 1 || tools[0].Function.Name != "home.weather" {
+		t.Fatalf("unexpected LLM tools: %+v", tools)
+	}
+	if manager.cached(ScopeGlobal+":github") != nil {
+		t.Fatal("server without exposed tools was connected")
+	}
+}
+
 func TestSearchToolsReturnsAllToolsWithoutQuery(t *testing.T) {
 	catalog := []registryEntry{
 		{name: "home.turn_on", description: "Turn on a light"},
@@ -124,3 +151,75 @@ func makeCatalog(entries []registryEntry) []registry.CatalogEntry {
 	}
 	return out
 }
+
+func TestEnsureConnectedWaitsForInFlightConnect(t *testing.T) {
+	manager := &Manager{sessions: make(map[string]*server), connecting: make(map[string]*pendingConnect), log: config.NewLogger(config.LevelError)}
+	cfg := ServerConfig{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/github", Enabled: true}
+	pending := &pendingConnect{done: make(chan struct{})}
+	manager.connecting[scopeKey(cfg)] = pending
+
+	type result struct {
+		srv *server
+		err error
+	}
+	results := make(chan result, 1)
+	go func() {
+		srv, err := manager.ensureConnected(context.Background(), cfg)
+		results <- result{srv: srv, err: err}
+	}()
+
+	connected := &server{config: cfg}
+	pending.srv = connected
+	close(pending.done)
+	got := <-results
+	if got.err != nil || got.srv != connected {
+		t.Fatalf("expected in-flight session, got %+v", got)
+	}
+}
+
+func TestEnsureConnectedWaiterStopsOnOwnContext(t *testing.T) {
+	manager := &Manager{sessions: make(map[string]*server), connecting: make(map[string]*pendingConnect), log: config.NewLogger(config.LevelError)}
+	cfg := ServerConfig{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/github", Enabled: true}
+	pending := &pendingConnect{done: make(chan struct{})}
+	manager.connecting[scopeKey(cfg)] = pending
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	if _, err := manager.ensureConnected(ctx, cfg); !errors.Is(err, context.Canceled) {
+		t.Fatalf("expected canceled waiter to return its own ctx error, got %v", err)
+	}
+	if manager.connecting[scopeKey(cfg)] != pending {
+		t.Fatal("expected the shared connect to keep running for other waiters")
+	}
+}
+
+func TestWarmRecordsGlobalServerConnectFailures(t *testing.T) {
+	store, err := NewStore(filepath.Join(t.TempDir(), "oswald.db"), "12345678901234567890123456789012", config.NewLogger(config.LevelError).Server("test"))
+	if err != nil {
+		t.Fatalf("new store: %v", err)
+	}
+	t.Cleanup(func() { store.Close() })
+	store.SetResolverForTest(staticResolver{"example.com": {"93.184.216.34"}})
+	ctx := context.Background()
+	for _, cfg := range []ServerConfig{
+		{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/github", Enabled: true},
+		{Scope: ScopeGlobal, Name: "disabled", Transport: TransportStreamableHTTP, URL: "https://example.com/disabled", Enabled: false},
+	} {
+		if _, err := store.Save(ctx, cfg); err != nil {
+			t.Fatalf("save %s: %v", cfg.Name, err)
+		}
+	}
+	// Point the host at a private address so the connect attempt fails fast
+	// during validation instead of dialing out.
+	store.SetResolverForTest(staticResolver{"example.com": {"10.0.0.1"}})
+	manager := NewManagerFromStore(store, config.NewLogger(config.LevelError))
+
+	manager.Warm(ctx)
+
+	if srv := manager.cached("global:github"); srv == nil || srv.reason == "" {
+		t.Fatalf("expected recorded connect failure, got %+v", srv)
+	}
+	if srv := manager.cached("global:disabled"); srv != nil {
+		t.Fatalf("expected disabled server to be skipped, got %+v", srv)
+	}
+}
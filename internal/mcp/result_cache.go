@@ -0,0 +1,140 @@
+package mcp
+
+import (
+	"context"
+	"encoding/json"
+	"sync"
+	"time"
+)
+
+const (
+	// toolResultCacheTTL bounds how long a cacheable tool result is reused.
+	// Agent loops often repeat the same lookup while chasing IDs across steps.
+	toolResultCacheTTL = time.Minute
+
+	// maxCachedToolResults bounds the result cache; the least recently used
+	// result is evicted once it is full.
+	maxCachedToolResults = 512
+)
+
+// cachedToolResult is one memoized cacheable tool call.
+type cachedToolResult struct {
+	SessionKey string
+	Result     string
+	ExpiresAt  time.Time
+	LastUsed   time.Time
+}
+
+// toolResultCache memoizes successful calls to tools a server config marked
+// cacheable, keyed by server session, tool and canonical arguments.
+type toolResultCache struct {
+	mu      sync.Mutex
+	entries map[string]cachedToolResult
+	// generations counts invalidations per server session so a read that
+	// raced a write or config change does not store its stale result.
+	generations map[string]uint64
+}
+
+// callTool runs tool, serving and recording cacheable results through the
+// manager's result cache. Errors are never cached, and any call to a tool
+// that may write drops the server's cached results so later reads see it.
+func (m *Manager) callTool(ctx context.Context, tool ToolSpec, args map[string]interface{}) (string, error) {
+	sessionKey := scopeKey(ServerConfig{Scope: tool.Scope, OwnerUserID: tool.OwnerUserID, Name: tool.Server})
+	if !tool.Cacheable {
+		result, err := tool.Handler(ctx, args)
+		if !tool.ReadOnly {
+			m.results.invalidate(sessionKey)
+		}
+		return result, err
+	}
+	data, err := json.Marshal(args)
+	if err != nil {
+		return tool.Handler(ctx, args)
+	}
+	key := sessionKey + "\x00" + tool.RemoteName + "\x00" + string(data)
+	if result, ok := m.results.get(key); ok {
+		return result, nil
+	}
+	generation := m.results.generation(sessionKey)
+	result, err := tool.Handler(ctx, args)
+	if err == nil {
+		m.results.put(sessionKey, key, result, generation)
+	}
+	return result, err
+}
+
+func (c *toolResultCache) get(key string) (string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.pruneLocked()
+	entry, ok := c.entries[key]
+	if !ok {
+		return "", false
+	}
+	entry.LastUsed = time.Now()
+	c.entries[key] = entry
+	return entry.Result, true
+}
+
+// generation returns the session's invalidation count, read before calling
+// the tool so put can tell whether the session was invalidated meanwhile.
+func (c *toolResultCache) generation(sessionKey string) uint64 {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.generations[sessionKey]
+}
+
+// put stores result unless the session was invalidated since generation was
+// read, in which case the result may predate a write and is dropped.
+func (c *toolResultCache) put(sessionKey, key, result string, generation uint64) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if c.generations[sessionKey] != generation {
+		return
+	}
+	if c.entries == nil {
+		c.entries = make(map[string]cachedToolResult)
+	}
+	c.pruneLocked()
+	if _, ok := c.entries[key]; !ok && len(c.entries) >= maxCachedToolResults {
+		c.evictLeastRecentlyUsedLocked()
+	}
+	now := time.Now()
+	c.entries[key] = cachedToolResult{SessionKey: sessionKey, Result: result, ExpiresAt: now.Add(toolResultCacheTTL), LastUsed: now}
+}
+
+// invalidate drops every result cached for a server session whose config
+// changed or whose tools may have written.
+func (c *toolResultCache) invalidate(sessionKey string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if c.generations == nil {
+		c.generations = make(map[string]uint64)
+	}
+	c.generations[sessionKey]++
+	for key, entry := range c.entries {
+		if entry.SessionKey == sessionKey {
+			delete(c.entries, key)
+		}
+	}
+}
+
+func (c *toolResultCache) pruneLocked() {
+	now := time.Now()
+	for key, entry := range c.entries {
+		if !entry.ExpiresAt.After(now) {
+			delete(c.entries, key)
+		}
+	}
+}
+
+func (c *toolResultCache) evictLeastRecentlyUsedLocked() {
+	var oldestKey string
+	var oldest time.Time
+	for key, entry := range c.entries {
+		if oldestKey == "" || entry.LastUsed.Before(oldest) {
+			oldestKey, oldest = key, entry.LastUsed
+		}
+	}
+	delete(c.entries, oldestKey)
+}
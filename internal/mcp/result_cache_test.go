@@ -0,0 +1,102 @@
+package mcp
+
+import (
+	"context"
+	"testing"
+
+	"github.com/jonahgcarpenter/oswald-ai/internal/config"
+)
+
+func TestCallToolCachesOnlyCacheableResults(t *testing.T) {
+	manager := NewManagerFromStore(nil, config.NewLogger(config.LevelError))
+	calls := map[string]int{}
+	handler := func(name string) Handler {
+		return func(_ context.Context, _ map[string]interface{}) (string, error) {
+			calls[name]++
+			return name + " result", nil
+		}
+	}
+	lookup := ToolSpec{Name: "home.lookup", Server: "home", Scope: ScopeGlobal, RemoteName: "lookup", ReadOnly: true, Cacheable: true, Handler: handler("lookup")}
+	status := ToolSpec{Name: "home.status", Server: "home", Scope: ScopeGlobal, RemoteName: "status", ReadOnly: true, Handler: handler("status")}
+	ctx := context.Background()
+	args := map[string]interface{}{"id": "1"}
+
+	for i := 0; i < 2; i++ {
+		if result, err := manager.callTool(ctx, lookup, args); err != nil || result != "lookup result" {
+			t.Fatalf("lookup = %q, %v", result, err)
+		}
+		if _, err := manager.callTool(ctx, status, args); err != nil {
+			t.Fatalf("status: %v", err)
+		}
+	}
+	if calls["lookup"] != 1 || calls["status"] != 2 {
+		t.Fatalf("handler calls = %+v, want lookup once and uncached status twice", calls)
+	}
+
+	if _, err := manager.callTool(ctx, lookup, map[string]interface{}{"id": "2"}); err != nil {
+		t.Fatalf("lookup other args: %v", err)
+	}
+	manager.Invalidate(ScopeGlobal, "", "home")
+	if _, err := manager.callTool(ctx, lookup, args); err != nil {
+		t.Fatalf("lookup after invalidate: %v", err)
+	}
+	if calls["lookup"] != 3 {
+		t.Fatalf("lookup calls = %d, want 3", calls["lookup"])
+	}
+}
+
+func TestCallToolWriteInvalidatesCachedReads(t *testing.T) {
+	manager := NewManagerFromStore(nil, config.NewLogger(config.LevelError))
+	state := "off"
+	reads := 0
+	read := ToolSpec{Name: "home.state", Server: "home", Scope: ScopeGlobal, RemoteName: "state", ReadOnly: true, Cacheable: true, Handler: func(context.Context, map[string]interface{}) (string, error) {
+		reads++
+		return state, nil
+	}}
+	write := ToolSpec{Name: "home.toggle", Server: "home", Scope: ScopeGlobal, RemoteName: "toggle", Handler: func(context.Context, map[string]interface{}) (string, error) {
+		state = "on"
+		return "toggled", nil
+	}}
+	ctx := context.Background()
+	args := map[string]interface{}{"id": "lamp"}
+
+	if result, err := manager.callTool(ctx, read, args); err != nil || result != "off" {
+		t.Fatalf("first read = %q, %v", result, err)
+	}
+	if _, err := manager.callTool(ctx, write, args); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if result, err := manager.callTool(ctx, read, args); err != nil || result != "on" {
+		t.Fatalf("read after write = %q, %v; want fresh result", result, err)
+	}
+	if reads != 2 {
+		t.Fatalf("reads = %d, want 2", reads)
+	}
+}
+
+func TestCallToolDropsReadThatRacedInvalidate(t *testing.T) {
+	manager := NewManagerFromStore(nil, config.NewLogger(config.LevelError))
+	reads := 0
+	read := ToolSpec{Name: "home.state", Server: "home", Scope: ScopeGlobal, RemoteName: "state", ReadOnly: true, Cacheable: true}
+	read.Handler = func(context.Context, map[string]interface{}) (string, error) {
+		reads++
+		if reads == 1 {
+			// A write lands while the first read is still in flight.
+			manager.Invalidate(ScopeGlobal, "", "home")
+			return "stale", nil
+		}
+		return "fresh", nil
+	}
+	ctx := context.Background()
+	args := map[string]interface{}{"id": "lamp"}
+
+	if result, err := manager.callTool(ctx, read, args); err != nil || result != "stale" {
+		t.Fatalf("first read = %q, %v", result, err)
+	}
+	if result, err := manager.callTool(ctx, read, args); err != nil || result != "fresh" {
+		t.Fatalf("read after invalidate = %q, %v; want uncached result", result, err)
+	}
+	if reads != 2 {
+		t.Fatalf("reads = %d, want 2", reads)
+	}
+}
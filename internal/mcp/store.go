@@ -6,6 +6,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
@@ -18,8 +19,36 @@ type Store struct {
 	crypto   *cryptoBox
 	resolver hostnameResolver
 	log      *config.Logger
+
+	// listForUser is prepared once because every chat turn lists the
+	// speaker's visible servers, often several times.
+	listForUser *sql.Stmt
+
+	// visible caches decrypted ListForUser results per user. Every write
+	// through the store clears it and bumps generation so a list that raced
+	// with the write is never cached.
+	visibleMu  sync.Mutex
+	visible    map[string]visibleConfigs
+	generation uint64
+}
+
+// visibleConfigs is one cached ListForUser result.
+type visibleConfigs struct {
+	Configs   []ServerConfig
+	ExpiresAt time.Time
 }
 
+// visibleConfigsTTL bounds how long a cached server list is served without
+// re-reading the table.
+const visibleConfigsTTL = 30 * time.Second
+
+const listForUserQuery = `
+SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, cacheable_tools, created_at, updated_at
+FROM mcp_servers
+WHERE scope = 'global' OR (scope = 'user' AND owner_user_id = ?)
+ORDER BY scope, name
+`
+
 // NewStore opens the shared SQLite database and prepares MCP config encryption.
 func NewStore(path string, encryptionKey string, log *config.Logger) (*Store, error) {
 	box, err := newCryptoBox(encryptionKey)
@@ -30,13 +59,21 @@ func NewStore(path string, encryptionKey string, log *config.Logger) (*Store, er
 	if err != nil {
 		return nil, err
 	}
-	return &Store{db: db, crypto: box, log: log}, nil
+	listForUser, err := db.SQL().Prepare(listForUserQuery)
+	if err != nil {
+		db.Close() // nolint:errcheck
+		return nil, fmt.Errorf("prepare MCP server list statement: %w", err)
+	}
+	return &Store{db: db, crypto: box, log: log, listForUser: listForUser, visible: make(map[string]visibleConfigs)}, nil
 }
 
 func (s *Store) Close() error {
 	if s == nil || s.db == nil {
 		return nil
 	}
+	if s.listForUser != nil {
+		s.listForUser.Close() // nolint:errcheck
+	}
 	return s.db.Close()
 }
 
@@ -74,17 +111,17 @@ func (s *Store) Save(ctx context.Context, cfg ServerConfig) (ServerConfig, error
 		return ServerConfig{}, err
 	}
 	if cfg.Scope == ScopeUser {
-		if _, ok, err := s.Get(ctx, ScopeGlobal, "", cfg.Name); err != nil {
+		if _, _, ok, err := s.lookupIdentity(ctx, ScopeGlobal, "", cfg.Name); err != nil {
 			return ServerConfig{}, err
 		} else if ok {
 			return ServerConfig{}, fmt.Errorf("server name %q collides with a global MCP server", cfg.Name)
 		}
 	}
-	if existing, ok, err := s.Get(ctx, cfg.Scope, cfg.OwnerUserID, cfg.Name); err != nil {
+	if id, createdAt, ok, err := s.lookupIdentity(ctx, cfg.Scope, cfg.OwnerUserID, cfg.Name); err != nil {
 		return ServerConfig{}, err
 	} else if ok {
-		cfg.ID = existing.ID
-		cfg.CreatedAt = existing.CreatedAt
+		cfg.ID = id
+		cfg.CreatedAt = createdAt
 	}
 	if cfg.ID == "" {
 		cfg.ID = newConfigID()
@@ -94,6 +131,7 @@ func (s *Store) Save(ctx context.Context, cfg ServerConfig) (ServerConfig, error
 		cfg.CreatedAt = now
 	}
 	cfg.UpdatedAt = now
+	cfg.CacheableTools = normalizeToolNames(cfg.CacheableTools)
 	urlCiphertext, err := s.crypto.encrypt(strings.TrimSpace(cfg.URL), fieldAAD(cfg.Scope, cfg.OwnerUserID, cfg.Name, "url"))
 	if err != nil {
 		return ServerConfig{}, err
@@ -107,8 +145,8 @@ func (s *Store) Save(ctx context.Context, cfg ServerConfig) (ServerConfig, error
 		return ServerConfig{}, err
 	}
 	_, err = s.db.SQL().ExecContext(ctx, `
-INSERT INTO mcp_servers (id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, created_at, updated_at)
-VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+INSERT INTO mcp_servers (id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, cacheable_tools, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 ON CONFLICT(id) DO UPDATE SET
 	scope = excluded.scope,
 	owner_user_id = excluded.owner_user_id,
@@ -119,31 +157,64 @@ ON CONFLICT(id) DO UPDATE SET
 	url_host_hash = excluded.url_host_hash,
 	headers_ciphertext = excluded.headers_ciphertext,
 	enabled = excluded.enabled,
+	cacheable_tools = excluded.cacheable_tools,
 	updated_at = excluded.updated_at
-`, cfg.ID, cfg.Scope, nullableOwner(cfg.OwnerUserID), cfg.Name, cfg.Type, cfg.Transport, urlCiphertext, s.crypto.hostHash(parsed.Hostname()), headersCiphertext, boolToInt(cfg.Enabled), formatTime(cfg.CreatedAt), formatTime(cfg.UpdatedAt))
+`, cfg.ID, cfg.Scope, nullableOwner(cfg.OwnerUserID), cfg.Name, cfg.Type, cfg.Transport, urlCiphertext, s.crypto.hostHash(parsed.Hostname()), headersCiphertext, boolToInt(cfg.Enabled), strings.Join(cfg.CacheableTools, ","), formatTime(cfg.CreatedAt), formatTime(cfg.UpdatedAt))
 	if err != nil {
 		return ServerConfig{}, fmt.Errorf("save MCP server config: %w", err)
 	}
+	s.invalidateVisible()
 	return cfg, nil
 }
 
+// ListForUser returns global and user-scoped configs visible to userID.
+// Results are cached briefly because each chat turn lists them several
+// times and every row needs its URL and headers decrypted.
 func (s *Store) ListForUser(ctx context.Context, userID string) ([]ServerConfig, error) {
-	rows, err := s.db.SQL().QueryContext(ctx, `
-SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, created_at, updated_at
-FROM mcp_servers
-WHERE scope = 'global' OR (scope = 'user' AND owner_user_id = ?)
-ORDER BY scope, name
-`, strings.TrimSpace(userID))
+	userID = strings.TrimSpace(userID)
+	now := time.Now()
+	s.visibleMu.Lock()
+	if entry, ok := s.visible[userID]; ok && entry.ExpiresAt.After(now) {
+		s.visibleMu.Unlock()
+		return append([]ServerConfig(nil), entry.Configs...), nil
+	}
+	generation := s.generation
+	s.visibleMu.Unlock()
+
+	rows, err := s.listForUser.QueryContext(ctx, userID)
 	if err != nil {
 		return nil, fmt.Errorf("list MCP server configs: %w", err)
 	}
 	defer rows.Close()
-	return s.scanConfigs(rows)
+	configs, err := s.scanConfigs(rows)
+	if err != nil {
+		return nil, err
+	}
+
+	s.visibleMu.Lock()
+	if s.generation == generation {
+		for key, entry := range s.visible {
+			if !entry.ExpiresAt.After(now) {
+				delete(s.visible, key)
+			}
+		}
+		s.visible[userID] = visibleConfigs{Configs: configs, ExpiresAt: now.Add(visibleConfigsTTL)}
+	}
+	s.visibleMu.Unlock()
+	return append([]ServerConfig(nil), configs...), nil
+}
+
+// invalidateVisible drops every cached server list after a write.
+func (s *Store) invalidateVisible() {
+	s.visibleMu.Lock()
+	s.generation++
+	clear(s.visible)
+	s.visibleMu.Unlock()
 }
 
 func (s *Store) ListGlobal(ctx context.Context) ([]ServerConfig, error) {
 	rows, err := s.db.SQL().QueryContext(ctx, `
-SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, created_at, updated_at
+SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, cacheable_tools, created_at, updated_at
 FROM mcp_servers
 WHERE scope = 'global'
 ORDER BY name
@@ -157,7 +228,7 @@ ORDER BY name
 
 func (s *Store) Get(ctx context.Context, scope, ownerUserID, name string) (ServerConfig, bool, error) {
 	row := s.db.SQL().QueryRowContext(ctx, `
-SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, created_at, updated_at
+SELECT id, scope, owner_user_id, name, type, transport, url_ciphertext, url_host_hash, headers_ciphertext, enabled, cacheable_tools, created_at, updated_at
 FROM mcp_servers
 WHERE scope = ? AND COALESCE(owner_user_id, '') = ? AND name = ?
 `, scope, strings.TrimSpace(ownerUserID), strings.TrimSpace(strings.ToLower(name)))
@@ -172,11 +243,46 @@ WHERE scope = ? AND COALESCE(owner_user_id, '') = ? AND name = ?
 	return cfg, err == nil, err
 }
 
+// lookupIdentity reads only the ID and creation time of a stored config.
+// Save uses it for existence checks so it never decrypts URLs or headers
+// it is about to overwrite.
+func (s *Store) lookupIdentity(ctx context.Context, scope, ownerUserID, name string) (string, time.Time, bool, error) {
+	var id, createdRaw string
+	err := s.db.SQL().QueryRowContext(ctx, `
+SELECT id, created_at
+FROM mcp_servers
+WHERE scope = ? AND COALESCE(owner_user_id, '') = ? AND name = ?
+`, scope, strings.TrimSpace(ownerUserID), strings.TrimSpace(strings.ToLower(name))).Scan(&id, &createdRaw)
+	if err == sql.ErrNoRows {
+		return "", time.Time{}, false, nil
+	}
+	if err != nil {
+		return "", time.Time{}, false, fmt.Errorf("look up MCP server config: %w", err)
+	}
+	createdAt, err := time.Parse(time.RFC3339Nano, createdRaw)
+	if err != nil {
+		return "", time.Time{}, false, fmt.Errorf("parse MCP server created_at: %w", err)
+	}
+	return id, createdAt, true, nil
+}
+
 func (s *Store) Delete(ctx context.Context, scope, ownerUserID, name string) error {
 	_, err := s.db.SQL().ExecContext(ctx, `DELETE FROM mcp_servers WHERE scope = ? AND COALESCE(owner_user_id, '') = ? AND name = ?`, scope, strings.TrimSpace(ownerUserID), strings.TrimSpace(strings.ToLower(name)))
 	if err != nil {
 		return fmt.Errorf("delete MCP server config: %w", err)
 	}
+	s.invalidateVisible()
+	return nil
+}
+
+// DeleteForOwner removes every config owned by ownerUserID, as when that
+// canonical user is deleted.
+func (s *Store) DeleteForOwner(ctx context.Context, ownerUserID string) error {
+	_, err := s.db.SQL().ExecContext(ctx, `DELETE FROM mcp_servers WHERE owner_user_id = ?`, strings.TrimSpace(ownerUserID))
+	if err != nil {
+		return fmt.Errorf("delete user MCP server configs: %w", err)
+	}
+	s.invalidateVisible()
 	return nil
 }
 
@@ -185,6 +291,7 @@ func (s *Store) SetEnabled(ctx context.Context, scope, ownerUserID, name string,
 	if err != nil {
 		return fmt.Errorf("update MCP server enabled state: %w", err)
 	}
+	s.invalidateVisible()
 	return nil
 }
 
@@ -214,7 +321,7 @@ func scanStored(row rowScanner) (storedServerConfig, error) {
 	var owner sql.NullString
 	var enabled int
 	var createdRaw, updatedRaw string
-	if err := row.Scan(&stored.ID, &stored.Scope, &owner, &stored.Name, &stored.Type, &stored.Transport, &stored.URLCiphertext, &stored.URLHostHash, &stored.HeadersCiphertext, &enabled, &createdRaw, &updatedRaw); err != nil {
+	if err := row.Scan(&stored.ID, &stored.Scope, &owner, &stored.Name, &stored.Type, &stored.Transport, &stored.URLCiphertext, &stored.URLHostHash, &stored.HeadersCiphertext, &enabled, &stored.CacheableTools, &createdRaw, &updatedRaw); err != nil {
 		return storedServerConfig{}, err
 	}
 	stored.OwnerUserID = owner.String
@@ -247,7 +354,23 @@ func (s *Store) decrypt(stored storedServerConfig) (ServerConfig, error) {
 			return ServerConfig{}, fmt.Errorf("unmarshal MCP headers: %w", err)
 		}
 	}
-	return ServerConfig{ID: stored.ID, Scope: stored.Scope, OwnerUserID: stored.OwnerUserID, Name: stored.Name, Type: stored.Type, Transport: stored.Transport, URL: urlText, Headers: headers, Enabled: stored.Enabled, CreatedAt: stored.CreatedAt, UpdatedAt: stored.UpdatedAt}, nil
+	return ServerConfig{ID: stored.ID, Scope: stored.Scope, OwnerUserID: stored.OwnerUserID, Name: stored.Name, Type: stored.Type, Transport: stored.Transport, URL: urlText, Headers: headers, Enabled: stored.Enabled, CacheableTools: normalizeToolNames(strings.Split(stored.CacheableTools, ",")), CreatedAt: stored.CreatedAt, UpdatedAt: stored.UpdatedAt}, nil
+}
+
+// normalizeToolNames trims and de-duplicates remote tool names, dropping
+// blanks, so the stored list round-trips unchanged.
+func normalizeToolNames(names []string) []string {
+	var out []string
+	seen := map[string]bool{}
+	for _, name := range names {
+		name = strings.TrimSpace(name)
+		if name == "" || seen[name] {
+			continue
+		}
+		seen[name] = true
+		out = append(out, name)
+	}
+	return out
 }
 
 func nullableOwner(owner string) any {
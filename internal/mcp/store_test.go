@@ -65,6 +65,21 @@ func TestStoreEncryptsURLAndHeadersAtRest(t *testing.T) {
 	}
 }
 
+func TestStorePersistsCacheableTools(t *testing.T) {
+	store := testStore(t)
+	ctx := context.Background()
+	if _, err := store.Save(ctx, ServerConfig{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/mcp", Enabled: true, CacheableTools: []string{" list_repos", "", "get_repo", "list_repos"}}); err != nil {
+		t.Fatalf("save config: %v", err)
+	}
+	loaded, ok, err := store.Get(ctx, ScopeGlobal, "", "github")
+	if err != nil || !ok {
+		t.Fatalf("load config ok=%v err=%v", ok, err)
+	}
+	if strings.Join(loaded.CacheableTools, ",") != "list_repos,get_repo" {
+		t.Fatalf("CacheableTools = %q, want [list_repos get_repo]", loaded.CacheableTools)
+	}
+}
+
 func TestStoreScopesServersAndRejectsGlobalNameCollision(t *testing.T) {
 	store := testStore(t)
 	ctx := context.Background()
@@ -93,3 +108,45 @@ func TestStoreScopesServersAndRejectsGlobalNameCollision(t *testing.T) {
 		t.Fatalf("unexpected user2 configs: %+v", user2)
 	}
 }
+
+func TestListForUserReflectsWritesThroughCache(t *testing.T) {
+	store := testStore(t)
+	ctx := context.Background()
+	if _, err := store.Save(ctx, ServerConfig{Scope: ScopeGlobal, Name: "github", Transport: TransportStreamableHTTP, URL: "https://example.com/mcp", Enabled: true}); err != nil {
+		t.Fatalf("save global: %v", err)
+	}
+	if configs, err := store.ListForUser(ctx, "user_1"); err != nil || len(configs) != 1 || !configs[0].Enabled {
+		t.Fatalf("initial list = %+v err=%v", configs, err)
+	}
+
+	if err := store.SetEnabled(ctx, ScopeGlobal, "", "github", false); err != nil {
+		t.Fatalf("disable: %v", err)
+	}
+	if configs, err := store.ListForUser(ctx, "user_1"); err != nil || len(configs) != 1 || configs[0].Enabled {
+		t.Fatalf("list after disable = %+v err=%v", configs, err)
+	}
+
+	if err := store.Delete(ctx, ScopeGlobal, "", "github"); err != nil {
+		t.Fatalf("delete: %v", err)
+	}
+	if configs, err := store.ListForUser(ctx, "user_1"); err != nil || len(configs) != 0 {
+		t.Fatalf("list after delete = %+v err=%v", configs, err)
+	}
+}
+
+func TestDeleteForOwnerClearsCachedLists(t *testing.T) {
+	store := testStore(t)
+	ctx := context.Background()
+	if _, err := store.Save(ctx, ServerConfig{Scope: ScopeUser, OwnerUserID: "user_1", Name: "home", Transport: TransportStreamableHTTP, URL: "https://example.com/home", Enabled: true}); err != nil {
+		t.Fatalf("save user server: %v", err)
+	}
+	if configs, err := store.ListForUser(ctx, "user_1"); err != nil || len(configs) != 1 {
+		t.Fatalf("initial list = %+v err=%v", configs, err)
+	}
+	if err := store.DeleteForOwner(ctx, "user_1"); err != nil {
+		t.Fatalf("delete for owner: %v", err)
+	}
+	if configs, err := store.ListForUser(ctx, "user_1"); err != nil || len(configs) != 0 {
+		t.Fatalf("list after owner delete = %+v err=%v", configs, err)
+	}
+}
@@ -44,6 +44,14 @@ type ToolSpec struct {
 	RemoteName  string
 	Parameters  []ParamSpec
 	Handler     Handler
+
+	// ReadOnly reports the server's readOnlyHint annotation. It only says
+	// the tool does not write; it does not make the result cacheable.
+	ReadOnly bool
+
+	// Cacheable reports that the server config opted this tool into result
+	// caching. Its results are briefly reused per server and arguments.
+	Cacheable bool
 }
 
 // ServerInfo describes a configured MCP server and its current availability.
@@ -70,6 +78,10 @@ type ServerConfig struct {
 	Enabled     bool
 	CreatedAt   time.Time
 	UpdatedAt   time.Time
+
+	// CacheableTools lists remote tool names whose results are deterministic
+	// enough to reuse for a short time. Caching is off for every other tool.
+	CacheableTools []string
 }
 
 type storedServerConfig struct {
@@ -83,6 +95,7 @@ type storedServerConfig struct {
 	URLHostHash       string
 	HeadersCiphertext string
 	Enabled           bool
+	CacheableTools    string
 	CreatedAt         time.Time
 	UpdatedAt         time.Time
 }
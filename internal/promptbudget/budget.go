@@ -81,6 +81,46 @@ func EstimateTokens(systemPrompt string, history []llm.ChatMessage, userPrompt s
 	return total
 }
 
+// compactedToolResult stands in for tool output dropped to fit the budget.
+const compactedToolResult = "[Earlier tool result omitted to fit the context window.]"
+
+// CompactToolResults fits a request's message history within budget by
+// replacing, in place, the content of its oldest tool results with a short
+// placeholder. The keepRecent most recent tool results are never touched and
+// tool call IDs are preserved, so every tool call still has its result.
+// Nothing changes while the history fits, which keeps the prompt prefix
+// stable for the inference server's cache.
+func CompactToolResults(messages []llm.ChatMessage, tools []llm.Tool, budget int, keepRecent int) Result {
+	total := estimateToolTokens(tools)
+	for _, msg := range messages {
+		total += estimateMessageTokens(msg)
+	}
+	result := Result{EstimatedBefore: total, EstimatedAfter: total}
+	if total <= budget {
+		return result
+	}
+
+	var toolIndexes []int
+	for i, msg := range messages {
+		if msg.Role == "tool" {
+			toolIndexes = append(toolIndexes, i)
+		}
+	}
+	for _, i := range toolIndexes[:max(0, len(toolIndexes)-keepRecent)] {
+		if total <= budget {
+			break
+		}
+		if messages[i].Content == compactedToolResult {
+			continue
+		}
+		before := estimateMessageTokens(messages[i])
+		messages[i].Content = compactedToolResult
+		total += estimateMessageTokens(messages[i]) - before
+	}
+	result.EstimatedAfter = total
+	return result
+}
+
 func estimateMessageTokens(msg llm.ChatMessage) int {
 	contentLen := len(msg.Role) + len(msg.Content) + len(msg.Thinking) + len(msg.ToolName)
 	for _, tc := range msg.ToolCalls {
@@ -35,3 +35,29 @@ func TestEstimateTokensIncludesMessagesImagesAndTools(t *testing.T) {
 		t.Fatalf("expected image estimate to increase token count, got without=%d with=%d", withoutImage, withImage)
 	}
 }
+
+func TestCompactToolResultsDropsOldestResultsUntilWithinBudget(t *testing.T) {
+	big := strings.Repeat("r", 4000)
+	messages := []llm.ChatMessage{
+		{Role: "system", Content: "system"},
+		{Role: "user", Content: "question"},
+		{Role: "tool", ToolCallID: "call_1", Content: big},
+		{Role: "tool", ToolCallID: "call_2", Content: big},
+		{Role: "tool", ToolCallID: "call_3", Content: big},
+	}
+
+	if result := CompactToolResults(messages, nil, 1<<20, 1); result.EstimatedAfter != result.EstimatedBefore || messages[2].Content != big {
+		t.Fatalf("history within budget was compacted: %+v", result)
+	}
+
+	result := CompactToolResults(messages, nil, 1500, 1)
+	if messages[2].Content != compactedToolResult || messages[3].Content != compactedToolResult {
+		t.Fatalf("oldest tool results were not compacted: %+v", messages)
+	}
+	if messages[4].Content != big || messages[4].ToolCallID != "call_3" {
+		t.Fatalf("most recent tool result was compacted: %+v", messages[4])
+	}
+	if result.EstimatedAfter >= result.EstimatedBefore {
+		t.Fatalf("estimate did not shrink: %+v", result)
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	sqlite_vec "github.com/asg017/sqlite-vec-go-bindings/cgo"
@@ -104,6 +105,71 @@ type Store struct {
 	embedModel string
 
 	speakerLineResolver func(string) (string, error)
+
+	stmts preparedStatements
+
+	// vectorTables caches each vector table's schema so saves, searches and
+	// deactivations do not re-read sqlite_master. This store is the only
+	// writer of the vector tables and updates the cache whenever it
+	// recreates one.
+	vectorMu     sync.Mutex
+	vectorTables map[string]vectorTableInfo
+}
+
+// vectorTableInfo is the cached result of vectorTableSchema.
+type vectorTableInfo struct {
+	dim         int
+	partitioned bool
+	exists      bool
+}
+
+// preparedStatements holds the statements executed on every chat turn so
+// SQLite parses and plans them once per pooled connection, not per call.
+type preparedStatements struct {
+	ensureAccountUser *sql.Stmt
+	syncIntro         *sql.Stmt
+	appendTurn        *sql.Stmt
+	recentTurns       *sql.Stmt
+}
+
+func prepareStatements(db *sql.DB) (preparedStatements, error) {
+	var stmts preparedStatements
+	queries := []struct {
+		dest  **sql.Stmt
+		query string
+	}{
+		{&stmts.ensureAccountUser, `INSERT OR IGNORE INTO account_users (canonical_user_id, created_at, updated_at) VALUES (?, ?, ?)`},
+		{&stmts.syncIntro, `
+INSERT INTO user_memory_profiles (canonical_user_id, intro, created_at, updated_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(canonical_user_id) DO UPDATE SET intro = excluded.intro, updated_at = excluded.updated_at
+`},
+		{&stmts.appendTurn, `
+INSERT INTO session_turns (session_id, canonical_user_id, user_text, assistant_text, tool_names, importance, created_at, expires_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+`},
+		{&stmts.recentTurns, `
+SELECT id, session_id, canonical_user_id, user_text, assistant_text, tool_names, importance, topic_tags, created_at, expires_at
+FROM session_turns WHERE canonical_user_id = ? AND session_id = ? ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?
+`},
+	}
+	for _, q := range queries {
+		stmt, err := db.Prepare(q.query)
+		if err != nil {
+			stmts.close()
+			return preparedStatements{}, fmt.Errorf("failed to prepare user memory statement: %w", err)
+		}
+		*q.dest = stmt
+	}
+	return stmts, nil
+}
+
+func (p preparedStatements) close() {
+	for _, stmt := range []*sql.Stmt{p.ensureAccountUser, p.syncIntro, p.appendTurn, p.recentTurns} {
+		if stmt != nil {
+			stmt.Close() // nolint:errcheck
+		}
+	}
 }
 
 // NewStore creates a SQLite-backed Store. The argument is treated as a database path.
@@ -121,6 +187,11 @@ func NewSQLiteStore(dbPath string, embedder llm.Embedder, embeddingModel string,
 	if err != nil {
 		return nil, err
 	}
+	stmts, err := prepareStatements(db.SQL())
+	if err != nil {
+		db.Close() // nolint:errcheck
+		return nil, err
+	}
 	return &Store{
 		dbPath:     dbPath,
 		db:         db,
@@ -128,6 +199,7 @@ func NewSQLiteStore(dbPath string, embedder llm.Embedder, embeddingModel string,
 		log:        log,
 		embedder:   embedder,
 		embedModel: strings.TrimSpace(embeddingModel),
+		stmts:      stmts,
 	}, nil
 }
 
@@ -136,6 +208,7 @@ func (s *Store) Close() error {
 	if s == nil || s.db == nil {
 		return nil
 	}
+	s.stmts.close()
 	return s.db.Close()
 }
 
@@ -146,19 +219,16 @@ func (s *Store) SetSpeakerLineResolver(resolver func(string) (string, error)) {
 
 // SyncSpeakerIntro creates or updates the account-derived speaker intro.
 func (s *Store) SyncSpeakerIntro(userID, intro string) error {
-	if err := s.ensureAccountUser(userID); err != nil {
-		return err
-	}
-	now := formatTime(time.Now())
-	_, err := s.sql.Exec(`
-INSERT INTO user_memory_profiles (canonical_user_id, intro, created_at, updated_at)
-VALUES (?, ?, ?, ?)
-ON CONFLICT(canonical_user_id) DO UPDATE SET intro = excluded.intro, updated_at = excluded.updated_at
-`, userID, strings.TrimSpace(intro), now, now)
-	if err != nil {
-		return fmt.Errorf("failed to sync user memory intro for %q: %w", userID, err)
-	}
-	return nil
+	return s.withTx("sync user memory intro", func(tx *sql.Tx) error {
+		if err := ensureAccountUser(tx.Stmt(s.stmts.ensureAccountUser), userID); err != nil {
+			return err
+		}
+		now := formatTime(time.Now())
+		if _, err := tx.Stmt(s.stmts.syncIntro).Exec(userID, strings.TrimSpace(intro), now, now); err != nil {
+			return fmt.Errorf("failed to sync user memory intro for %q: %w", userID, err)
+		}
+		return nil
+	})
 }
 
 // ReadIntro returns the current speaker intro for a user.
@@ -186,11 +256,17 @@ func (s *Store) MergeUsers(winnerUserID, loserUserID string) error {
 	if err := s.ensureAccountUser(winnerUserID); err != nil {
 		return err
 	}
+	_, partitioned, hasVectors := s.vectorTableSchema("memory_entry_vectors")
 	tx, err := s.sql.Begin()
 	if err != nil {
 		return fmt.Errorf("failed to begin memory merge: %w", err)
 	}
 	defer tx.Rollback() // nolint:errcheck
+	if hasVectors && partitioned {
+		if err := s.moveUserVectors(tx, winnerUserID, loserUserID); err != nil {
+			return err
+		}
+	}
 	for _, stmt := range []string{
 		`UPDATE memory_entries SET canonical_user_id = ? WHERE canonical_user_id = ?`,
 		`UPDATE session_turns SET canonical_user_id = ? WHERE canonical_user_id = ?`,
@@ -281,7 +357,7 @@ ON CONFLICT(canonical_user_id, scope, statement_key) DO UPDATE SET
 	if id == 0 {
 		_ = s.sql.QueryRow(`SELECT id FROM memory_entries WHERE canonical_user_id = ? AND scope = ? AND statement_key = ?`, userID, scope, statementKey(statement)).Scan(&id)
 	}
-	if err := s.storeMemoryVector(id, embedding); err != nil {
+	if err := s.storeMemoryVector(id, userID, embedding); err != nil {
 		return MemoryEntry{}, err
 	}
 	entry, err := s.EntryByID(id)
@@ -336,12 +412,13 @@ func (s *Store) searchWithVector(userID, scope, category, query string, queryVec
 			entries = vectorEntries
 		} else {
 			var err error
-			entries, err = s.activeEntries(userID, normalizedScope, normalizedCategory)
+			entries, err = s.activeEntries(userID, normalizedScope, normalizedCategory, 0)
 			if err != nil || len(entries) == 0 {
 				return entries, err
 			}
+			loweredQuery := strings.ToLower(query)
 			for i := range entries {
-				if strings.Contains(strings.ToLower(entries[i].Statement), strings.ToLower(query)) {
+				if strings.Contains(strings.ToLower(entries[i].Statement), loweredQuery) {
 					entries[i].Score = 0.55 + (float64(entries[i].Importance)/5)*0.20
 				}
 			}
@@ -349,7 +426,9 @@ func (s *Store) searchWithVector(userID, scope, category, query string, queryVec
 		}
 	} else {
 		var err error
-		entries, err = s.activeEntries(userID, normalizedScope, normalizedCategory)
+		// Listing needs no scoring, so only the rows that will be returned
+		// are read and scanned.
+		entries, err = s.activeEntries(userID, normalizedScope, normalizedCategory, limit)
 		if err != nil || len(entries) == 0 {
 			return entries, err
 		}
@@ -363,18 +442,38 @@ func (s *Store) searchWithVector(userID, scope, category, query string, queryVec
 	if len(entries) > limit {
 		entries = entries[:limit]
 	}
-	ids := make([]any, 0, len(entries))
-	for _, entry := range entries {
-		ids = append(ids, entry.ID)
-		s.recordEvent(entry.ID, "retrieved", "", "", "")
+	_ = s.markRetrieved(entries)
+	return entries, nil
+}
+
+// markRetrieved records retrieval events and bumps last_used_at for entries in
+// one transaction with one statement each, instead of two autocommitted
+// writes per entry. Failures are best-effort, like other bookkeeping writes.
+func (s *Store) markRetrieved(entries []MemoryEntry) error {
+	if len(entries) == 0 {
+		return nil
 	}
-	if len(ids) > 0 {
-		now := formatTime(time.Now())
-		for _, id := range ids {
-			_, _ = s.sql.Exec(`UPDATE memory_entries SET last_used_at = ? WHERE id = ?`, now, id)
+	now := formatTime(time.Now())
+	placeholders := make([]string, len(entries))
+	eventRows := make([]string, len(entries))
+	updateArgs := make([]any, 0, len(entries)+1)
+	eventArgs := make([]any, 0, len(entries)*2)
+	updateArgs = append(updateArgs, now)
+	for i, entry := range entries {
+		placeholders[i] = "?"
+		eventRows[i] = "(?, 'retrieved', '', '', ?, '')"
+		updateArgs = append(updateArgs, entry.ID)
+		eventArgs = append(eventArgs, nullableID(entry.ID), now)
+	}
+	return s.withTx("memory retrieval bookkeeping", func(tx *sql.Tx) error {
+		if _, err := tx.Exec(`INSERT INTO memory_events (memory_id, event_type, request_id, session_id, created_at, metadata) VALUES `+strings.Join(eventRows, ", "), eventArgs...); err != nil {
+			return fmt.Errorf("failed to record memory retrieval events: %w", err)
 		}
-	}
-	return entries, nil
+		if _, err := tx.Exec(`UPDATE memory_entries SET last_used_at = ? WHERE id IN (`+strings.Join(placeholders, ",")+`)`, updateArgs...); err != nil {
+			return fmt.Errorf("failed to update memory last_used_at: %w", err)
+		}
+		return nil
+	})
 }
 
 // ListMemories returns active memories without semantic ranking.
@@ -389,11 +488,11 @@ func (s *Store) Forget(userID, target, scope string) (int64, error) {
 		return 0, fmt.Errorf("memory target is required")
 	}
 	if strings.EqualFold(target, "all") {
-		res, err := s.sql.Exec(`UPDATE memory_entries SET status = 'deleted', updated_at = ? WHERE canonical_user_id = ? AND status = 'active'`, formatTime(time.Now()), userID)
+		count, err := s.deactivate("memory delete", `UPDATE memory_entries SET status = 'deleted', updated_at = ? WHERE canonical_user_id = ? AND status = 'active' RETURNING id`, formatTime(time.Now()), userID)
 		if err != nil {
 			return 0, fmt.Errorf("failed to delete memories for %q: %w", userID, err)
 		}
-		return res.RowsAffected()
+		return count, nil
 	}
 	stmt := `UPDATE memory_entries SET status = 'deleted', updated_at = ? WHERE canonical_user_id = ? AND statement_key = ? AND status = 'active'`
 	args := []any{formatTime(time.Now()), userID, statementKey(target)}
@@ -401,11 +500,11 @@ func (s *Store) Forget(userID, target, scope string) (int64, error) {
 		stmt += ` AND scope = ?`
 		args = append(args, normalizeScope(scope))
 	}
-	res, err := s.sql.Exec(stmt, args...)
+	count, err := s.deactivate("memory delete", stmt+` RETURNING id`, args...)
 	if err != nil {
 		return 0, fmt.Errorf("failed to delete memory for %q: %w", userID, err)
 	}
-	return res.RowsAffected()
+	return count, nil
 }
 
 // Read renders all active memories for compatibility with older callers/tests.
@@ -450,23 +549,22 @@ func (s *Store) AppendSessionTurn(ctx context.Context, sessionID, userID, userTe
 	if strings.TrimSpace(sessionID) == "" || strings.TrimSpace(userID) == "" || strings.TrimSpace(assistantText) == "" {
 		return nil
 	}
-	if err := s.ensureAccountUser(userID); err != nil {
-		return err
-	}
 	now := time.Now().UTC()
 	var expires *time.Time
 	if ttl > 0 {
 		exp := now.Add(ttl).UTC()
 		expires = &exp
 	}
-	_, err := s.sql.Exec(`
-INSERT INTO session_turns (session_id, canonical_user_id, user_text, assistant_text, tool_names, importance, created_at, expires_at)
-VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-`, sessionID, userID, strings.TrimSpace(userText), strings.TrimSpace(assistantText), strings.Join(uniqueStrings(toolNames), ","), 2, formatTime(now), nullableTime(expires))
-	if err != nil {
-		return fmt.Errorf("failed to append session turn: %w", err)
-	}
-	return nil
+	return s.withTx("append session turn", func(tx *sql.Tx) error {
+		if err := ensureAccountUser(tx.Stmt(s.stmts.ensureAccountUser), userID); err != nil {
+			return err
+		}
+		_, err := tx.Stmt(s.stmts.appendTurn).Exec(sessionID, userID, strings.TrimSpace(userText), strings.TrimSpace(assistantText), strings.Join(uniqueStrings(toolNames), ","), 2, formatTime(now), nullableTime(expires))
+		if err != nil {
+			return fmt.Errorf("failed to append session turn: %w", err)
+		}
+		return nil
+	})
 }
 
 // RecentSessionTurns returns a user's newest completed session exchanges, newest first.
@@ -483,15 +581,12 @@ func (s *Store) RecentSessionTurns(userID, sessionID string, offset int, count i
 	if err := s.expireOldSessionTurns(); err != nil {
 		return nil, err
 	}
-	rows, err := s.sql.Query(`
-SELECT id, session_id, canonical_user_id, user_text, assistant_text, tool_names, importance, topic_tags, created_at, expires_at
-FROM session_turns WHERE canonical_user_id = ? AND session_id = ? ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?
-`, userID, sessionID, count, offset-1)
+	rows, err := s.stmts.recentTurns.Query(userID, sessionID, count, offset-1)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read session turns: %w", err)
 	}
 	defer rows.Close()
-	turns := []SessionTurn{}
+	turns := make([]SessionTurn, 0, count)
 	for rows.Next() {
 		turn, err := scanSessionTurn(rows)
 		if err != nil {
@@ -528,17 +623,28 @@ func (s *Store) BuildContext(ctx context.Context, userID, sessionID, query strin
 	return RetrievedContext{Block: block, RecentTurnCount: len(recent), RecentToolNames: uniqueStrings(toolNames)}, nil
 }
 
+// Static headings for the retrieved-memory block. They stay byte-identical
+// across requests so the block's scaffolding never varies between turns.
+const (
+	retrievedMemoryHeading = "# Retrieved Memory\n"
+	recentExchangesHeading = "\n## Recent Exchanges\n"
+)
+
 func (s *Store) renderContextBlock(recent []SessionTurn, maxChars int) string {
-	var b strings.Builder
-	b.WriteString("# Retrieved Memory\n")
-	if len(recent) > 0 {
-		b.WriteString("\n## Recent Exchanges\n")
-		writeTurns(&b, recent)
-	}
-	text := strings.TrimSpace(b.String())
-	if text == "# Retrieved Memory" {
+	if len(recent) == 0 {
 		return ""
 	}
+
+	size := len(retrievedMemoryHeading) + len(recentExchangesHeading)
+	for _, turn := range recent {
+		size += len(turn.UserText) + len(turn.AssistantText) + 32
+	}
+	var b strings.Builder
+	b.Grow(size)
+	b.WriteString(retrievedMemoryHeading)
+	b.WriteString(recentExchangesHeading)
+	writeTurns(&b, recent)
+	text := strings.TrimSpace(b.String())
 	if len(text) > maxChars {
 		text = text[:maxChars] + "..."
 	}
@@ -557,15 +663,23 @@ func writeEntries(b *strings.Builder, entries []MemoryEntry) {
 func writeTurns(b *strings.Builder, turns []SessionTurn) {
 	for i := len(turns) - 1; i >= 0; i-- {
 		turn := turns[i]
-		fmt.Fprintf(b, "User: %s\nAssistant: %s\n", strings.TrimSpace(turn.UserText), strings.TrimSpace(turn.AssistantText))
+		b.WriteString("User: ")
+		b.WriteString(strings.TrimSpace(turn.UserText))
+		b.WriteString("\nAssistant: ")
+		b.WriteString(strings.TrimSpace(turn.AssistantText))
+		b.WriteString("\n")
 		if len(turn.ToolNames) > 0 {
-			fmt.Fprintf(b, "Tools used: %s\n", strings.Join(turn.ToolNames, ", "))
+			b.WriteString("Tools used: ")
+			b.WriteString(strings.Join(turn.ToolNames, ", "))
+			b.WriteString("\n")
 		}
 		b.WriteString("\n")
 	}
 }
 
-func (s *Store) activeEntries(userID, scope, category string) ([]MemoryEntry, error) {
+// activeEntries returns a user's active memories, most important first. A
+// positive limit caps how many rows are read.
+func (s *Store) activeEntries(userID, scope, category string, limit int) ([]MemoryEntry, error) {
 	query := `SELECT id, canonical_user_id, scope, category, statement, evidence, confidence, importance, status, source_session_id, created_at, updated_at, last_used_at, expires_at, COALESCE(supersedes_id, 0), embedding_model, embedding_dim FROM memory_entries WHERE canonical_user_id = ? AND status = 'active'`
 	args := []any{userID}
 	if scope != "" {
@@ -577,6 +691,10 @@ func (s *Store) activeEntries(userID, scope, category string) ([]MemoryEntry, er
 		args = append(args, category)
 	}
 	query += ` ORDER BY importance DESC, updated_at DESC`
+	if limit > 0 {
+		query += ` LIMIT ?`
+		args = append(args, limit)
+	}
 	rows, err := s.sql.Query(query, args...)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read memories: %w", err)
@@ -627,7 +745,7 @@ func scanSessionTurn(rows interface{ Scan(...any) error }) (SessionTurn, error)
 	return turn, nil
 }
 
-func (s *Store) storeMemoryVector(rowID int64, embedding []float64) error {
+func (s *Store) storeMemoryVector(rowID int64, userID string, embedding []float64) error {
 	if rowID <= 0 || len(embedding) == 0 {
 		return nil
 	}
@@ -638,16 +756,25 @@ func (s *Store) storeMemoryVector(rowID int64, embedding []float64) error {
 	if err != nil {
 		return err
 	}
-	if _, err := s.sql.Exec(`INSERT OR REPLACE INTO memory_entry_vectors(rowid, embedding) VALUES (?, ?)`, rowID, serialized); err != nil {
+	if _, err := s.sql.Exec(`INSERT OR REPLACE INTO memory_entry_vectors(rowid, canonical_user_id, embedding) VALUES (?, ?, ?)`, rowID, userID, serialized); err != nil {
 		return fmt.Errorf("failed to store memory vector: %w", err)
 	}
 	return nil
 }
 
 func (s *Store) searchMemoryVectors(queryVector []float64, userID, scope, category string, limit int) ([]MemoryEntry, bool, error) {
-	if len(queryVector) == 0 || !s.vectorTableExists("memory_entry_vectors") {
+	if len(queryVector) == 0 {
+		return nil, false, nil
+	}
+	dim, partitioned, ok := s.vectorTableSchema("memory_entry_vectors")
+	if !ok {
 		return nil, false, nil
 	}
+	if !partitioned {
+		if err := s.ensureVectorTable("memory_entry_vectors", dim); err != nil {
+			return nil, true, err
+		}
+	}
 	serialized, err := serializeVector(queryVector)
 	if err != nil {
 		return nil, false, err
@@ -663,7 +790,7 @@ func (s *Store) searchMemoryVectors(queryVector []float64, userID, scope, catego
 SELECT e.id, e.canonical_user_id, e.scope, e.category, e.statement, e.evidence, e.confidence, e.importance, e.status, e.source_session_id, e.created_at, e.updated_at, e.last_used_at, e.expires_at, COALESCE(e.supersedes_id, 0), e.embedding_model, e.embedding_dim, v.distance
 FROM memory_entry_vectors v
 JOIN memory_entries e ON e.id = v.rowid
-WHERE v.embedding MATCH ? AND v.k = ? AND e.canonical_user_id = ? AND e.status = 'active'`
+WHERE v.embedding MATCH ? AND v.k = ? AND v.canonical_user_id = ? AND e.status = 'active'`
 	args := []any{serialized, k, userID}
 	if scope != "" {
 		query += ` AND e.scope = ?`
@@ -719,39 +846,151 @@ func (s *Store) ensureVectorTable(name string, dimension int) error {
 	if dimension <= 0 {
 		return fmt.Errorf("embedding dimension must be positive")
 	}
-	if dim, ok := s.vectorTableDimension(name); ok && dim == dimension {
-		return nil
+	dim, partitioned, ok := s.vectorTableSchema(name)
+	if ok && dim == dimension {
+		if partitioned {
+			return nil
+		}
+		return s.rememberVectorTable(name, dimension, s.partitionVectorTable(name, dimension))
 	}
 	if _, err := s.sql.Exec(fmt.Sprintf(`DROP TABLE IF EXISTS %s`, name)); err != nil {
-		return fmt.Errorf("failed to drop stale vector table %s: %w", name, err)
+		return s.rememberVectorTable(name, dimension, fmt.Errorf("failed to drop stale vector table %s: %w", name, err))
 	}
-	if _, err := s.sql.Exec(fmt.Sprintf(`CREATE VIRTUAL TABLE %s USING vec0(embedding float[%d])`, name, dimension)); err != nil {
-		return fmt.Errorf("failed to create vector table %s: %w", name, err)
+	if _, err := s.sql.Exec(vectorTableDDL(name, dimension)); err != nil {
+		return s.rememberVectorTable(name, dimension, fmt.Errorf("failed to create vector table %s: %w", name, err))
 	}
+	return s.rememberVectorTable(name, dimension, nil)
+}
+
+// rememberVectorTable records the partitioned table ensureVectorTable just
+// built. On failure the table's state is unknown, so the cached schema is
+// dropped and re-read on next use.
+func (s *Store) rememberVectorTable(name string, dimension int, err error) error {
+	s.vectorMu.Lock()
+	defer s.vectorMu.Unlock()
+	if err != nil {
+		delete(s.vectorTables, name)
+		return err
+	}
+	if s.vectorTables == nil {
+		s.vectorTables = make(map[string]vectorTableInfo)
+	}
+	s.vectorTables[name] = vectorTableInfo{dim: dimension, partitioned: true, exists: true}
 	return nil
 }
 
-func (s *Store) vectorTableExists(name string) bool {
-	_, ok := s.vectorTableDimension(name)
-	return ok
+// vectorTableDDL partitions vectors by user so a KNN query only scans the
+// requesting user's embeddings instead of ranking every user's and then
+// discarding the ones that do not match.
+func vectorTableDDL(name string, dimension int) string {
+	return fmt.Sprintf(`CREATE VIRTUAL TABLE %s USING vec0(canonical_user_id text partition key, embedding float[%d])`, name, dimension)
 }
 
-func (s *Store) vectorTableDimension(name string) (int, bool) {
+// partitionVectorTable rebuilds a vector table created before user
+// partitioning, carrying each embedding over under its entry's owner.
+func (s *Store) partitionVectorTable(name string, dimension int) error {
+	return s.withTx("vector table partitioning", func(tx *sql.Tx) error {
+		rows, err := tx.Query(fmt.Sprintf(`SELECT v.rowid, e.canonical_user_id, v.embedding FROM %s v JOIN memory_entries e ON e.id = v.rowid`, name))
+		if err != nil {
+			return fmt.Errorf("failed to read vectors from %s: %w", name, err)
+		}
+		vectors, err := scanStoredVectors(rows)
+		if err != nil {
+			return err
+		}
+		if _, err := tx.Exec(fmt.Sprintf(`DROP TABLE %s`, name)); err != nil {
+			return fmt.Errorf("failed to drop unpartitioned vector table %s: %w", name, err)
+		}
+		if _, err := tx.Exec(vectorTableDDL(name, dimension)); err != nil {
+			return fmt.Errorf("failed to create vector table %s: %w", name, err)
+		}
+		return insertStoredVectors(tx, name, vectors)
+	})
+}
+
+// moveUserVectors re-files a merged user's embeddings under the winning
+// user's partition. Partition keys cannot be updated in place.
+func (s *Store) moveUserVectors(tx *sql.Tx, winnerUserID, loserUserID string) error {
+	rows, err := tx.Query(`SELECT v.rowid, ?, v.embedding FROM memory_entries e JOIN memory_entry_vectors v ON v.rowid = e.id WHERE e.canonical_user_id = ?`, winnerUserID, loserUserID)
+	if err != nil {
+		return fmt.Errorf("failed to read merged user vectors: %w", err)
+	}
+	vectors, err := scanStoredVectors(rows)
+	if err != nil {
+		return err
+	}
+	for _, vector := range vectors {
+		if _, err := tx.Exec(`DELETE FROM memory_entry_vectors WHERE rowid = ?`, vector.rowID); err != nil {
+			return fmt.Errorf("failed to move merged user vector: %w", err)
+		}
+	}
+	return insertStoredVectors(tx, "memory_entry_vectors", vectors)
+}
+
+type storedVector struct {
+	rowID     int64
+	userID    string
+	embedding []byte
+}
+
+func scanStoredVectors(rows *sql.Rows) ([]storedVector, error) {
+	defer rows.Close()
+	var vectors []storedVector
+	for rows.Next() {
+		var vector storedVector
+		if err := rows.Scan(&vector.rowID, &vector.userID, &vector.embedding); err != nil {
+			return nil, fmt.Errorf("failed to scan stored vector: %w", err)
+		}
+		vectors = append(vectors, vector)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read stored vectors: %w", err)
+	}
+	return vectors, nil
+}
+
+func insertStoredVectors(tx *sql.Tx, name string, vectors []storedVector) error {
+	for _, vector := range vectors {
+		if _, err := tx.Exec(fmt.Sprintf(`INSERT INTO %s(rowid, canonical_user_id, embedding) VALUES (?, ?, ?)`, name), vector.rowID, vector.userID, vector.embedding); err != nil {
+			return fmt.Errorf("failed to store vector in %s: %w", name, err)
+		}
+	}
+	return nil
+}
+
+// vectorTableSchema reports a vector table's dimension and whether it is
+// partitioned by user.
+func (s *Store) vectorTableSchema(name string) (int, bool, bool) {
+	s.vectorMu.Lock()
+	defer s.vectorMu.Unlock()
+	if info, ok := s.vectorTables[name]; ok {
+		return info.dim, info.partitioned, info.exists
+	}
+	dim, partitioned, exists := s.readVectorTableSchema(name)
+	if s.vectorTables == nil {
+		s.vectorTables = make(map[string]vectorTableInfo)
+	}
+	s.vectorTables[name] = vectorTableInfo{dim: dim, partitioned: partitioned, exists: exists}
+	return dim, partitioned, exists
+}
+
+// readVectorTableSchema parses a vector table's definition from sqlite_master.
+func (s *Store) readVectorTableSchema(name string) (int, bool, bool) {
 	var sqlText string
 	err := s.sql.QueryRow(`SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?`, name).Scan(&sqlText)
 	if err != nil || !strings.Contains(sqlText, "float[") {
-		return 0, false
+		return 0, false, false
 	}
 	start := strings.Index(sqlText, "float[") + len("float[")
 	end := strings.Index(sqlText[start:], "]")
 	if end < 0 {
-		return 0, false
+		return 0, false, false
 	}
 	var dim int
 	if _, err := fmt.Sscanf(sqlText[start:start+end], "%d", &dim); err != nil || dim <= 0 {
-		return 0, false
+		return 0, false, false
 	}
-	return dim, true
+	return dim, strings.Contains(sqlText, "partition key"), true
 }
 
 func serializeVector(values []float64) ([]byte, error) {
@@ -786,20 +1025,68 @@ func (s *Store) markSuperseded(userID, scope, statement string) (int64, error) {
 	if err != nil {
 		return 0, fmt.Errorf("failed to find superseded memory: %w", err)
 	}
-	if _, err := s.sql.Exec(`UPDATE memory_entries SET status = 'superseded', updated_at = ? WHERE id = ?`, formatTime(time.Now()), id); err != nil {
+	if _, err := s.deactivate("memory supersede", `UPDATE memory_entries SET status = 'superseded', updated_at = ? WHERE id = ? RETURNING id`, formatTime(time.Now()), id); err != nil {
 		return 0, fmt.Errorf("failed to supersede memory: %w", err)
 	}
 	return id, nil
 }
 
 func (s *Store) expireOldMemories() error {
-	_, err := s.sql.Exec(`UPDATE memory_entries SET status = 'expired', updated_at = ? WHERE status = 'active' AND expires_at IS NOT NULL AND datetime(expires_at) <= datetime(?)`, formatTime(time.Now()), formatTime(time.Now()))
-	if err != nil {
+	if _, err := s.deactivate("memory expiry", `UPDATE memory_entries SET status = 'expired', updated_at = ? WHERE status = 'active' AND expires_at IS NOT NULL AND datetime(expires_at) <= datetime(?) RETURNING id`, formatTime(time.Now()), formatTime(time.Now())); err != nil {
 		return fmt.Errorf("failed to expire memories: %w", err)
 	}
 	return nil
 }
 
+// deactivate runs query, an UPDATE ... RETURNING id that moves entries out of
+// the active set, and drops the vectors of exactly those entries in the same
+// transaction so KNN candidates are never spent on rows the search would
+// discard. It returns the number of deactivated entries.
+func (s *Store) deactivate(operation, query string, args ...any) (int64, error) {
+	_, _, hasVectors := s.vectorTableSchema("memory_entry_vectors")
+	var count int64
+	err := s.withTx(operation, func(tx *sql.Tx) error {
+		rows, err := tx.Query(query, args...)
+		if err != nil {
+			return err
+		}
+		var ids []int64
+		for rows.Next() {
+			var id int64
+			if err := rows.Scan(&id); err != nil {
+				rows.Close()
+				return err
+			}
+			ids = append(ids, id)
+		}
+		if err := rows.Close(); err != nil {
+			return err
+		}
+		if err := rows.Err(); err != nil {
+			return err
+		}
+		count = int64(len(ids))
+		if count == 0 || !hasVectors {
+			return nil
+		}
+		stmt, err := tx.Prepare(`DELETE FROM memory_entry_vectors WHERE rowid = ?`)
+		if err != nil {
+			return fmt.Errorf("failed to prepare memory vector delete: %w", err)
+		}
+		defer stmt.Close()
+		for _, id := range ids {
+			if _, err := stmt.Exec(id); err != nil {
+				return fmt.Errorf("failed to drop inactive memory vector: %w", err)
+			}
+		}
+		return nil
+	})
+	if err != nil {
+		return 0, err
+	}
+	return count, nil
+}
+
 func (s *Store) expireOldSessionTurns() error {
 	_, err := s.sql.Exec(`DELETE FROM session_turns WHERE expires_at IS NOT NULL AND datetime(expires_at) <= datetime(?)`, formatTime(time.Now()))
 	if err != nil {
@@ -813,17 +1100,38 @@ func (s *Store) recordEvent(memoryID int64, eventType, requestID, sessionID, met
 }
 
 func (s *Store) ensureAccountUser(userID string) error {
+	return ensureAccountUser(s.stmts.ensureAccountUser, userID)
+}
+
+func ensureAccountUser(stmt *sql.Stmt, userID string) error {
 	if strings.TrimSpace(userID) == "" {
 		return fmt.Errorf("user memory: user id is required")
 	}
 	now := formatTime(time.Now())
-	_, err := s.sql.Exec(`INSERT OR IGNORE INTO account_users (canonical_user_id, created_at, updated_at) VALUES (?, ?, ?)`, userID, now, now)
+	_, err := stmt.Exec(userID, now, now)
 	if err != nil {
 		return fmt.Errorf("failed to ensure account user %q: %w", userID, err)
 	}
 	return nil
 }
 
+// withTx runs fn in one transaction so multi-statement writes commit with a
+// single journal sync instead of one per autocommitted statement.
+func (s *Store) withTx(operation string, fn func(*sql.Tx) error) error {
+	tx, err := s.sql.Begin()
+	if err != nil {
+		return fmt.Errorf("failed to begin %s: %w", operation, err)
+	}
+	defer tx.Rollback() // nolint:errcheck
+	if err := fn(tx); err != nil {
+		return err
+	}
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("failed to commit %s: %w", operation, err)
+	}
+	return nil
+}
+
 func (s *Store) embedBestEffort(ctx context.Context, text string) []float64 {
 	if s == nil || s.embedder == nil || strings.TrimSpace(s.embedModel) == "" || strings.TrimSpace(text) == "" {
 		return nil
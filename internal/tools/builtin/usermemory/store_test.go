@@ -2,6 +2,7 @@ package usermemory
 
 import (
 	"context"
+	"fmt"
 	"path/filepath"
 	"strings"
 	"testing"
@@ -54,6 +55,16 @@ func TestStoreSaveSearchAndForgetMemory(t *testing.T) {
 	if len(entries) != 1 || !strings.Contains(entries[0].Statement, "purple") {
 		t.Fatalf("expected purple memory, got %+v", entries)
 	}
+	var retrievedEvents, touched int
+	if err := store.sql.QueryRow(`SELECT COUNT(*) FROM memory_events WHERE event_type = 'retrieved' AND memory_id = ?`, entry.ID).Scan(&retrievedEvents); err != nil {
+		t.Fatal(err)
+	}
+	if err := store.sql.QueryRow(`SELECT COUNT(*) FROM memory_entries WHERE id = ? AND last_used_at IS NOT NULL`, entry.ID).Scan(&touched); err != nil {
+		t.Fatal(err)
+	}
+	if retrievedEvents != 1 || touched != 1 {
+		t.Fatalf("retrieval bookkeeping = %d events, %d touched; want 1 and 1", retrievedEvents, touched)
+	}
 
 	deleted, err := store.Forget("usr_test", "The user likes purple.", ScopeLongTerm)
 	if err != nil {
@@ -71,6 +82,67 @@ func TestStoreSaveSearchAndForgetMemory(t *testing.T) {
 	}
 }
 
+func TestSearchMemoryVectorsIsScopedToUserPartition(t *testing.T) {
+	store, err := NewSQLiteStore(filepath.Join(t.TempDir(), "oswald.db"), fakeMemoryEmbedder{}, "fake-embed", config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer store.Close() // nolint:errcheck
+
+	ctx := context.Background()
+	// Enough identical vectors from another user to fill a global top-k.
+	for i := 0; i < 30; i++ {
+		statement := fmt.Sprintf("Other user note %d about purple.", i)
+		if _, err := store.SaveMemory(ctx, "usr_other", SaveRequest{Scope: ScopeLongTerm, Category: "notes", Statement: statement}); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if _, err := store.SaveMemory(ctx, "usr_test", SaveRequest{Scope: ScopeLongTerm, Category: "durable_preferences", Statement: "The user likes purple."}); err != nil {
+		t.Fatal(err)
+	}
+
+	entries, ok, err := store.searchMemoryVectors([]float64{1, 0}, "usr_test", "", "", 5)
+	if err != nil || !ok {
+		t.Fatalf("vector search ok=%v err=%v", ok, err)
+	}
+	if len(entries) != 1 || entries[0].UserID != "usr_test" {
+		t.Fatalf("expected only usr_test memory, got %+v", entries)
+	}
+}
+
+func TestForgetDropsMemoryVector(t *testing.T) {
+	store, err := NewSQLiteStore(filepath.Join(t.TempDir(), "oswald.db"), fakeMemoryEmbedder{}, "fake-embed", config.NewLogger(config.LevelError))
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer store.Close() // nolint:errcheck
+
+	entry, err := store.SaveMemory(context.Background(), "usr_test", SaveRequest{Scope: ScopeLongTerm, Category: "durable_preferences", Statement: "The user likes purple."})
+	if err != nil {
+		t.Fatal(err)
+	}
+	other, err := store.SaveMemory(context.Background(), "usr_other", SaveRequest{Scope: ScopeLongTerm, Category: "durable_preferences", Statement: "The user likes green."})
+	if err != nil {
+		t.Fatal(err)
+	}
+	if count, err := store.Forget("usr_test", "The user likes purple.", ScopeLongTerm); err != nil || count != 1 {
+		t.Fatalf("forget count=%d err=%v, want 1", count, err)
+	}
+	var vectors int
+	if err := store.sql.QueryRow(`SELECT COUNT(*) FROM memory_entry_vectors WHERE rowid = ?`, entry.ID).Scan(&vectors); err != nil {
+		t.Fatal(err)
+	}
+	if vectors != 0 {
+		t.Fatalf("expected forgotten memory vector to be dropped, found %d", vectors)
+	}
+	if err := store.sql.QueryRow(`SELECT COUNT(*) FROM memory_entry_vectors WHERE rowid = ?`, other.ID).Scan(&vectors); err != nil {
+		t.Fatal(err)
+	}
+	if vectors != 1 {
+		t.Fatalf("expected another user's active vector to remain, found %d", vectors)
+	}
+}
+
 func TestStoreShortTermExpiry(t *testing.T) {
 	store := NewStore(filepath.Join(t.TempDir(), "oswald.db"), config.NewLogger(config.LevelError))
 	defer store.Close() // nolint:errcheck
@@ -174,3 +246,22 @@ func TestBuildContextDoesNotEmbedQuery(t *testing.T) {
 		t.Fatalf("expected no query embeddings from automatic context, got %d: %+v", len(queryEmbeddings), queryEmbeddings)
 	}
 }
+
+func TestRenderContextBlockFormatsTurnsOldestFirst(t *testing.T) {
+	s := &Store{}
+	if got := s.renderContextBlock(nil, 100); got != "" {
+		t.Fatalf("renderContextBlock(nil) = %q, want empty", got)
+	}
+
+	recent := []SessionTurn{
+		{UserText: " second ", AssistantText: "reply two", ToolNames: []string{"web.search", "memory.save"}},
+		{UserText: "first", AssistantText: "reply one"},
+	}
+	want := "# Retrieved Memory\n\n## Recent Exchanges\nUser: first\nAssistant: reply one\n\nUser: second\nAssistant: reply two\nTools used: web.search, memory.save"
+	if got := s.renderContextBlock(recent, 1000); got != want {
+		t.Fatalf("renderContextBlock = %q, want %q", got, want)
+	}
+	if got := s.renderContextBlock(recent, 18); got != "# Retrieved Memory..." {
+		t.Fatalf("truncated renderContextBlock = %q", got)
+	}
+}
@@ -10,9 +10,14 @@ import (
 	"github.com/jonahgcarpenter/oswald-ai/internal/requestctx"
 )
 
-func requestLog(log *config.Logger, ctx context.Context) *config.Logger {
+// logDebug writes a request-scoped debug event, deriving the request logger
+// only when debug logging is enabled.
+func logDebug(log *config.Logger, ctx context.Context, event, msg string, fields ...config.Field) {
+	if !log.Enabled(config.LevelDebug) {
+		return
+	}
 	meta := requestctx.MetadataFromContext(ctx)
-	return log.Agent("agent.tool.memory", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model)
+	log.Agent("agent.tool.memory", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model).Debug(event, msg, fields...)
 }
 
 // NewSaveHandler returns a Handler for explicit user-requested memory saves.
@@ -50,7 +55,7 @@ func NewSaveHandler(store *Store, log *config.Logger) func(ctx context.Context,
 		if err != nil {
 			return "", err
 		}
-		requestLog(log, ctx).Debug("agent.tool.memory.saved", "saved memory", config.F("tool_name", "memory.save"), config.F("scope", entry.Scope), config.F("category", entry.Category))
+		logDebug(log, ctx, "agent.tool.memory.saved", "saved memory", config.F("tool_name", "memory.save"), config.F("scope", entry.Scope), config.F("category", entry.Category))
 		return fmt.Sprintf("Saved %s memory (%s): %s", entry.Scope, entry.Category, entry.Statement), nil
 	}
 }
@@ -69,7 +74,7 @@ func NewSearchHandler(store *Store, log *config.Logger) func(ctx context.Context
 		if len(entries) == 0 {
 			return "No matching memories found for this user.", nil
 		}
-		requestLog(log, ctx).Debug("agent.tool.memory.searched", "searched memory", config.F("tool_name", "memory.search"), config.F("returned_count", len(entries)))
+		logDebug(log, ctx, "agent.tool.memory.searched", "searched memory", config.F("tool_name", "memory.search"), config.F("returned_count", len(entries)))
 		return RenderMemory("", entries), nil
 	}
 }
@@ -89,7 +94,7 @@ func NewListHandler(store *Store, log *config.Logger) func(ctx context.Context,
 			return "No active memories found for this user.", nil
 		}
 		intro, _ := store.ReadIntro(userID)
-		requestLog(log, ctx).Debug("agent.tool.memory.listed", "listed memory", config.F("tool_name", "memory.list"), config.F("returned_count", len(entries)))
+		logDebug(log, ctx, "agent.tool.memory.listed", "listed memory", config.F("tool_name", "memory.list"), config.F("returned_count", len(entries)))
 		return RenderMemory(intro, entries), nil
 	}
 }
@@ -112,7 +117,7 @@ func NewForgetHandler(store *Store, log *config.Logger) func(ctx context.Context
 		if err != nil {
 			return "", err
 		}
-		requestLog(log, ctx).Debug("agent.tool.memory.forgot", "forgot memory", config.F("tool_name", "memory.forget"), config.F("deleted_count", count))
+		logDebug(log, ctx, "agent.tool.memory.forgot", "forgot memory", config.F("tool_name", "memory.forget"), config.F("deleted_count", count))
 		if count == 0 {
 			return "No matching active memories were found.", nil
 		}
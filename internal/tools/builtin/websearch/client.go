@@ -7,6 +7,8 @@ import (
 	"io"
 	"net/http"
 	"net/url"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
@@ -18,6 +20,18 @@ const (
 
 	// httpTimeout is the per-request timeout for SearXNG calls.
 	httpTimeout = 10 * time.Second
+
+	// maxIdleConnsPerHost keeps enough warm connections to SearXNG for the
+	// searches of a turn to run concurrently without re-dialing.
+	maxIdleConnsPerHost = 8
+
+	// resultCacheTTL bounds how long a query's results are reused. Repeated and
+	// re-worded-by-case queries within this window skip the SearXNG round trip.
+	resultCacheTTL = 10 * time.Minute
+
+	// maxCachedSearches bounds the result cache; the least recently used
+	// query is evicted once it is full.
+	maxCachedSearches = 256
 )
 
 // Client implements Searcher against a local SearXNG instance.
@@ -25,6 +39,9 @@ type Client struct {
 	baseURL    string
 	httpClient *http.Client
 	log        *config.Logger
+
+	cacheMu sync.Mutex
+	cache   map[string]cachedSearch
 }
 
 // NewClient creates a SearXNG web search client targeting the given base URL.
@@ -32,14 +49,32 @@ func NewClient(baseURL string, log *config.Logger) *Client {
 	return &Client{
 		baseURL: baseURL,
 		httpClient: &http.Client{
-			Timeout: httpTimeout,
+			Timeout:   httpTimeout,
+			Transport: newTransport(),
 		},
-		log: log,
+		log:   log,
+		cache: make(map[string]cachedSearch),
 	}
 }
 
+// newTransport returns a dedicated keep-alive transport for SearXNG so search
+// connections are reused across calls instead of competing for the default
+// transport's two idle slots per host.
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = maxIdleConnsPerHost
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	return transport
+}
+
 // Search queries the configured SearXNG instance for the given query string.
 func (c *Client) Search(ctx context.Context, query string) ([]SearchResult, error) {
+	key := normalizeQuery(query)
+	if results, ok := c.cachedResults(key); ok {
+		c.log.Debug("tool.web.search.cache_hit", "web search served from cache", config.F("query_chars", len(query)), config.F("result_count", len(results)))
+		return results, nil
+	}
+
 	reqURL := fmt.Sprintf("%s/search?q=%s&format=json", c.baseURL, url.QueryEscape(query))
 
 	req, err := http.NewRequestWithContext(ctx, http.MethodGet, reqURL, nil)
@@ -60,6 +95,8 @@ func (c *Client) Search(ctx context.Context, query string) ([]SearchResult, erro
 
 	if resp.StatusCode != http.StatusOK {
 		body, _ := io.ReadAll(io.LimitReader(resp.Body, 512))
+		// Drain the rest so the connection can go back to the idle pool.
+		_, _ = io.Copy(io.Discard, resp.Body)
 		c.log.Warn("tool.web.search.response_failed", "web search response failed",
 			config.F("query_chars", len(query)),
 			config.F("http_status", resp.StatusCode),
@@ -69,20 +106,11 @@ func (c *Client) Search(ctx context.Context, query string) ([]SearchResult, erro
 		return nil, fmt.Errorf("SearXNG returned status %d", resp.StatusCode)
 	}
 
-	body, err := io.ReadAll(resp.Body)
+	results, err := decodeResults(resp.Body, maxResults)
 	if err != nil {
-		return nil, fmt.Errorf("failed to read SearXNG response: %w", err)
-	}
-
-	var sr searxngResponse
-	if err := json.Unmarshal(body, &sr); err != nil {
 		return nil, fmt.Errorf("failed to parse SearXNG response: %w", err)
 	}
-
-	results := sr.Results
-	if len(results) > maxResults {
-		results = results[:maxResults]
-	}
+	_, _ = io.Copy(io.Discard, resp.Body)
 
 	out := make([]SearchResult, len(results))
 	for i, r := range results {
@@ -93,6 +121,110 @@ func (c *Client) Search(ctx context.Context, query string) ([]SearchResult, erro
 		}
 	}
 
+	c.cacheResults(key, out)
 	c.log.Debug("tool.web.search.results_returned", "web search returned results", config.F("query_chars", len(query)), config.F("result_count", len(out)))
 	return out, nil
 }
+
+// decodeResults streams a SearXNG response and decodes only the first limit
+// entries of its results array. Responses can run to hundreds of kilobytes,
+// so the remaining results and unrelated top-level fields are never
+// materialized.
+func decodeResults(r io.Reader, limit int) ([]searxngResult, error) {
+	dec := json.NewDecoder(r)
+	if err := expectDelim(dec, '{'); err != nil {
+		return nil, err
+	}
+	for dec.More() {
+		tok, err := dec.Token()
+		if err != nil {
+			return nil, err
+		}
+		if key, _ := tok.(string); key != "results" {
+			var skip json.RawMessage
+			if err := dec.Decode(&skip); err != nil {
+				return nil, err
+			}
+			continue
+		}
+
+		if err := expectDelim(dec, '['); err != nil {
+			return nil, err
+		}
+		results := make([]searxngResult, 0, limit)
+		for len(results) < limit && dec.More() {
+			var result searxngResult
+			if err := dec.Decode(&result); err != nil {
+				return nil, err
+			}
+			results = append(results, result)
+		}
+		return results, nil
+	}
+	return nil, nil
+}
+
+func expectDelim(dec *json.Decoder, want json.Delim) error {
+	tok, err := dec.Token()
+	if err != nil {
+		return err
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != want {
+		return fmt.Errorf("expected %q, got %v", want, tok)
+	}
+	return nil
+}
+
+// normalizeQuery folds case and whitespace so trivially different spellings
+// of the same query share a cache entry.
+func normalizeQuery(query string) string {
+	return strings.Join(strings.Fields(strings.ToLower(query)), " ")
+}
+
+func (c *Client) cachedResults(key string) ([]SearchResult, bool) {
+	c.cacheMu.Lock()
+	defer c.cacheMu.Unlock()
+	c.pruneCacheLocked()
+	entry, ok := c.cache[key]
+	if !ok {
+		return nil, false
+	}
+	entry.LastUsed = time.Now()
+	c.cache[key] = entry
+	return entry.Results, true
+}
+
+func (c *Client) cacheResults(key string, results []SearchResult) {
+	c.cacheMu.Lock()
+	defer c.cacheMu.Unlock()
+	c.pruneCacheLocked()
+	if _, ok := c.cache[key]; !ok && len(c.cache) >= maxCachedSearches {
+		c.evictLeastRecentlyUsedLocked()
+	}
+	now := time.Now()
+	c.cache[key] = cachedSearch{
+		Results:   results,
+		ExpiresAt: now.Add(resultCacheTTL),
+		LastUsed:  now,
+	}
+}
+
+func (c *Client) evictLeastRecentlyUsedLocked() {
+	var oldestKey string
+	var oldest time.Time
+	for key, entry := range c.cache {
+		if oldestKey == "" || entry.LastUsed.Before(oldest) {
+			oldestKey, oldest = key, entry.LastUsed
+		}
+	}
+	delete(c.cache, oldestKey)
+}
+
+func (c *Client) pruneCacheLocked() {
+	now := time.Now()
+	for key, entry := range c.cache {
+		if !entry.ExpiresAt.After(now) {
+			delete(c.cache, key)
+		}
+	}
+}
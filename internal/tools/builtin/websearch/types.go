@@ -1,13 +1,18 @@
 package websearch
 
-// searxngResponse is the top-level JSON response from the SearXNG /search endpoint.
-type searxngResponse struct {
-	Results []searxngResult `json:"results"`
-}
+import "time"
 
-// searxngResult represents a single search result entry in the SearXNG JSON response.
+// searxngResult represents a single entry in the results array of the SearXNG
+// /search JSON response.
 type searxngResult struct {
 	Title   string `json:"title"`
 	URL     string `json:"url"`
 	Content string `json:"content"`
 }
+
+// cachedSearch is a recently returned result set for a normalized query.
+type cachedSearch struct {
+	Results   []SearchResult
+	ExpiresAt time.Time
+	LastUsed  time.Time
+}
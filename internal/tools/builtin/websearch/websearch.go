@@ -31,7 +31,12 @@ func FormatResults(results []SearchResult) string {
 		return "No results found."
 	}
 
+	size := 0
+	for _, r := range results {
+		size += len(r.Title) + len(r.URL) + len(r.Content) + 20
+	}
 	var sb strings.Builder
+	sb.Grow(size)
 	for i, r := range results {
 		fmt.Fprintf(&sb, "%d. %s\n   URL: %s\n   %s\n\n", i+1, r.Title, r.URL, r.Content)
 	}
@@ -90,13 +95,15 @@ func NewHandler(searcher Searcher, log *config.Logger) func(ctx context.Context,
 			return "", fmt.Errorf("query parameter was empty")
 		}
 
-		meta := requestctx.MetadataFromContext(ctx)
-		log.Agent("agent.tool.web.search", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model).Debug(
-			"agent.tool.web.search.start",
-			"starting web search tool",
-			config.F("tool_name", "web.search"),
-			config.F("query_chars", len(query)),
-		)
+		if log.Enabled(config.LevelDebug) {
+			meta := requestctx.MetadataFromContext(ctx)
+			log.Agent("agent.tool.web.search", meta.RequestID, meta.SessionID, meta.SenderID, meta.Gateway, meta.Model).Debug(
+				"agent.tool.web.search.start",
+				"starting web search tool",
+				config.F("tool_name", "web.search"),
+				config.F("query_chars", len(query)),
+			)
+		}
 
 		results, err := searcher.Search(ctx, query)
 		if err != nil {
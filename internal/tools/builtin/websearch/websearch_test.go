@@ -3,11 +3,15 @@ package websearch
 import (
 	"context"
 	"errors"
+	"net"
 	"net/http"
 	"net/http/httptest"
 	"net/url"
+	"strconv"
 	"strings"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
 )
@@ -133,3 +137,111 @@ func TestClientSearchReturnsHTTPAndDecodeErrors(t *testing.T) {
 		t.Fatalf("decode error = %v, want parse SearXNG error", err)
 	}
 }
+
+func TestClientSearchReusesConnections(t *testing.T) {
+	var newConns atomic.Int32
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Query().Get("q") == "down" {
+			http.Error(w, strings.Repeat("x", 4096), http.StatusServiceUnavailable)
+			return
+		}
+		_, _ = w.Write([]byte(`{"results":[]}`))
+	}))
+	server.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			newConns.Add(1)
+		}
+	}
+	server.Start()
+	defer server.Close()
+
+	client := NewClient(server.URL, config.NewLogger(config.LevelError))
+	for _, query := range []string{"one", "down", "two", "three"} {
+		_, _ = client.Search(context.Background(), query)
+	}
+	if got := newConns.Load(); got != 1 {
+		t.Fatalf("server saw %d connections, want 1 reused keep-alive connection", got)
+	}
+}
+
+func TestClientSearchCachesNormalizedQueries(t *testing.T) {
+	var requests atomic.Int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests.Add(1)
+		_, _ = w.Write([]byte(`{"results":[{"title":"Go","url":"https://go.dev","content":"go"}]}`))
+	}))
+	defer server.Close()
+
+	client := NewClient(server.URL, config.NewLogger(config.LevelError))
+	for _, query := range []string{"Go  Release", "go release", " GO release "} {
+		results, err := client.Search(context.Background(), query)
+		if err != nil || len(results) != 1 || results[0].URL != "https://go.dev" {
+			t.Fatalf("Search(%q) = %+v, %v", query, results, err)
+		}
+	}
+	if got := requests.Load(); got != 1 {
+		t.Fatalf("SearXNG saw %d requests, want 1", got)
+	}
+
+	client.cacheMu.Lock()
+	for key, entry := range client.cache {
+		entry.ExpiresAt = time.Now().Add(-time.Second)
+		client.cache[key] = entry
+	}
+	client.cacheMu.Unlock()
+	if _, err := client.Search(context.Background(), "go release"); err != nil {
+		t.Fatalf("Search after expiry: %v", err)
+	}
+	if got := requests.Load(); got != 2 {
+		t.Fatalf("SearXNG saw %d requests after expiry, want 2", got)
+	}
+}
+
+func TestClientResultCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	client := NewClient("http://unused.invalid", config.NewLogger(config.LevelError))
+	for i := 0; i < maxCachedSearches; i++ {
+		client.cacheResults(strconv.Itoa(i), nil)
+	}
+	client.cacheMu.Lock()
+	for key, entry := range client.cache {
+		entry.LastUsed = time.Now().Add(-time.Minute)
+		client.cache[key] = entry
+	}
+	client.cacheMu.Unlock()
+
+	if _, ok := client.cachedResults("0"); !ok {
+		t.Fatal("expected query 0 to be cached")
+	}
+	client.cacheResults("new", nil)
+
+	if got := len(client.cache); got != maxCachedSearches {
+		t.Fatalf("cache size = %d, want %d", got, maxCachedSearches)
+	}
+	if _, ok := client.cachedResults("0"); !ok {
+		t.Fatal("recently used query 0 was evicted")
+	}
+	if _, ok := client.cachedResults("new"); !ok {
+		t.Fatal("new query was not cached")
+	}
+}
+
+func TestDecodeResultsStopsAtLimit(t *testing.T) {
+	body := `{"query":"go","answers":[{"x":[1,2]}],"results":[
+		{"title":"1","url":"https://example.com/1","content":"one"},
+		{"title":"2","url":"https://example.com/2","content":"two"},
+		{"title":"3","url":"https://example.com/3"`
+	results, err := decodeResults(strings.NewReader(body), 2)
+	if err != nil {
+		t.Fatalf("decodeResults returned error: %v", err)
+	}
+	if len(results) != 2 || results[1].URL != "https://example.com/2" {
+		t.Fatalf("decodeResults = %+v, want first two results", results)
+	}
+
+	if results, err := decodeResults(strings.NewReader(`{"query":"go"}`), 2); err != nil || results != nil {
+		t.Fatalf("decodeResults without results = %+v, %v", results, err)
+	}
+	if _, err := decodeResults(strings.NewReader(`[]`), 2); err == nil {
+		t.Fatal("decodeResults accepted a non-object response")
+	}
+}
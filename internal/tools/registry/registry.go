@@ -7,6 +7,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/jonahgcarpenter/oswald-ai/internal/config"
 	"github.com/jonahgcarpenter/oswald-ai/internal/llm"
@@ -65,6 +66,19 @@ type Registry struct {
 	specs    map[string]Spec
 	handlers map[string]Handler
 	log      *config.Logger
+
+	// compiled holds every spec converted to its LLM schema in stable order.
+	// Specs only change at startup, so the schemas are built once on first
+	// use instead of on every model call; any spec change resets it.
+	compiledMu sync.Mutex
+	compiled   []compiledTool
+}
+
+// compiledTool is a spec's LLM schema tagged with what visibility needs.
+type compiledTool struct {
+	source string
+	name   string
+	tool   llm.Tool
 }
 
 // New creates an empty Registry. Call LoadFromDirectory to populate
@@ -117,6 +131,7 @@ func (r *Registry) LoadFromDirectory(dir string) error {
 		spec.Source = ToolSourceBuiltin
 
 		r.specs[spec.Name] = spec
+		r.resetCompiled()
 		r.log.Debug("tool.registry.definition_loaded", "loaded tool definition", config.F("tool_name", spec.Name), config.F("file", entry.Name()))
 		loaded++
 	}
@@ -153,6 +168,7 @@ func (r *Registry) RegisterSpec(spec Spec) error {
 		return fmt.Errorf("tool spec %q is already registered", spec.Name)
 	}
 	r.specs[spec.Name] = spec
+	r.resetCompiled()
 	r.log.Debug("tool.registry.definition_registered", "registered tool definition", config.F("tool_name", spec.Name), config.F("source", spec.Source), config.F("server", spec.Server))
 	return nil
 }
@@ -176,37 +192,63 @@ func (r *Registry) LLMTools() []llm.Tool {
 // ChatRequest.Tools. Builtin tools are always included. MCP tools are included
 // only when explicitly named by the active request's visibility state.
 func (r *Registry) LLMToolsForVisibility(visibility ToolVisibility) []llm.Tool {
-	tools := make([]llm.Tool, 0, len(r.specs))
-	for _, spec := range r.orderedSpecs() {
-		if spec.Source == ToolSourceMCP && !visibility.ExposedMCPTools[spec.Name] {
+	compiled := r.compiledTools()
+	tools := make([]llm.Tool, 0, len(compiled))
+	for _, entry := range compiled {
+		if entry.source == ToolSourceMCP && !visibility.ExposedMCPTools[entry.name] {
 			continue
 		}
-		props := make(map[string]llm.ToolParameterProperty, len(spec.Parameters))
-		required := []string{}
-		for _, p := range spec.Parameters {
-			props[p.Name] = llm.ToolParameterProperty{
-				Type:        p.Type,
-				Description: p.Description,
-				Enum:        p.Enum,
-			}
-			if p.Required {
-				required = append(required, p.Name)
-			}
+		tools = append(tools, entry.tool)
+	}
+	return tools
+}
+
+// compiledTools returns the cached LLM schemas, building them on first use.
+func (r *Registry) compiledTools() []compiledTool {
+	r.compiledMu.Lock()
+	defer r.compiledMu.Unlock()
+	if r.compiled != nil {
+		return r.compiled
+	}
+	compiled := make([]compiledTool, 0, len(r.specs))
+	for _, spec := range r.orderedSpecs() {
+		compiled = append(compiled, compiledTool{source: spec.Source, name: spec.Name, tool: llmTool(spec)})
+	}
+	r.compiled = compiled
+	return compiled
+}
+
+func (r *Registry) resetCompiled() {
+	r.compiledMu.Lock()
+	r.compiled = nil
+	r.compiledMu.Unlock()
+}
+
+func llmTool(spec Spec) llm.Tool {
+	props := make(map[string]llm.ToolParameterProperty, len(spec.Parameters))
+	required := []string{}
+	for _, p := range spec.Parameters {
+		props[p.Name] = llm.ToolParameterProperty{
+			Type:        p.Type,
+			Description: p.Description,
+			Enum:        p.Enum,
+		}
+		if p.Required {
+			required = append(required, p.Name)
 		}
-		tools = append(tools, llm.Tool{
-			Type: "function",
-			Function: llm.ToolDefinition{
-				Name:        spec.Name,
-				Description: toolDescription(spec),
-				Parameters: llm.ToolParameters{
-					Type:       "object",
-					Properties: props,
-					Required:   required,
-				},
+	}
+	return llm.Tool{
+		Type: "function",
+		Function: llm.ToolDefinition{
+			Name:        spec.Name,
+			Description: toolDescription(spec),
+			Parameters: llm.ToolParameters{
+				Type:       "object",
+				Properties: props,
+				Required:   required,
 			},
-		})
+		},
 	}
-	return tools
 }
 
 // BuiltinCatalog returns builtin tool definitions in stable order.
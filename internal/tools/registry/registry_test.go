@@ -154,6 +154,23 @@ func TestRegistryMCPVisibilityAndCatalogOrdering(t *testing.T) {
 	}
 }
 
+func TestRegistryLLMToolsReflectSpecsRegisteredAfterFirstUse(t *testing.T) {
+	reg := New(config.NewLogger(config.LevelError))
+	if err := reg.RegisterSpec(Spec{Name: "b.tool", Description: "B"}); err != nil {
+		t.Fatalf("register b: %v", err)
+	}
+	if tools := reg.LLMTools(); len(tools) != 1 {
+		t.Fatalf("expected one tool, got %+v", tools)
+	}
+	if err := reg.RegisterSpec(Spec{Name: "a.tool", Description: "A"}); err != nil {
+		t.Fatalf("register a: %v", err)
+	}
+	tools := reg.LLMTools()
+	if len(tools) != 2 || tools[0].Function.Name != "a.tool" || tools[1].Function.Name != "b.tool" {
+		t.Fatalf("unexpected tools after late registration: %+v", tools)
+	}
+}
+
 func TestParseToolMarkdownRejectsMissingSections(t *testing.T) {
 	if _, err := parseToolMarkdown("# missing.description\n\n## Parameters\n\n| Name | Type | Required | Description |\n| ---- | ---- | -------- | ----------- |"); err == nil {
 		t.Fatal("expected missing description error")